@@ -0,0 +1,251 @@
+"""
+Paint and interaction frame-time harness.
+
+Builds a dialog from the Flame widgets on the offscreen QPA platform and drives
+synthetic interaction sequences over it:
+
+    hover   mouse moves across the buttons, dropdowns and line edits (stylesheet hover states)
+    resize  the dialog is resized step by step (layout and full repaint)
+    scroll  a 10k row FlameTreeWidget and FlameListWidget are scrolled page by page
+    menu    FlamePushButtonMenu dropdowns are opened and closed
+    paint   FlamePushButtonMenu buttons are updated without any state change
+
+Every step is one frame: the event is delivered and the pending layout requests are
+run (layout), then the event loop paints the dirty regions (paint). Reports p50/p95/p99 of the
+layout, paint and whole frame times per scenario.
+
+With --frames-dir every step is rendered after its frame was timed and saved as PNG, named
+after the scenario and step (hover_0000.png, menu_open_0003.png, ...), plus the state the
+dialog is left in after each scenario (hover_final.png, ...). Menu open steps render the
+popup. With --reference-dir the frames are compared pixel by pixel against frames saved
+earlier, and the script exits with status 1 if any frame differs.
+
+    python benchmarks/bench_frames.py [--steps 200] [--output frames.json]
+                                      [--frames-dir frames] [--reference-dir reference]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6.QtTest import QTest
+
+
+def noop(*args):
+    pass
+
+
+def build_dialog():
+    import flamewidgets
+
+    dialog = QtWidgets.QWidget()
+    dialog.setObjectName("FrameHarness")
+    dialog.setStyleSheet("#FrameHarness {background-color: #2a2a2a}")
+    layout = QtWidgets.QGridLayout(dialog)
+
+    options = ["sh%04d_comp_v%03d_a_long_option_name" % (index, index) for index in range(50)]
+    widgets = {
+        "buttons": [flamewidgets.FlameButton("Button %d" % index, noop, button_color=("normal", "blue", "red")[index % 3]) for index in range(6)],
+        "push_buttons": [flamewidgets.FlamePushButton("Push %d" % index, index % 2 == 0, connect=noop) for index in range(4)],
+        "menus": [flamewidgets.FlamePushButtonMenu(options[index], options, text_align=("left", "center", "right")[index % 3]) for index in range(6)],
+        "line_edits": [flamewidgets.FlameLineEdit("text %d" % index, text_changed=noop) for index in range(4)],
+        "labels": [flamewidgets.FlameLabel("Label %d" % index, label_type="underline") for index in range(4)],
+    }
+    row = 0
+    for group in ("buttons", "push_buttons", "menus", "line_edits", "labels"):
+        for column, widget in enumerate(widgets[group]):
+            layout.addWidget(widget, row + column // 3, column % 3)
+        row += (len(widgets[group]) + 2) // 3
+
+    tree = flamewidgets.FlameTreeWidget(["Name", "Frames", "Path"], connect=noop)
+    tree.bulk_populate(("clip_%05d" % index, str(index % 240), "/show/seq/clip_%05d" % index) for index in range(10000))
+    list_widget = flamewidgets.FlameListWidget()
+    list_widget.addItems(["file.%07d.exr" % index for index in range(10000)])
+    layout.addWidget(tree, row, 0, 1, 2)
+    layout.addWidget(list_widget, row, 2)
+
+    widgets["tree"] = tree
+    widgets["list"] = list_widget
+    return dialog, widgets
+
+
+class FrameRecorder(object):
+
+    def __init__(self, app, dialog, frames_dir=None):
+        self.app = app
+        self.dialog = dialog
+        self.frames_dir = frames_dir
+        self.frames = {}
+        self.saved = []
+
+    def frame(self, scenario, event, target=None):
+        # One frame: deliver the event and run the pending layout requests, then
+        # let the event loop paint the dirty regions, as it would after a real event
+        start = time.perf_counter()
+        event()
+        self.app.sendPostedEvents(None, QtCore.QEvent.LayoutRequest)
+        laid_out = time.perf_counter()
+        self.app.processEvents()
+        painted = time.perf_counter()
+        frames = self.frames.setdefault(scenario, [])
+        frames.append(((laid_out - start) * 1000.0, (painted - laid_out) * 1000.0))
+
+        # Rendered after the frame was timed, saved right away so the images are not all kept in memory
+        self.save("%s_%04d" % (scenario.replace(" ", "_"), len(frames) - 1), target)
+
+    def save(self, name, target=None):
+        if self.frames_dir is None:
+            return
+        (target or self.dialog).grab().toImage().save(os.path.join(self.frames_dir, name + ".png"))
+        self.saved.append(name)
+
+
+def hover(recorder, dialog, widgets, steps):
+    targets = widgets["buttons"] + widgets["push_buttons"] + widgets["menus"] + widgets["line_edits"]
+    for step in range(steps):
+        widget = targets[step % len(targets)]
+        point = widget.mapTo(dialog, widget.rect().center())
+        recorder.frame("hover", lambda: QTest.mouseMove(dialog, point))
+
+
+def resize(recorder, dialog, widgets, steps):
+    width, height = dialog.width(), dialog.height()
+    for step in range(steps):
+        offset = (step % 40) * 10
+        recorder.frame("resize", lambda: dialog.resize(width + offset, height + offset // 2))
+    dialog.resize(width, height)
+    recorder.app.processEvents()
+
+
+def scroll(recorder, dialog, widgets, steps):
+    for name in ("tree", "list"):
+        view = widgets[name]
+        scroll_bar = view.verticalScrollBar()
+        for step in range(steps):
+            value = (step * scroll_bar.pageStep()) % max(1, scroll_bar.maximum())
+            recorder.frame("scroll " + name, lambda: scroll_bar.setValue(value))
+        scroll_bar.setValue(0)
+
+
+def menu(recorder, dialog, widgets, steps):
+    for step in range(max(1, steps // 4)):
+        button = widgets["menus"][step % len(widgets["menus"])]
+        popup = button.menu()
+        recorder.frame("menu open", lambda: popup.popup(button.mapToGlobal(QtCore.QPoint(0, button.height()))), popup)
+        recorder.frame("menu close", popup.close)
+
+
+def paint(recorder, dialog, widgets, steps):
+    for step in range(steps):
+        button = widgets["menus"][step % len(widgets["menus"])]
+        recorder.frame("paint menu button", button.update)
+
+
+SCENARIOS = (
+    ("hover", hover),
+    ("resize", resize),
+    ("scroll", scroll),
+    ("menu", menu),
+    ("paint", paint),
+)
+
+
+def percentiles(values):
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+def compare_frames(frames_dir, reference_dir, names):
+    failures = []
+    for name in names:
+        path = os.path.join(frames_dir, name + ".png")
+        reference_path = os.path.join(reference_dir, name + ".png")
+        if not os.path.exists(reference_path):
+            print("no reference for " + name)
+            continue
+        image = QtGui.QImage(path).convertToFormat(QtGui.QImage.Format_ARGB32)
+        reference = QtGui.QImage(reference_path).convertToFormat(QtGui.QImage.Format_ARGB32)
+        if image.size() != reference.size():
+            failures.append(f"{name}: size {image.width()}x{image.height()} != {reference.width()}x{reference.height()}")
+            continue
+        if image == reference:
+            continue
+        differing = sum(
+            1
+            for y in range(image.height())
+            for x in range(image.width())
+            if image.pixel(x, y) != reference.pixel(x, y)
+        )
+        failures.append(f"{name}: {differing} of {image.width() * image.height()} pixels differ")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--output", help="write the frame times as JSON")
+    parser.add_argument("--frames-dir", help="save every step and the final state of every scenario as PNG")
+    parser.add_argument("--reference-dir", help="compare the saved frames against these PNGs")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    # A blinking text cursor would make the saved frames depend on timing
+    app.setCursorFlashTime(0)
+
+    dialog, widgets = build_dialog()
+    dialog.resize(900, 700)
+    dialog.show()
+    app.processEvents()
+
+    if args.reference_dir and not args.frames_dir:
+        parser.error("--reference-dir needs --frames-dir")
+    if args.frames_dir:
+        os.makedirs(args.frames_dir, exist_ok=True)
+
+    recorder = FrameRecorder(app, dialog, args.frames_dir)
+    for name, scenario in SCENARIOS:
+        scenario(recorder, dialog, widgets, args.steps)
+        QTest.mouseMove(dialog, QtCore.QPoint(1, 1))
+        app.processEvents()
+        recorder.save(name + "_final")
+
+    print(f"{'scenario':<20}{'frames':>7}{'layout p50/p95/p99 (ms)':>28}{'paint p50/p95/p99 (ms)':>28}{'frame p50/p95/p99 (ms)':>28}")
+    report = {}
+    for scenario, frames in recorder.frames.items():
+        layout_times = [layout for layout, paint_time in frames]
+        paint_times = [paint_time for layout, paint_time in frames]
+        frame_times = [layout + paint_time for layout, paint_time in frames]
+        report[scenario] = {}
+        columns = []
+        for metric, values in (("layout", layout_times), ("paint", paint_times), ("frame", frame_times)):
+            p50, p95, p99 = percentiles(values)
+            report[scenario][metric] = {"p50": p50, "p95": p95, "p99": p99}
+            columns.append(f"{p50:8.2f}{p95:8.2f}{p99:8.2f}")
+        print(f"{scenario:<20}{len(frames):>7}" + "".join(f"{column:>28}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+    failures = []
+    if args.reference_dir:
+        failures = compare_frames(args.frames_dir, args.reference_dir, recorder.saved)
+
+    for failure in failures:
+        print("FRAME MISMATCH: " + failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Import-time regression check for flamewidgets.
+
+Runs `python -X importtime` in a fresh interpreter for each case and reports the
+cumulative import time of the flamewidgets package and the number of its submodules
+that were loaded. Each case is run several times and the fastest run is reported.
+
+    python benchmarks/bench_import_time.py [--runs 5] [--max-package-ms 20]
+
+Exits with status 1 if `import flamewidgets` takes longer than --max-package-ms, or
+loads any widget module or PySide6.
+"""
+
+import re
+import sys
+import argparse
+import subprocess
+
+
+CASES = (
+    ("import flamewidgets", "import flamewidgets"),
+    ("FlameButton", "from flamewidgets import FlameButton"),
+    ("FlameTreeWidget", "from flamewidgets import FlameTreeWidget"),
+    ("all widgets", "from flamewidgets import *"),
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(statement):
+    # Returns cumulative import time of the top level modules in ms, and the imported module names
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        modules.append(module)
+        # Top level entries (one space of indent) are what the statement itself imported
+        if len(indent) == 1 and (module.startswith("flamewidgets") or module.startswith("PySide6")):
+            total_us += int(cumulative_us)
+    return total_us / 1000.0, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-package-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'case':<18}{'import (ms)':>12}{'flamewidgets modules':>22}{'PySide6':>9}")
+    for name, statement in CASES:
+        runs = [measure(statement) for _ in range(args.runs)]
+        milliseconds = min(run[0] for run in runs)
+        modules = runs[0][1]
+        package_modules = [module for module in modules if module.startswith("flamewidgets.")]
+        pyside = any(module.startswith("PySide6") for module in modules)
+        print(f"{name:<18}{milliseconds:>12.1f}{len(package_modules):>22}{'yes' if pyside else 'no':>9}")
+
+        if statement == "import flamewidgets":
+            if milliseconds > args.max_package_ms:
+                failures.append(f"import flamewidgets took {milliseconds:.1f} ms, limit {args.max_package_ms} ms")
+            if package_modules:
+                failures.append("import flamewidgets loaded " + ", ".join(package_modules))
+            if pyside:
+                failures.append("import flamewidgets loaded PySide6")
+
+    for failure in failures:
+        print("FAIL: " + failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
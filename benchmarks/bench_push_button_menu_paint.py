@@ -0,0 +1,57 @@
+"""
+Paint-time microbenchmark for FlamePushButtonMenu.
+
+Repaints a grid of dropdowns on the offscreen QPA platform, once using the cached
+render model and once with the render model invalidated before every paint (the
+cost of rebuilding it on each repaint, as paintEvent used to).
+
+    python benchmarks/bench_push_button_menu_paint.py [--buttons 100] [--repaints 50]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtWidgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--buttons", type=int, default=100)
+    parser.add_argument("--repaints", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    from flamewidgets import FlamePushButtonMenu
+
+    options = ["sh%04d_comp_v%03d_a_very_long_option_name" % (index, index) for index in range(10)]
+
+    dialog = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout(dialog)
+    buttons = []
+    for index in range(args.buttons):
+        button = FlamePushButtonMenu(options[0], options, text_align="left")
+        layout.addWidget(button, index // 10, index % 10)
+        buttons.append(button)
+    dialog.show()
+    app.processEvents()
+
+    print(f"{'mode':<14}{'paints':>10}{'total (ms)':>12}{'per paint (us)':>16}")
+    for mode in ("uncached", "cached"):
+        start = time.perf_counter()
+        for _ in range(args.repaints):
+            for button in buttons:
+                if mode == "uncached":
+                    button._render_model_valid = False
+                button.repaint()
+        elapsed = time.perf_counter() - start
+        paints = args.repaints * len(buttons)
+        print(f"{mode:<14}{paints:>10}{elapsed * 1000:>12.1f}{elapsed / paints * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
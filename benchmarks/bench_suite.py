@@ -0,0 +1,293 @@
+"""
+Headless construction and memory benchmark suite for all public widgets.
+
+For every widget, builds N instances (N = 1, 100, 1000 by default) on the offscreen
+QPA platform and records construction time and memory per instance, both the Python
+allocations seen by tracemalloc and the process RSS. Scaling curves are recorded for
+FlamePushButtonMenu options, FlameTreeWidget rows and FlameListWidget items. Every
+measurement runs in its own process, so earlier runs do not skew RSS.
+
+Results are written as JSON and two result files can be compared:
+
+    python benchmarks/bench_suite.py run [--output results.json] [--counts 1 100 1000] [--quick]
+    python benchmarks/bench_suite.py compare baseline.json results.json [--threshold 0.2]
+
+compare exits with status 1 if any time or memory value grew by more than the threshold.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+WIDGETS = (
+    "FlameButton",
+    "FlameLabel",
+    "FlameLineEdit",
+    "FlameLineEditFileBrowse",
+    "FlameListWidget",
+    "FlameListView",
+    "FlamePushButton",
+    "FlamePushButtonMenu",
+    "FlameTextEdit",
+    "FlameLogView",
+    "FlameTokenPushButton",
+    "FlameTreeWidget",
+    "FlameTreeView",
+)
+
+SCALING = {
+    "FlamePushButtonMenu.options": (10, 100, 1000, 10000),
+    "FlameTreeWidget.rows": (1000, 10000, 100000),
+    "FlameListWidget.items": (1000, 10000, 100000),
+}
+
+QUICK_SCALING = {
+    "FlamePushButtonMenu.options": (10, 100, 1000),
+    "FlameTreeWidget.rows": (1000, 10000),
+    "FlameListWidget.items": (1000, 10000),
+}
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def noop(*args):
+    pass
+
+
+def widget_factory(name):
+    from PySide6 import QtWidgets
+    import flamewidgets
+
+    token_dest = QtWidgets.QLineEdit()
+    factories = {
+        "FlameButton": lambda: flamewidgets.FlameButton("Button", noop, button_color="blue"),
+        "FlameLabel": lambda: flamewidgets.FlameLabel("Label", label_type="underline"),
+        "FlameLineEdit": lambda: flamewidgets.FlameLineEdit("text", text_changed=noop),
+        "FlameLineEditFileBrowse": lambda: flamewidgets.FlameLineEditFileBrowse("/tmp", "Python (*.py)"),
+        "FlameListWidget": lambda: flamewidgets.FlameListWidget(),
+        "FlameListView": lambda: flamewidgets.FlameListView(),
+        "FlamePushButton": lambda: flamewidgets.FlamePushButton("Push", False, connect=noop),
+        "FlamePushButtonMenu": lambda: flamewidgets.FlamePushButtonMenu("option 1", ["option 1", "option 2", "option 3"]),
+        "FlameTextEdit": lambda: flamewidgets.FlameTextEdit("text", read_only=True),
+        "FlameLogView": lambda: flamewidgets.FlameLogView(),
+        "FlameTokenPushButton": lambda: flamewidgets.FlameTokenPushButton("Add Token", {"Shot": "<shot>", "Version": "<version>"}, token_dest),
+        "FlameTreeWidget": lambda: flamewidgets.FlameTreeWidget(["Name", "Frames", "Path"], connect=noop),
+        "FlameTreeView": lambda: flamewidgets.FlameTreeView(["Name", "Frames", "Path"], lambda key: ()),
+    }
+    factory = factories[name]
+    factory.keep_alive = token_dest
+    return factory
+
+
+def scaling_factory(name, size):
+    import flamewidgets
+
+    if name == "FlamePushButtonMenu.options":
+        options = ["sh%05d_comp_v001" % index for index in range(size)]
+        return lambda: flamewidgets.FlamePushButtonMenu(options[0], options)
+    if name == "FlameTreeWidget.rows":
+        rows = [("clip_%07d" % index, str(index % 240), "/show/seq/clip_%07d" % index) for index in range(size)]
+
+        def build_tree():
+            tree = flamewidgets.FlameTreeWidget(["Name", "Frames", "Path"], connect=noop)
+            tree.bulk_populate(rows)
+            return tree
+        return build_tree
+    if name == "FlameListWidget.items":
+        items = ["file.%07d.exr" % index for index in range(size)]
+
+        def build_list():
+            list_widget = flamewidgets.FlameListWidget()
+            list_widget.addItems(items)
+            return list_widget
+        return build_list
+    raise ValueError("unknown scaling case " + name)
+
+
+def measure(kind, name, count):
+    # Runs in a child process, prints one JSON result
+    from PySide6 import QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    if kind == "widget":
+        factory = widget_factory(name)
+        instances = count
+    else:
+        factory = scaling_factory(name, count)
+        instances = 1
+
+    # Warm up: theme, fonts, module imports and the first show are paid once per process, not per instance
+    warm_up = factory()
+    warm_up.show()
+    app.processEvents()
+    warm_up.close()
+    warm_up.deleteLater()
+    app.processEvents()
+
+    # Time and RSS first, tracemalloc slows down Python allocations
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+
+    widgets = [factory() for _ in range(instances)]
+    constructed = time.perf_counter()
+
+    # Show and lay out, so lazily created native state is included
+    container = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(container)
+    for widget in widgets:
+        layout.addWidget(widget)
+    container.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    rss = rss_bytes() - rss_before
+
+    # A second batch for the Python allocations
+    tracemalloc.start()
+    traced_before = tracemalloc.get_traced_memory()[0]
+    traced_widgets = [factory() for _ in range(instances)]
+    traced = tracemalloc.get_traced_memory()[0] - traced_before
+    tracemalloc.stop()
+    for widget in traced_widgets:
+        widget.deleteLater()
+
+    print(json.dumps({
+        "construct_ms": (constructed - start) * 1000.0,
+        "show_ms": (shown - constructed) * 1000.0,
+        "per_instance_us": (constructed - start) * 1e6 / instances,
+        "traced_bytes_per_instance": traced / instances,
+        "rss_bytes_per_instance": rss / instances,
+    }))
+
+
+def run_case(kind, name, count):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "_measure", kind, name, str(count)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "exit %d" % result.returncode}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(args):
+    import PySide6
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pyside6": PySide6.__version__,
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "widgets": {},
+        "scaling": {},
+    }
+
+    counts = args.counts or ([1, 100] if args.quick else [1, 100, 1000])
+    for name in WIDGETS:
+        results["widgets"][name] = {}
+        for count in counts:
+            result = run_case("widget", name, count)
+            results["widgets"][name][str(count)] = result
+            print(f"{name:<26}{'N=' + str(count):>8}  " + format_result(result))
+
+    for name, sizes in (QUICK_SCALING if args.quick else SCALING).items():
+        results["scaling"][name] = {}
+        for size in sizes:
+            result = run_case("scaling", name, size)
+            results["scaling"][name][str(size)] = result
+            print(f"{name:<26}{size:>8}  " + format_result(result))
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+    print("results written to " + args.output)
+
+
+def format_result(result):
+    if "error" in result:
+        return "error: " + result["error"]
+    return (
+        f"construct {result['construct_ms']:9.1f} ms  show {result['show_ms']:8.1f} ms  "
+        f"{result['per_instance_us']:9.1f} us/instance  "
+        f"{result['traced_bytes_per_instance'] / 1024:8.1f} KiB traced  {result['rss_bytes_per_instance'] / 1024:8.1f} KiB rss"
+    )
+
+
+COMPARED = ("construct_ms", "show_ms", "traced_bytes_per_instance", "rss_bytes_per_instance")
+
+
+def compare(args):
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(args.results) as results_file:
+        results = json.load(results_file)
+
+    regressions = []
+    print(f"{'case':<40}{'metric':<28}{'baseline':>14}{'result':>14}{'change':>9}")
+    for section in ("widgets", "scaling"):
+        for name, cases in results.get(section, {}).items():
+            for size, result in cases.items():
+                base = baseline.get(section, {}).get(name, {}).get(size)
+                if base is None or "error" in base or "error" in result:
+                    continue
+                for metric in COMPARED:
+                    before, after = base[metric], result[metric]
+                    # Ignore noise on values too small to matter
+                    floor = 1.0 if metric.endswith("_ms") else 4096.0
+                    if max(before, after) < floor:
+                        continue
+                    change = (after - before) / max(abs(before), floor)
+                    marker = ""
+                    if change > args.threshold:
+                        marker = "  REGRESSION"
+                        regressions.append((name, size, metric))
+                    print(f"{name + ' ' + size:<40}{metric:<28}{before:>14.1f}{after:>14.1f}{change:>+9.0%}{marker}")
+
+    print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+    sys.exit(1 if regressions else 0)
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "_measure":
+        measure(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="measure all widgets and write JSON results")
+    run_parser.add_argument("--output", default="results.json")
+    run_parser.add_argument("--counts", type=int, nargs="+")
+    run_parser.add_argument("--quick", action="store_true", help="smaller counts and scaling sizes")
+
+    compare_parser = commands.add_parser("compare", help="compare two JSON result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.2, help="relative growth reported as a regression")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
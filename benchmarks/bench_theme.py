@@ -0,0 +1,97 @@
+"""
+Dialog construction benchmark for the shared Flame theme.
+
+Builds a dialog with 200 Flame widgets and reports construction time and the number
+of polish events, once with the shared window stylesheet and once with a
+stylesheet set on every widget (the behaviour before the theme module existed).
+
+Each mode runs in its own process so Qt's stylesheet caches start cold.
+
+    python benchmarks/bench_theme.py [--widgets 200]
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def build_dialog(widget_count, per_widget):
+    from PySide6 import QtWidgets
+    import flamewidgets
+    from flamewidgets import theme
+
+    def noop():
+        pass
+
+    factories = [
+        lambda: flamewidgets.FlameButton("Button", noop, button_color="blue"),
+        lambda: flamewidgets.FlameLabel("Label", label_type="underline"),
+        lambda: flamewidgets.FlameLineEdit("Line edit", text_changed=noop),
+        lambda: flamewidgets.FlamePushButton("Push button", False, connect=noop),
+        lambda: flamewidgets.FlamePushButtonMenu("Option 1", ["Option 1", "Option 2"]),
+    ]
+
+    dialog = QtWidgets.QWidget()
+    layout = QtWidgets.QGridLayout(dialog)
+    for index in range(widget_count):
+        widget = factories[index % len(factories)]()
+        if per_widget:
+            widget.setStyleSheet(theme._WIDGET_STYLESHEETS[type(widget).__name__]())
+        layout.addWidget(widget, index // 5, index % 5)
+    return dialog
+
+
+def run(widget_count, per_widget):
+    from PySide6 import QtWidgets
+    from PySide6 import QtCore
+    from flamewidgets import theme
+
+    app = QtWidgets.QApplication(sys.argv)
+    if per_widget:
+        theme.set_auto_apply(False)
+
+    class PolishCounter(QtCore.QObject):
+        count = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Polish:
+                PolishCounter.count += 1
+            return False
+
+    counter = PolishCounter()
+    app.installEventFilter(counter)
+
+    start = time.perf_counter()
+    dialog = build_dialog(widget_count, per_widget)
+    dialog.show()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    print(f"{elapsed * 1000:.1f} {PolishCounter.count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--widgets", type=int, default=200)
+    parser.add_argument("--mode", choices=["shared", "per-widget"])
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.widgets, args.mode == "per-widget")
+        return
+
+    print(f"{'mode':<12}{'widgets':>10}{'time (ms)':>12}{'polish events':>16}")
+    for mode in ("per-widget", "shared"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--widgets", str(args.widgets), "--mode", mode],
+            check=True, capture_output=True, text=True,
+        ).stdout.split()
+        print(f"{mode:<12}{args.widgets:>10}{float(output[0]):>12.1f}{int(output[1]):>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Memory and time comparison of FlameTreeWidget and FlameTreeView.
+
+For each row count, builds the tree with top level rows of three columns, shows it
+and processes events until the first paint. FlameTreeView is measured twice: as shown
+(only the first batch is fetched) and after fetching every row. Each measurement runs
+in its own process so RSS deltas are not polluted by earlier runs.
+
+    python benchmarks/bench_tree.py [--rows 10000 100000 1000000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run(kind, row_count):
+    from PySide6 import QtWidgets
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    import flamewidgets
+
+    def noop():
+        pass
+
+    headers = ["Name", "Frames", "Path"]
+    rows = (("clip_%07d" % index, str(index % 240), "/show/seq/clip_%07d" % index) for index in range(row_count))
+
+    app.processEvents()
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+
+    if kind == "widget":
+        tree = flamewidgets.FlameTreeWidget(headers, connect=noop)
+        tree.addTopLevelItems([QtWidgets.QTreeWidgetItem(list(row)) for row in rows])
+    else:
+        tree = flamewidgets.FlameTreeView(headers, lambda key: ((row[0], row, False) for row in rows))
+        if kind == "view-full":
+            model = tree.model()
+            while model.canFetchMore(model.index(-1, -1)):
+                model.fetchMore(model.index(-1, -1))
+
+    tree.resize(800, 600)
+    tree.show()
+    app.processEvents()
+
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed * 1000:.1f} {(rss_bytes() - rss_before) / 1024 / 1024:.1f} {tree.model().rowCount()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--kind", choices=["widget", "view", "view-full"])
+    args = parser.parse_args()
+
+    if args.kind:
+        run(args.kind, args.rows[0])
+        return
+
+    print(f"{'kind':<12}{'rows':>10}{'loaded':>10}{'time (ms)':>12}{'rss (MB)':>10}")
+    for row_count in args.rows:
+        for kind in ("widget", "view", "view-full"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--kind", kind, "--rows", str(row_count)],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            print(f"{kind:<12}{row_count:>10}{int(output[2]):>10}{float(output[0]):>12.1f}{float(output[1]):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@ import sys
 from PySide6 import QtCore
 from PySide6 import QtWidgets
 from PySide6 import QtGui
-from importlib.resources import files
 from flamewidgets import *
 
 
@@ -56,7 +55,6 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     # create and show the gui
     app = QtWidgets.QApplication(sys.argv)
-    font = str(files("flamewidgets.resources").joinpath("Artifakt Element Regular.ttf"))
     window = DemoApp()
     window.show()
     sys.exit(app.exec())
@@ -1,13 +1,66 @@
-__all__ = ["FlamePushButton", "FlameLabel", "FlameLineEdit", "FlameLineEditFileBrowse", "FlameListWidget", "FlamePushButtonMenu",
-           "FlameButton", "FlameTextEdit", "FlameTokenPushButton", "FlameTreeWidget"]
-
-from .flame_push_button import *
-from .flame_label import *
-from .flame_line_edit import *
-from .flame_line_edit_file_browse import *
-from .flame_list_widget import *
-from .flame_push_button_menu import *
-from .flame_button import *
-from .flame_text_edit import *
-from .flame_token_push_button import *
-from .flame_tree_widget import *
+# Same as typing.TYPE_CHECKING, without importing typing on startup
+TYPE_CHECKING = False
+
+__all__ = ["FlamePushButton", "FlameLabel", "FlameLineEdit", "FlameLineEditFileBrowse", "FlameListWidget", "FlameListView",
+           "FlameListModel", "FlamePushButtonMenu",
+           "FlameButton", "FlameTextEdit", "FlameLogView", "FlameTokenPushButton", "FlameTreeWidget", "FlameTreeWidgetItem", "FlameTreeView",
+           "FlameTreeModel", "FlameItemFilter", "FlameLoader", "TokenTemplate", "compile_template"]
+
+# Public name -> module it is defined in. Modules are imported on first access,
+# so importing the package does not import PySide6 or any widget module.
+_LAZY_NAMES = {
+    "FlamePushButton": "flame_push_button",
+    "FlameLabel": "flame_label",
+    "FlameLineEdit": "flame_line_edit",
+    "FlameLineEditFileBrowse": "flame_line_edit_file_browse",
+    "FlameListWidget": "flame_list_widget",
+    "FlameListView": "flame_list_view",
+    "FlameListModel": "flame_list_view",
+    "FlamePushButtonMenu": "flame_push_button_menu",
+    "FlameButton": "flame_button",
+    "FlameTextEdit": "flame_text_edit",
+    "FlameLogView": "flame_log_view",
+    "FlameTokenPushButton": "flame_token_push_button",
+    "FlameTreeWidget": "flame_tree_widget",
+    "FlameTreeWidgetItem": "flame_tree_widget",
+    "FlameTreeView": "flame_tree_view",
+    "FlameTreeModel": "flame_tree_view",
+    "FlameItemFilter": "flame_item_filter",
+    "FlameLoader": "flame_loader",
+    "TokenTemplate": "token_template",
+    "compile_template": "token_template",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    module = __import__(__name__ + "." + module_name, fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .flame_push_button import FlamePushButton
+    from .flame_label import FlameLabel
+    from .flame_line_edit import FlameLineEdit
+    from .flame_line_edit_file_browse import FlameLineEditFileBrowse
+    from .flame_list_widget import FlameListWidget
+    from .flame_list_view import FlameListView, FlameListModel
+    from .flame_push_button_menu import FlamePushButtonMenu
+    from .flame_button import FlameButton
+    from .flame_text_edit import FlameTextEdit
+    from .flame_log_view import FlameLogView
+    from .flame_token_push_button import FlameTokenPushButton
+    from .flame_tree_widget import FlameTreeWidget, FlameTreeWidgetItem
+    from .flame_tree_view import FlameTreeView, FlameTreeModel
+    from .flame_item_filter import FlameItemFilter
+    from .flame_loader import FlameLoader
+    from .token_template import TokenTemplate, compile_template
@@ -0,0 +1,264 @@
+"""
+Flame Callback Pool
+
+Shared, bounded pools that run button callbacks off the GUI thread, so a callback
+that exports or publishes does not freeze the UI. All widgets share one thread pool
+and one process pool. Both are created on first use and shut down when the
+application quits: queued callbacks are dropped, running ones are waited for.
+
+    set_max_workers(threads=2)
+    button = FlameButton('Export', export_shots, run_in='thread')
+    button.connect_result.connect(show_report)
+
+The process pool starts its workers with the spawn method, a fresh interpreter that
+does not inherit the host application's state. Callbacks run in it must be picklable
+and importable by that interpreter, i.e. functions defined at module level in an
+importable module, not lambdas, closures or functions of the __main__ script of an
+embedded interpreter. Their arguments, results and exceptions must be picklable too.
+"""
+
+import sys
+import time
+import inspect
+from functools import partial
+from typing import Union, List, Dict, Optional, Callable, Any, Tuple
+from PySide6 import QtCore
+from .theme import set_state
+from . import instrumentation
+
+
+RUN_IN = ("thread", "process")
+
+_max_threads = 4
+_max_processes = 2
+_thread_pool: Optional[QtCore.QThreadPool] = None
+_process_pool = None
+_shutdown_connected = False
+
+
+def set_max_workers(threads: Optional[int] = None, processes: Optional[int] = None) -> None:
+    """
+    Set the size of the shared pools.
+
+    threads: (optional) callbacks run at the same time in the thread pool. default is 4 [int]
+    processes: (optional) worker processes of the process pool, used when it is created. default is 2 [int]
+    """
+
+    global _max_threads, _max_processes
+
+    if threads is not None:
+        if not isinstance(threads, int) or threads < 1:
+            raise TypeError("flamewidgets.callback_pool: threads must be a positive integer.")
+        _max_threads = threads
+        if _thread_pool is not None:
+            _thread_pool.setMaxThreadCount(threads)
+    if processes is not None:
+        if not isinstance(processes, int) or processes < 1:
+            raise TypeError("flamewidgets.callback_pool: processes must be a positive integer.")
+        _max_processes = processes
+
+
+def thread_pool() -> QtCore.QThreadPool:
+    global _thread_pool
+
+    if _thread_pool is None:
+        # Own pool, long callbacks must not starve the global pool used for directory scans and loaders
+        _thread_pool = QtCore.QThreadPool()
+        _thread_pool.setMaxThreadCount(_max_threads)
+        _connect_shutdown()
+    return _thread_pool
+
+
+def process_pool():
+    global _process_pool
+
+    if _process_pool is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Never fork, that would copy the whole host application including Qt's running threads
+        _process_pool = ProcessPoolExecutor(max_workers=_max_processes, mp_context=multiprocessing.get_context("spawn"))
+        _connect_shutdown()
+    return _process_pool
+
+
+def _drop_broken_process_pool():
+    # A worker died, the pool refuses all further work. The next call creates a new one.
+    # A late failure of an old pool must not drop the one that replaced it
+    global _process_pool
+
+    if _process_pool is not None and getattr(_process_pool, "_broken", True):
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _connect_shutdown():
+    global _shutdown_connected
+
+    app = QtCore.QCoreApplication.instance()
+    if app is not None and not _shutdown_connected:
+        app.aboutToQuit.connect(shutdown)
+        _shutdown_connected = True
+
+
+def shutdown(timeout_ms: Optional[int] = 30000) -> None:
+    """
+    Drop queued callbacks and wait for the running ones. Called when the application quits.
+
+    timeout_ms: (optional) longest wait for running callbacks of both pools together. Worker
+                processes still running after it are terminated. default is 30000 [int]
+    """
+
+    global _thread_pool, _process_pool
+
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    if _thread_pool is not None:
+        _thread_pool.clear()
+        _thread_pool.waitForDone(timeout_ms)
+        _thread_pool = None
+    if _process_pool is not None:
+        # shutdown(wait=True) has no timeout, join the workers with what is left of it instead
+        processes = list((getattr(_process_pool, "_processes", None) or {}).values())
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+
+
+def max_args(callback: Callable) -> Optional[int]:
+    """
+    Return how many positional arguments callback accepts, None if it takes any number.
+
+    Qt drops the signal arguments a directly connected slot does not take, callbacks
+    called from Python get their arguments cut to this count to behave the same.
+    """
+
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    count = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return None
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            count += 1
+    return count
+
+
+class _RunnerSignals(QtCore.QObject):
+    # Lives in the GUI thread, emitted from the pool so delivery is queued
+
+    done = QtCore.Signal(object, object)
+
+
+class _CallbackTask(QtCore.QRunnable):
+
+    def __init__(self, callback, args, signals):
+        super(_CallbackTask, self).__init__()
+
+        self.callback = callback
+        self.args = args
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.signals.done.emit(self.callback(*self.args), None)
+        except Exception as exception:
+            self.signals.done.emit(None, exception)
+
+
+def _future_done(signals, future):
+    # Called in the process pool's management thread
+    if future.cancelled():
+        return
+    exception = future.exception()
+    signals.done.emit(None if exception else future.result(), exception)
+
+
+class CallbackRunner(QtCore.QObject):
+    """
+    Runs the callback of a button in a shared pool, one call at a time.
+
+    CallbackRunner(button, callback, run_in, name)
+
+    button: widget with connect_result and connect_failed signals [QAbstractButton]
+    callback: function to run [function]
+    run_in: 'thread' or 'process' [str]
+    name: name used for instrumentation, e.g. 'FlameButton.connect' [str]
+
+    Arguments passed to run() that the callback does not take are dropped, as Qt does
+    for directly connected slots. While the callback runs the button is disabled and its
+    busy property is set, calls made meanwhile are dropped. The result is emitted through connect_result, an exception
+    through connect_failed, or sys.excepthook if nothing is connected to connect_failed.
+    """
+
+    def __init__(self, button: QtCore.QObject, callback: Callable, run_in: str, name: str):
+        super(CallbackRunner, self).__init__(button)
+
+        if run_in not in RUN_IN:
+            raise ValueError("CallbackRunner: run_in must be 'thread' or 'process'.")
+
+        self._button = button
+        self._callback = callback
+        self._max_args = max_args(callback)
+        self._run_in = run_in
+        self._name = name
+        self._start = None
+        self._was_enabled = True
+
+        # Not parented, a running call keeps it alive if the button is deleted first
+        self._signals = _RunnerSignals()
+        # Queued even when emitted from the GUI thread, add_done_callback of a finished future calls back right away
+        self._signals.done.connect(self._done, QtCore.Qt.QueuedConnection)
+
+    def is_running(self) -> bool:
+        return self._start is not None
+
+    def run(self, *args) -> bool:
+        if self._start is not None:
+            return False
+        if self._max_args is not None:
+            args = args[:self._max_args]
+
+        self._start = time.perf_counter()
+        self._was_enabled = self._button.isEnabled()
+        self._button.setEnabled(False)
+        set_state(self._button, "busy", True)
+
+        try:
+            if self._run_in == "thread":
+                thread_pool().start(_CallbackTask(self._callback, args, self._signals))
+            else:
+                future = process_pool().submit(self._callback, *args)
+                future.add_done_callback(partial(_future_done, self._signals))
+        except Exception as exception:
+            # e.g. BrokenProcessPool after a worker crashed, reported like an exception of the callback
+            self._done(None, exception)
+            return False
+        return True
+
+    def _done(self, result, exception):
+        start, self._start = self._start, None
+        if self._run_in == "process" and exception is not None:
+            from concurrent.futures.process import BrokenProcessPool
+
+            if isinstance(exception, BrokenProcessPool):
+                _drop_broken_process_pool()
+        if instrumentation.is_enabled():
+            instrumentation.record(self._name, "callback", start, time.perf_counter())
+
+        button = self._button
+        set_state(button, "busy", False)
+        button.setEnabled(self._was_enabled)
+
+        if exception is None:
+            button.connect_result.emit(result)
+        elif button.receivers(QtCore.SIGNAL("connect_failed(PyObject)")):
+            button.connect_failed.emit(exception)
+        else:
+            # Nobody handles it, report it like an exception in a directly connected callback
+            sys.excepthook(type(exception), exception, exception.__traceback__)
@@ -0,0 +1,253 @@
+"""
+Flame Directory Cache
+
+Background directory listings for path completion and validation. Directories
+are read with os.scandir on a small thread pool, so a slow network mount never
+blocks the event loop. Listings are kept in a process-wide LRU cache and read
+again once they are older than the TTL.
+
+Frame sequences are collapsed once per listing:
+
+    shot.1001.exr ... shot.1100.exr  ->  shot.####.exr (1001-1100)
+
+    listing = scanner().cached('/mnt/shows/abc')    # None if not read yet or expired
+    scanner().listing_ready.connect(do_something)   # (path, DirectoryListing)
+    scanner().request('/mnt/shows/abc')
+"""
+
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Union, List, Dict, Optional, Callable, Tuple
+from PySide6 import QtCore
+
+
+# name.1001.exr, name_1001.exr, name.001.mp4. The frame number needs a separator and at least
+# three digits, so versions like comp_v001.nk or take2.mov stay single files
+_FRAME = re.compile(r"^(.*[._])(\d{3,})(\.[^.]+)?$")
+# %04d
+_PRINTF_FRAME = re.compile(r"%0?(\d)d")
+
+
+def collapse_sequences(names: List[str]) -> Tuple[List[str], Dict[str, Tuple[int, int, int]]]:
+    """
+    Split file names into single files and frame sequences.
+
+    Returns the single names and a dict of sequence name (frame number as #, one per digit)
+    to (first frame, last frame, frame count). A frame number has at least three digits, a
+    '.' or '_' before it and is followed by the extension, if there is one. Names that are no
+    frame, or the only frame of their sequence, are single names.
+    """
+
+    groups: Dict[Tuple[str, int, str], List[Tuple[int, str]]] = {}
+    singles = []
+    for name in names:
+        match = _FRAME.match(name)
+        if match is None:
+            singles.append(name)
+            continue
+        prefix, frame, extension = match.groups()
+        groups.setdefault((prefix, len(frame), extension or ""), []).append((int(frame), name))
+
+    sequences = {}
+    for (prefix, padding, extension), frames in groups.items():
+        if len(frames) < 2:
+            singles.append(frames[0][1])
+            continue
+        numbers = [frame for frame, name in frames]
+        sequences[prefix + "#" * padding + extension] = (min(numbers), max(numbers), len(numbers))
+    return singles, sequences
+
+
+class DirectoryListing(object):
+    """
+    Contents of one directory, as read by the scanner.
+
+    path: the directory [str]
+    exists: False if the directory could not be read [bool]
+    directories: names of sub directories [set]
+    files: names of files [set]
+    sequences: collapsed sequence name to (first frame, last frame, frame count) [dict]
+    completions: sorted names for completion, sub directories end with a / and sequences are collapsed [list]
+    """
+
+    __slots__ = ("path", "exists", "directories", "files", "sequences", "completions", "read_time")
+
+    def __init__(self, path: str, exists: bool, directories=(), files=()):
+        self.path = path
+        self.exists = exists
+        self.directories = set(directories)
+        self.files = set(files)
+        singles, self.sequences = collapse_sequences(sorted(self.files))
+        self.completions = sorted(
+            [name + "/" for name in self.directories] + singles + list(self.sequences),
+            key=str.lower,
+        )
+        self.read_time = time.monotonic()
+
+    def contains(self, name: str) -> bool:
+        """
+        True if name is a file, directory or collapsed sequence of this directory.
+        Sequences match as name.####.ext, or printf style as name.%04d.ext.
+        """
+
+        return name in self.files or name in self.directories or self.is_sequence(name)
+
+    def is_sequence(self, name: str) -> bool:
+        return _PRINTF_FRAME.sub(lambda match: "#" * int(match.group(1)), name) in self.sequences
+
+
+def _read_directory(path: str) -> DirectoryListing:
+    directories = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (directories if is_dir else files).append(entry.name)
+    except OSError:
+        return DirectoryListing(path, False)
+    return DirectoryListing(path, True, directories, files)
+
+
+class _ScanSignals(QtCore.QObject):
+    # Lives in the GUI thread, emitted from the pool so delivery is queued
+
+    done = QtCore.Signal(str, object)
+
+
+class _ScanTask(QtCore.QRunnable):
+
+    def __init__(self, path, signals):
+        super(_ScanTask, self).__init__()
+
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        self.signals.done.emit(self.path, _read_directory(self.path))
+
+
+class DirectoryScanner(QtCore.QObject):
+    """
+    Reads directories in the background and caches the listings.
+
+    DirectoryScanner([max_listings=256, ttl=30.0, max_concurrent_scans=4])
+
+    max_listings: (optional) listings kept in the cache, least recently used are dropped. default is 256 [int]
+    ttl: (optional) seconds a listing is used before the directory is read again. default is 30.0 [float]
+    max_concurrent_scans: (optional) directories read at the same time. default is 4 [int]
+
+    Use scanner() for the shared instance.
+    """
+
+    listing_ready = QtCore.Signal(str, object)
+
+    def __init__(self, max_listings: Optional[int] = 256, ttl: Optional[float] = 30.0, max_concurrent_scans: Optional[int] = 4):
+        super(DirectoryScanner, self).__init__()
+
+        # Check argument types
+
+        if not isinstance(max_listings, int) or max_listings < 1:
+            raise TypeError("DirectoryScanner: max_listings must be a positive integer.")
+        if not isinstance(ttl, (int, float)):
+            raise TypeError("DirectoryScanner: ttl must be a number.")
+        if not isinstance(max_concurrent_scans, int) or max_concurrent_scans < 1:
+            raise TypeError("DirectoryScanner: max_concurrent_scans must be a positive integer.")
+
+        self.max_listings = max_listings
+        self.ttl = ttl
+        self._listings: "OrderedDict[str, DirectoryListing]" = OrderedDict()
+        self._in_flight = set()
+
+        self._thread_pool = QtCore.QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(max_concurrent_scans)
+
+        self._signals = _ScanSignals(self)
+        self._signals.done.connect(self._scan_done)
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normpath(os.path.expanduser(path)) if path else ""
+
+    def cached(self, path: str) -> Optional[DirectoryListing]:
+        """
+        Return the cached listing of path, or None if it was not read yet or is older than the TTL.
+        """
+
+        path = self._normalize(path)
+        listing = self._listings.get(path)
+        if listing is None:
+            return None
+        if time.monotonic() - listing.read_time > self.ttl:
+            del self._listings[path]
+            return None
+        self._listings.move_to_end(path)
+        return listing
+
+    def request(self, path: str) -> Optional[DirectoryListing]:
+        """
+        Return the cached listing of path. If there is none, the directory is read in the
+        background, listing_ready is emitted when done, and None is returned.
+        """
+
+        path = self._normalize(path)
+        if not path:
+            return None
+        listing = self.cached(path)
+        if listing is not None:
+            return listing
+        if path not in self._in_flight:
+            self._in_flight.add(path)
+            self._thread_pool.start(_ScanTask(path, self._signals))
+        return None
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop the cached listing of path, or all listings.
+        """
+
+        if path is None:
+            self._listings.clear()
+        else:
+            self._listings.pop(self._normalize(path), None)
+
+    def wait(self, timeout_ms: Optional[int] = 30000) -> bool:
+        """
+        Wait for running scans and deliver their listings. Meant for scripts and headless use.
+        """
+
+        done = self._thread_pool.waitForDone(timeout_ms)
+        QtCore.QCoreApplication.sendPostedEvents(self)
+        QtCore.QCoreApplication.sendPostedEvents(self._signals)
+        return done
+
+    def _scan_done(self, path, listing):
+        self._in_flight.discard(path)
+        self._listings[path] = listing
+        self._listings.move_to_end(path)
+        while len(self._listings) > self.max_listings:
+            self._listings.popitem(last=False)
+        self.listing_ready.emit(path, listing)
+
+
+_scanner: Optional[DirectoryScanner] = None
+
+
+def scanner() -> DirectoryScanner:
+    """
+    Return the shared DirectoryScanner. Must be called from the GUI thread.
+    """
+
+    global _scanner
+
+    if _scanner is None:
+        _scanner = DirectoryScanner()
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            _scanner.setParent(app)
+    return _scanner
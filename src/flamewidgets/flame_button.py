@@ -1,25 +1,40 @@
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme, set_state
+from . import instrumentation
+from .callback_pool import CallbackRunner, RUN_IN
 
 
 class FlameButton(QtWidgets.QPushButton):
     """
     Custom Qt Flame Button Widget
 
-    FlameButton(button_name, connect[, button_color='normal', button_width=150, button_max_width=150])
+    FlameButton(button_name, connect[, button_color='normal', button_width=150, button_max_width=150, run_in=None])
 
     button_name: button text [str]
     connect: execute when clicked [function]
     button_color: (optional) normal, blue, red [str]
     button_width: (optional) default is 150 [int]
     button_max_width: (optional) default is 150 [int]
+    run_in: (optional) run connect in the shared 'thread' or 'process' pool instead of the GUI thread. default is None [str]
+
+    With run_in the button is disabled while connect runs and clicks meanwhile are ignored.
+    The return value is emitted through connect_result, an exception through connect_failed.
+    See flamewidgets.callback_pool.
 
     Example:
 
         button = FlameButton('Button Name', do_something_magical_when_pressed, button_color='blue')
+        button.set_button_color('red')
+
+        export_button = FlameButton('Export', export_shots, run_in='thread')
+        export_button.connect_result.connect(show_report)
     """
 
+    connect_result = QtCore.Signal(object)
+    connect_failed = QtCore.Signal(object)
+
     def __init__(
         self,
         button_name: str,
@@ -28,9 +43,11 @@ class FlameButton(QtWidgets.QPushButton):
         button_width: Optional[int] = 150,
         button_max_width: Optional[int] = 150,
         tooltip: Optional[str] = None,
+        run_in: Optional[str] = None,
     ) -> None:
 
         super(FlameButton, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
 
@@ -44,6 +61,8 @@ class FlameButton(QtWidgets.QPushButton):
             raise TypeError("FlameButton: button_width must be an integer")
         elif not isinstance(button_max_width, int):
             raise TypeError("FlameButton: button_max_width must be an integer")
+        elif run_in is not None and run_in not in RUN_IN:
+            raise ValueError("FlameButton: run_in must be 'thread' or 'process'")
 
         # Build button
 
@@ -51,31 +70,25 @@ class FlameButton(QtWidgets.QPushButton):
         self.setMinimumSize(QtCore.QSize(button_width, 28))
         self.setMaximumSize(QtCore.QSize(button_max_width, 28))
         self.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.clicked.connect(connect)
+        if run_in:
+            self._runner = CallbackRunner(self, connect, run_in, "FlameButton.connect")
+            self.clicked.connect(self._run_connect)
+        else:
+            instrumentation.connect(self.clicked, connect, "FlameButton.connect")
 
         self.setToolTip(tooltip)
-        if button_color == "normal":
-            self.setStyleSheet(
-                'QPushButton {color: rgb(154, 154, 154); background-color: rgb(58, 58, 58); border: none; font: 14px "Artifakt Element"}'
-                "QPushButton:hover {border: 1px solid rgb(90, 90, 90)}"
-                "QPushButton:pressed {color: rgb(159, 159, 159); background-color: rgb(66, 66, 66); border: 1px solid rgb(90, 90, 90)}"
-                "QPushButton:disabled {color: rgb(116, 116, 116); background-color: rgb(58, 58, 58); border: none}"
-                "QPushButton::menu-indicator {subcontrol-origin: padding; subcontrol-position: center right}"
-                "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}"
-            )
-        elif button_color == "blue":
-            self.setStyleSheet(
-                'QPushButton {color: rgb(190, 190, 190); background-color: rgb(58, 108, 173); border: none; font: 14px "Artifakt Element"}'
-                "QPushButton:hover {border: 2px solid rgb(90, 90, 90)}"
-                "QPushButton:pressed {color: rgb(159, 159, 159); border: 1px solid rgb(90, 90, 90)"
-                "QPushButton:disabled {color: rgb(116, 116, 116); background-color: rgb(58, 58, 58); border: none}"
-                "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}"
-            )
-        elif button_color == "red":
-            self.setStyleSheet(
-                'QPushButton {color: rgb(190, 190, 190); background-color: rgb(200, 29, 29); border: none; font: 14px "Artifakt Element"}'
-                "QPushButton:hover {border: 1px solid rgb(90, 90, 90)}"
-                "QPushButton:pressed {color: rgb(159, 159, 159); border: 1px solid rgb(90, 90, 90)"
-                "QPushButton:disabled {color: rgb(116, 116, 116); background-color: rgb(58, 58, 58); border: none}"
-                "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}"
+        self.setProperty("button_color", button_color)
+
+    def _run_connect(self, checked):
+        self._runner.run(checked)
+
+    def set_button_color(self, button_color: str) -> None:
+        """
+        Change the button color to normal, blue or red.
+        """
+
+        if button_color not in ["normal", "blue", "red"]:
+            raise ValueError(
+                "FlameButton: button_color must be one of: normal(grey), blue, or red"
             )
+        set_state(self, "button_color", button_color)
@@ -0,0 +1,350 @@
+from typing import Union, List, Dict, Optional, Callable, Set, Iterable
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+
+
+class TrigramIndex(object):
+    """
+    Case insensitive substring index over keyed strings.
+
+    Every string is split into its three character substrings once, when it is added.
+    A query of three or more characters only checks the keys that contain all of its
+    trigrams, shorter queries check every key.
+
+        index = TrigramIndex()
+        index.add(1, 'sh010_comp_v003')
+        index.search('comp')  # {1}
+    """
+
+    def __init__(self):
+        self.texts: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.texts
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        return {text[index:index + 3] for index in range(len(text) - 2)}
+
+    def add(self, key: int, text: str) -> None:
+        text = text.lower()
+        if key in self.texts:
+            if self.texts[key] == text:
+                return
+            self.remove(key)
+        self.texts[key] = text
+        postings = self._postings
+        for trigram in self._trigrams(text):
+            keys = postings.get(trigram)
+            if keys is None:
+                postings[trigram] = {key}
+            else:
+                keys.add(key)
+
+    def remove(self, key: int) -> None:
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        postings = self._postings
+        for trigram in self._trigrams(text):
+            keys = postings.get(trigram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del postings[trigram]
+
+    def search(self, query: str, candidates: Optional[Iterable[int]] = None) -> Set[int]:
+        """
+        Return the keys whose text contains query.
+
+        candidates: (optional) only these keys are checked, e.g. the matches of a shorter query
+        """
+
+        query = query.lower()
+        if candidates is None:
+            if len(query) >= 3:
+                postings = sorted((self._postings.get(trigram, set()) for trigram in self._trigrams(query)), key=len)
+                candidates = postings[0].intersection(*postings[1:]) if postings else set()
+                if len(query) == 3:
+                    return set(candidates)
+            else:
+                candidates = self.texts.keys()
+        texts = self.texts
+        return {key for key in candidates if query in texts[key]}
+
+
+class FlameItemFilter(QtCore.QObject):
+    """
+    Indexed type-to-filter for FlameListWidget and FlameTreeWidget
+
+    FlameItemFilter(widget[, column=0])
+
+    widget: list or tree widget to filter [QListWidget or QTreeWidget]
+    column: (optional) tree column matched against the query. default is 0 [int]
+
+    The item text is indexed once and kept up to date as items are added, removed or
+    renamed. A query that extends the previous one only narrows the previous matches,
+    and only rows whose visibility changes are shown or hidden. In trees the parents
+    of matching items stay visible.
+
+    Example:
+
+        tree_filter = FlameItemFilter(tree)
+        filter_edit = FlameLineEdit('', text_changed=tree_filter.set_query)
+    """
+
+    def __init__(self, widget: Union[QtWidgets.QListWidget, QtWidgets.QTreeWidget], column: Optional[int] = 0):
+        super(FlameItemFilter, self).__init__(widget)
+
+        # Check argument types
+
+        if not isinstance(widget, (QtWidgets.QListWidget, QtWidgets.QTreeWidget)):
+            raise TypeError("FlameItemFilter: widget must be a QListWidget or QTreeWidget.")
+        if not isinstance(column, int):
+            raise TypeError("FlameItemFilter: column must be integer.")
+
+        self._widget = widget
+        self._model = widget.model()
+        self._column = column if isinstance(widget, QtWidgets.QTreeWidget) else 0
+        self._is_tree = isinstance(widget, QtWidgets.QTreeWidget)
+
+        # Rows are keyed by their internal id (the item pointer), which is stable across sorting.
+        # Items are kept instead of persistent indexes, Qt updates every persistent index on
+        # each row insert or removal
+        self.index = TrigramIndex()
+        self._items: Dict[int, Union[QtWidgets.QListWidgetItem, QtWidgets.QTreeWidgetItem]] = {}
+        self._parents: Dict[int, Optional[int]] = {}
+        self._children: Dict[int, Set[int]] = {}
+        self._hidden: Set[int] = set()
+        self._query = ""
+        self._matches: Optional[Set[int]] = None
+        # Rows visible after the last _apply, None if all are
+        self._visible: Optional[Set[int]] = None
+
+        # Rows removed and inserted again in the same event loop pass (e.g. when sorting)
+        # keep their index entries
+        self._detached: Dict[int, str] = {}
+
+        self._add_rows(QtCore.QModelIndex(), 0, self._model.rowCount() - 1)
+
+        self._model.rowsInserted.connect(self._rows_inserted)
+        self._model.rowsAboutToBeRemoved.connect(self._rows_about_to_be_removed)
+        self._model.dataChanged.connect(self._data_changed)
+        self._model.modelReset.connect(self._model_reset)
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def match_count(self) -> int:
+        """
+        Number of items matching the current query, all items if there is none.
+        """
+
+        return len(self.index) if self._matches is None else len(self._matches)
+
+    def set_query(self, text: str) -> None:
+        """
+        Filter the widget to items containing text, case insensitive. An empty text shows all items.
+        """
+
+        query = text.lower()
+        if query == self._query:
+            return
+
+        if not query:
+            matches = None
+        elif self._query and self._matches is not None and self._query in query:
+            matches = self.index.search(query, self._matches)
+        else:
+            matches = self.index.search(query)
+
+        self._query = query
+        self._matches = matches
+        self._apply()
+
+    def clear(self) -> None:
+        self.set_query("")
+
+    def _key(self, index: QtCore.QModelIndex) -> int:
+        return index.internalId()
+
+    def _item(self, parent_key: Optional[int], row: int):
+        if not self._is_tree:
+            return self._widget.item(row)
+        if parent_key is None:
+            return self._widget.topLevelItem(row)
+        return self._items[parent_key].child(row)
+
+    def _add_rows(self, parent: QtCore.QModelIndex, first: int, last: int) -> List[int]:
+        model = self._model
+        column = self._column
+        parent_key = self._key(parent) if parent.isValid() else None
+        added = []
+        for row in range(first, last + 1):
+            index = model.index(row, column, parent)
+            key = self._key(index)
+            text = str(model.data(index) or "")
+
+            detached = self._detached.pop(key, None)
+            if detached is None or detached != text.lower():
+                self.index.add(key, text)
+            self._items[key] = self._item(parent_key, row)
+            self._parents[key] = parent_key
+            if parent_key is not None:
+                self._children.setdefault(parent_key, set()).add(key)
+            added.append(key)
+
+            if self._is_tree and model.rowCount(index):
+                added.extend(self._add_rows(index.siblingAtColumn(0), 0, model.rowCount(index) - 1))
+        return added
+
+    def _subtree_keys(self, parent: QtCore.QModelIndex, first: int, last: int) -> List[int]:
+        model = self._model
+        keys = []
+        for row in range(first, last + 1):
+            index = model.index(row, 0, parent)
+            keys.append(self._key(index))
+            if self._is_tree and model.rowCount(index):
+                keys.extend(self._subtree_keys(index, 0, model.rowCount(index) - 1))
+        return keys
+
+    def _rows_inserted(self, parent, first, last):
+        added = self._add_rows(parent, first, last)
+
+        if self._matches is not None:
+            query = self._query
+            texts = self.index.texts
+            self._matches.update(key for key in added if query in texts[key])
+            self._apply(added)
+
+    def _rows_about_to_be_removed(self, parent, first, last):
+        keys = self._subtree_keys(parent, first, last)
+        if not self._detached:
+            QtCore.QTimer.singleShot(0, self._flush_detached)
+        for key in keys:
+            text = self.index.texts.get(key)
+            if text is not None:
+                self._detached[key] = text
+            self._items.pop(key, None)
+            parent = self._parents.pop(key, None)
+            if parent is not None and parent in self._children:
+                self._children[parent].discard(key)
+            self._children.pop(key, None)
+            self._hidden.discard(key)
+            if self._matches is not None:
+                self._matches.discard(key)
+            if self._visible is not None:
+                self._visible.discard(key)
+
+    def _flush_detached(self):
+        # Rows that were not inserted again are gone for good
+        for key in self._detached:
+            if key not in self._items:
+                self.index.remove(key)
+        self._detached = {}
+
+    def _data_changed(self, top_left, bottom_right, roles=()):
+        if roles and QtCore.Qt.DisplayRole not in roles and QtCore.Qt.EditRole not in roles:
+            return
+        if not top_left.column() <= self._column <= bottom_right.column():
+            return
+
+        model = self._model
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            index = model.index(row, self._column, parent)
+            key = self._key(index)
+            self.index.add(key, str(model.data(index) or ""))
+            if self._matches is not None:
+                if self._query in self.index.texts[key]:
+                    self._matches.add(key)
+                else:
+                    self._matches.discard(key)
+        if self._matches is not None:
+            self._apply()
+
+    def _model_reset(self):
+        self.index = TrigramIndex()
+        self._items = {}
+        self._parents = {}
+        self._children = {}
+        self._hidden = set()
+        self._visible = None
+        self._detached = {}
+        self._add_rows(QtCore.QModelIndex(), 0, self._model.rowCount() - 1)
+        if self._matches is not None:
+            self._matches = self.index.search(self._query)
+            self._apply()
+
+    def _visible_keys(self) -> Set[int]:
+        if not self._is_tree:
+            return self._matches
+
+        # Keep the parents of matches visible
+        visible = set(self._matches)
+        parents = self._parents
+        for key in self._matches:
+            parent = parents.get(key)
+            while parent is not None and parent not in visible:
+                visible.add(parent)
+                parent = parents.get(parent)
+        return visible
+
+    def _apply(self, added: Iterable[int] = ()):
+        # Only rows whose visibility changed since the last call, their children and rows
+        # added meanwhile are looked at, not every indexed row
+        old = self._visible
+        new = None if self._matches is None else set(self._visible_keys())
+        self._visible = new
+
+        if new is None:
+            changes = {key: False for key in self._hidden}
+        else:
+            if old is None:
+                candidates = self._items.keys() - new
+            else:
+                candidates = (old - new) | (new - old)
+            candidates.update(added)
+            if self._is_tree:
+                children = self._children
+                for key in list(candidates):
+                    candidates.update(children.get(key, ()))
+
+            # Rows below a hidden parent are hidden with it, only the topmost rows are hidden explicitly.
+            # Rows below a hidden parent keep their flag, it is checked when the parent is shown again
+            items = self._items
+            parents = self._parents
+            hidden = self._hidden
+            changes = {}
+            for key in candidates:
+                if key not in items:
+                    continue
+                parent = parents[key]
+                if parent is not None and parent not in new:
+                    continue
+                hide = key not in new
+                if hide != (key in hidden):
+                    changes[key] = hide
+
+        if not changes:
+            return
+
+        widget = self._widget
+        updates = widget.updatesEnabled()
+        widget.setUpdatesEnabled(False)
+        try:
+            for key, hide in changes.items():
+                item = self._items.get(key)
+                if item is not None:
+                    item.setHidden(hide)
+                if hide:
+                    self._hidden.add(key)
+                else:
+                    self._hidden.discard(key)
+        finally:
+            widget.setUpdatesEnabled(updates)
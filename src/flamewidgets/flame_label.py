@@ -1,6 +1,7 @@
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme, set_state
 
 
 class FlameLabel(QtWidgets.QLabel):
@@ -27,6 +28,7 @@ class FlameLabel(QtWidgets.QLabel):
         align: Optional[str] = "",
     ):
         super(FlameLabel, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
 
@@ -49,7 +51,9 @@ class FlameLabel(QtWidgets.QLabel):
         self.setFixedHeight(28)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
 
-        # Set label stylesheet based on label_type
+        # Set label style and alignment based on label_type
+
+        self.setProperty("label_type", label_type)
 
         if align == "left":
             self.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
@@ -66,23 +70,13 @@ class FlameLabel(QtWidgets.QLabel):
         elif align == "" and label_type == "border":
             self.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignCenter)
 
-        if label_type == "normal":
-            self.setStyleSheet(
-                'QLabel {color: rgb(154, 154, 154); font: 14px "Artifakt Element"}'
-                "QLabel:disabled {color: rgb(106, 106, 106)}"
-            )
-        elif label_type == "underline":
-            self.setStyleSheet(
-                'QLabel {color: rgb(154, 154, 154); border-bottom: 1px inset rgb(40, 40, 40); font: 14px "Artifakt Element"}'
-                "QLabel:disabled {color: rgb(106, 106, 106)}"
-            )
-        elif label_type == "background":
-            self.setStyleSheet(
-                'QLabel {color: rgb(154, 154, 154); background-color: rgb(30, 30, 30); padding-left: 5px; font: 14px "Artifakt Element"}'
-                "QLabel:disabled {color: rgb(106, 106, 106)}"
-            )
-        if label_type == "border":
-            self.setStyleSheet(
-                'QLabel {color: rgb(154, 154, 154); border: 1px solid #404040; font: 14px "Artifakt Element"}'
-                "QLabel:disabled {color: rgb(106, 106, 106)}"
+    def set_label_type(self, label_type: str) -> None:
+        """
+        Change the label style to normal, underline, background or border. The alignment is kept.
+        """
+
+        if label_type not in ["normal", "underline", "background", "border"]:
+            raise ValueError(
+                "FlameLabel: label_type must be one of: normal, underline, background"
             )
+        set_state(self, "label_type", label_type)
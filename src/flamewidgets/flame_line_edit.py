@@ -1,24 +1,152 @@
-from typing import Union, List, Dict, Optional, Callable
+import sys
+import time
+from typing import Union, List, Dict, Optional, Callable, Any
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme
+from . import instrumentation
+from .callback_pool import max_args
+
+
+class _CallbackSignals(QtCore.QObject):
+    # Lives in the GUI thread, emitted from the pool so delivery is queued
+
+    done = QtCore.Signal(int, object)
+
+
+class _CallbackTask(QtCore.QRunnable):
+
+    def __init__(self, generation, callback, args, signals):
+        super(_CallbackTask, self).__init__()
+
+        self.generation = generation
+        self.callback = callback
+        self.args = args
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.callback(*self.args)
+        except Exception:
+            sys.excepthook(*sys.exc_info())
+            result = None
+        self.signals.done.emit(self.generation, result)
+
+
+class _CoalescedCallback(QtCore.QObject):
+    # Delivers the latest submitted text to a callback, at most once per debounce/throttle window,
+    # optionally on a pool thread. Results of stale calls are dropped.
+
+    finished = QtCore.Signal(object)
+
+    def __init__(self, parent, callback, pass_text, debounce_ms, throttle_ms, run_in_thread, dedupe):
+        super(_CoalescedCallback, self).__init__(parent)
+
+        self._callback = callback
+        self._pass_text = pass_text and max_args(callback) != 0
+        self._debounce_ms = debounce_ms
+        self._throttle_ms = throttle_ms
+        self._run_in_thread = run_in_thread
+        self._dedupe = dedupe
+
+        self._text = None
+        self._pending = False
+        self._pending_since = 0.0
+        self._last_text = None
+        self._last_delivery = 0.0
+        self._generation = 0
+        self._running = 0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._deliver)
+
+        if run_in_thread:
+            # Not parented, a running task keeps it alive if the line edit is deleted first
+            self._signals = _CallbackSignals()
+            self._signals.done.connect(self._task_done)
+
+    def submit(self, text):
+        if self._dedupe and text == self._last_text and (self._running or self._in_window()):
+            return
+
+        now = time.monotonic()
+        if not self._pending:
+            self._pending_since = now
+        self._text = text
+        self._pending = True
+
+        if self._debounce_ms:
+            # Restarted by every edit, throttle_ms caps how long delivery can be pushed back
+            if self._throttle_ms and (now - self._pending_since) * 1000.0 >= self._throttle_ms:
+                self._deliver()
+            else:
+                self._timer.start(self._debounce_ms)
+        elif self._throttle_ms:
+            elapsed = (now - self._last_delivery) * 1000.0
+            if elapsed >= self._throttle_ms:
+                self._deliver()
+            elif not self._timer.isActive():
+                self._timer.start(int(self._throttle_ms - elapsed))
+        else:
+            self._deliver()
+
+    def _in_window(self):
+        window = max(self._debounce_ms, self._throttle_ms)
+        return (time.monotonic() - self._last_delivery) * 1000.0 < window
+
+    def _deliver(self):
+        self._timer.stop()
+        if not self._pending:
+            return
+        self._pending = False
+        self._last_text = self._text
+        self._last_delivery = time.monotonic()
+
+        args = (self._text,) if self._pass_text else ()
+        self._generation += 1
+        if self._run_in_thread:
+            self._running += 1
+            QtCore.QThreadPool.globalInstance().start(_CallbackTask(self._generation, self._callback, args, self._signals))
+        else:
+            self.finished.emit(self._callback(*args))
+
+    def _task_done(self, generation, result):
+        self._running -= 1
+        if generation == self._generation:
+            self.finished.emit(result)
 
 
 class FlameLineEdit(QtWidgets.QLineEdit):
     """
     Custom Qt Flame Line Edit Widget
 
-    FlameLineEdit(text[, width=150, max_width=2000, text_changed=some_function])
+    FlameLineEdit(text[, width=150, max_width=2000, text_changed=some_function, debounce_ms=0, throttle_ms=0, run_in_thread=False])
 
     text: [str] text shown in line edit
     width: [int] (optional) width of widget. default is 150.
     max_width: [int] (optional) maximum width of widget. default is 2000.
     text_changed: [function] (optional) function to call when text is changed.
     return_pressed: [function] (optional) function to call when return is pressed.
+    debounce_ms: [int] (optional) call the functions once typing paused this long, with the latest text. default is 0.
+    throttle_ms: [int] (optional) call the functions at most once per this many milliseconds. default is 0.
+    run_in_thread: [bool] (optional) call the functions on a pool thread. default is False.
+
+    With run_in_thread the functions must not touch widgets. Their return values arrive on the GUI
+    thread through text_changed_result and return_pressed_result, results of calls that were
+    overtaken by a newer one are dropped. Return presses with unchanged text are ignored while the
+    previous call runs or within the debounce/throttle window.
 
     Example:
         line_edit = FlameLineEdit('Some text here')
+
+        search = FlameLineEdit('', text_changed=query_shots, debounce_ms=250, run_in_thread=True)
+        search.text_changed_result.connect(show_shots)
     """
 
+    text_changed_result = QtCore.Signal(object)
+    return_pressed_result = QtCore.Signal(object)
+
     def __init__(
         self,
         text: str,
@@ -27,8 +155,12 @@ class FlameLineEdit(QtWidgets.QLineEdit):
         text_changed: Optional[Callable] = None,
         placeholder_text: Optional[str] = None,
         return_pressed: Optional[Callable] = None,
+        debounce_ms: Optional[int] = 0,
+        throttle_ms: Optional[int] = 0,
+        run_in_thread: Optional[bool] = False,
     ):
         super(FlameLineEdit, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
         if not isinstance(text, str) and not isinstance(text, int):
@@ -37,6 +169,12 @@ class FlameLineEdit(QtWidgets.QLineEdit):
             raise TypeError("FlameLineEdit: width must be integer.")
         if not isinstance(max_width, int):
             raise TypeError("FlameLineEdit: max_width must be integer.")
+        if not isinstance(debounce_ms, int) or debounce_ms < 0:
+            raise TypeError("FlameLineEdit: debounce_ms must be a positive integer.")
+        if not isinstance(throttle_ms, int) or throttle_ms < 0:
+            raise TypeError("FlameLineEdit: throttle_ms must be a positive integer.")
+        if not isinstance(run_in_thread, bool):
+            raise TypeError("FlameLineEdit: run_in_thread must be a bool.")
 
         text = str(text)
 
@@ -46,15 +184,22 @@ class FlameLineEdit(QtWidgets.QLineEdit):
         self.setMinimumWidth(width)
         self.setMaximumWidth(max_width)
         # self.setFocusPolicy(QtCore.Qt.ClickFocus)
-        self.textChanged.connect(text_changed)
         self.setPlaceholderText(placeholder_text)
-        self.setStyleSheet(
-            'QLineEdit {color: rgb(154, 154, 154); background-color: rgb(55, 65, 75); selection-color: rgb(38, 38, 38); selection-background-color: rgb(184, 177, 167); border: 1px solid rgb(55, 65, 75); padding-left: 5px; font: 14px "Artifakt Element"}'
-            "QLineEdit:focus {background-color: rgb(73, 86, 99)}"
-            "QLineEdit:hover {border: 1px solid rgb(90, 90, 90)}"
-            "QLineEdit:disabled {color: rgb(106, 106, 106); background-color: rgb(55, 55, 55); border: 1px solid rgb(55, 55, 55)}"
-            "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: none}"
-        )
+
+        coalesce = debounce_ms or throttle_ms or run_in_thread
+
+        if text_changed:
+            if coalesce:
+                self._text_changed = _CoalescedCallback(self, instrumentation.wrap(text_changed, "FlameLineEdit.text_changed"), True, debounce_ms, throttle_ms, run_in_thread, False)
+                self._text_changed.finished.connect(self.text_changed_result)
+                self.textChanged.connect(self._text_changed.submit)
+            else:
+                instrumentation.connect(self.textChanged, text_changed, "FlameLineEdit.text_changed")
 
         if return_pressed:
-            self.returnPressed.connect(return_pressed)
+            if coalesce:
+                self._return_pressed = _CoalescedCallback(self, instrumentation.wrap(return_pressed, "FlameLineEdit.return_pressed"), False, debounce_ms, throttle_ms, run_in_thread, True)
+                self._return_pressed.finished.connect(self.return_pressed_result)
+                self.returnPressed.connect(lambda: self._return_pressed.submit(self.text()))
+            else:
+                instrumentation.connect(self.returnPressed, return_pressed, "FlameLineEdit.return_pressed")
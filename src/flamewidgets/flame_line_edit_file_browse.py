@@ -1,7 +1,52 @@
 import os
+import weakref
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme, set_state
+from .directory_cache import scanner
+
+
+# One file dialog, and with it one QFileSystemModel, shared by all FlameLineEditFileBrowse widgets.
+# The widget that opened it last receives the result.
+_file_dialog: Optional[QtWidgets.QFileDialog] = None
+_file_dialog_owner = None
+
+
+def _shared_file_dialog() -> QtWidgets.QFileDialog:
+    global _file_dialog
+
+    if _file_dialog is None:
+        # The Qt dialog keeps its QFileSystemModel and directory cache between uses, a native one does not
+        _file_dialog = QtWidgets.QFileDialog()
+        _file_dialog.setOption(QtWidgets.QFileDialog.DontUseNativeDialog, True)
+        _file_dialog.accepted.connect(_file_dialog_accepted)
+        _file_dialog.finished.connect(_file_dialog_finished)
+        QtCore.QCoreApplication.instance().aboutToQuit.connect(_delete_file_dialog)
+    return _file_dialog
+
+
+def _file_dialog_accepted():
+    owner = _file_dialog_owner() if _file_dialog_owner is not None else None
+    if owner is not None:
+        owner._browse_accepted(_file_dialog.selectedFiles())
+
+
+def _file_dialog_finished():
+    # The window modal dialog can swallow the release of the click that opened it
+    owner = _file_dialog_owner() if _file_dialog_owner is not None else None
+    if owner is not None:
+        set_state(owner, "pressed", False)
+
+
+def _delete_file_dialog():
+    global _file_dialog, _file_dialog_owner
+
+    if _file_dialog is not None:
+        _file_dialog.deleteLater()
+    _file_dialog = None
+    _file_dialog_owner = None
+
 
 class FlameLineEditFileBrowse(QtWidgets.QLineEdit):
     """
@@ -13,53 +58,241 @@ class FlameLineEditFileBrowse(QtWidgets.QLineEdit):
 
     file_path: Path browser will open to. If set to root folder (/), browser will open to user home directory
     filter_type: Type of file browser will filter_type for. If set to 'dir', browser will select directory
+    multiple: (optional) select several existing files. default is False [bool]
+    editable: (optional) paths can be typed or pasted, the browser opens on double click. default is False [bool]
+
+    The file browser opens without blocking and is shared by all FlameLineEditFileBrowse widgets,
+    so the directory listing is only read once. The starting directory is read in the background
+    when the mouse enters the widget. The selection is reported by files_selected:
+
+    lineedit.files_selected.connect(do_something)
+
+    Typed paths are completed and checked against directory listings read in the background,
+    see directory_cache. Frame sequences complete as shot.####.exr. The result of the check is
+    set as the path_state property ("exists", "sequence", "missing", or "" while reading) and
+    reported by path_validated.
     """
 
     clicked = QtCore.Signal()
+    files_selected = QtCore.Signal(list)
+    path_validated = QtCore.Signal(str)
 
-    def __init__(self, file_path, filter_type,  *args, **kwargs):
+    def __init__(
+        self,
+        file_path,
+        filter_type,
+        *args,
+        multiple: Optional[bool] = False,
+        editable: Optional[bool] = False,
+        **kwargs
+    ):
         super(FlameLineEditFileBrowse, self).__init__(*args, **kwargs)
+        ensure_theme(self)
+
+        # Check argument types
+
+        if not isinstance(multiple, bool):
+            raise TypeError("FlameLineEditFileBrowse: multiple must be a bool.")
+        if not isinstance(editable, bool):
+            raise TypeError("FlameLineEditFileBrowse: editable must be a bool.")
 
         self.filter_type = filter_type
         self.file_path = file_path
+        self.multiple = multiple
+        self.editable = editable
+        self.selected_files: List[str] = []
+        self.path_state = ""
+        self._start_directory_for = None
+        self._prefetch_directory = None
 
         self.setText(file_path)
         self.setMinimumHeight(28)
-        self.setReadOnly(True)
-        self.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.setReadOnly(not editable)
+        self.setFocusPolicy(QtCore.Qt.StrongFocus if editable else QtCore.Qt.NoFocus)
         self.clicked.connect(self.file_browse)
-        self.setStyleSheet('QLineEdit {color: #898989; background-color: #373e47; font: 14px "Artifakt Element"}'
-                           'QLineEdit:disabled {color: #6a6a6a; background-color: #373737}')
+
+        if editable:
+            self._completion_source = None
+            self._completion_model = QtCore.QStringListModel(self)
+            completer = QtWidgets.QCompleter(self._completion_model, self)
+            completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+            self.setCompleter(completer)
+
+            scanner().listing_ready.connect(self._listing_ready)
+            self.textChanged.connect(self._check_path)
+            self.editingFinished.connect(self._editing_finished)
+            self._check_path(self.text())
 
     def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.LeftButton:
-            self.setStyleSheet('QLineEdit {color: #bbbbbb; background-color: #474e58; font: 14px "Artifakt Element"}'
-                               'QLineEdit:disabled {color: #6a6a6a; background-color: #373737}')
+        if not self.editable and event.button() == QtCore.Qt.LeftButton:
+            set_state(self, "pressed", True)
             self.clicked.emit()
-            self.setStyleSheet('QLineEdit {color: #898989; background-color: #373e47; font: 14px "Artifakt Element"}'
-                               'QLineEdit:disabled {color: #6a6a6a; background-color: #373737}')
+            # Stays pressed while its browser is open, cleared when the browser finishes
+            if not self._browsing():
+                set_state(self, "pressed", False)
         else:
-            super(FlameLineEditFileBrowse).mousePressEvent(event)
+            super(FlameLineEditFileBrowse, self).mousePressEvent(event)
 
-    def file_browse(self):
-        file_browser = QtWidgets.QFileDialog()
+    def mouseReleaseEvent(self, event):
+        if not self._browsing():
+            set_state(self, "pressed", False)
+        super(FlameLineEditFileBrowse, self).mouseReleaseEvent(event)
+
+    def _browsing(self):
+        owner = _file_dialog_owner() if _file_dialog_owner is not None else None
+        return owner is self and _file_dialog is not None and _file_dialog.isVisible()
+
+    def mouseDoubleClickEvent(self, event):
+        if self.editable and event.button() == QtCore.Qt.LeftButton:
+            self.clicked.emit()
+        else:
+            super(FlameLineEditFileBrowse, self).mouseDoubleClickEvent(event)
+
+    def enterEvent(self, event):
+        self.prefetch()
+        super(FlameLineEditFileBrowse, self).enterEvent(event)
+
+    def _start_directory(self, blocking: Optional[bool] = True) -> Optional[str]:
+        # Resolved once per file_path. Whether file_path is a file is taken from the scanner's
+        # listing of its directory, only a click (blocking) checks the file system itself.
+
+        if self.file_path == self._start_directory_for:
+            return self.file_path
 
         # If no path go to user home directory
         if self.file_path == '/':
-            self.file_path = os.path.expanduser("~")
-        if os.path.isfile(self.file_path):
-            self.file_path = self.file_path.rsplit('/', 1)[0]
+            path = os.path.expanduser("~")
+        else:
+            path = self.file_path
+            directory, name = os.path.split(path)
+            listing = scanner().cached(directory) if directory and name else None
+            if not name:
+                is_file = False
+            elif listing is not None:
+                is_file = listing.contains(name) and name not in listing.directories
+            elif blocking:
+                is_file = os.path.isfile(path)
+            else:
+                if directory:
+                    self._request_prefetch_listing(directory)
+                return None
+            if is_file:
+                path = directory
+
+        self.file_path = path
+        self._start_directory_for = path
+        return path
+
+    def _request_prefetch_listing(self, directory):
+        if self._prefetch_directory is None:
+            scanner().listing_ready.connect(self._prefetch_listing_ready)
+        self._prefetch_directory = os.path.normpath(os.path.expanduser(directory))
+        scanner().request(directory)
+
+    def _prefetch_listing_ready(self, path, listing):
+        if path == self._prefetch_directory and self.underMouse():
+            self.prefetch()
 
-        file_browser.setDirectory(self.file_path)
+    def prefetch(self) -> None:
+        """
+        Start reading the starting directory in the background, unless the browser is open.
+        Never blocks on the file system.
+        """
+
+        file_browser = _shared_file_dialog()
+        if not file_browser.isVisible():
+            start_directory = self._start_directory(blocking=False)
+            if start_directory is not None:
+                file_browser.setDirectory(start_directory)
+
+    def file_browse(self):
+        global _file_dialog_owner
+
+        file_browser = _shared_file_dialog()
+        previous_owner = _file_dialog_owner() if _file_dialog_owner is not None else None
+        if previous_owner is not None and previous_owner is not self:
+            set_state(previous_owner, "pressed", False)
+        _file_dialog_owner = weakref.ref(self)
+
+        file_browser.setDirectory(self._start_directory())
 
         # If filter_type set to dir, open Directory Browser, if anything else, open File Browser
 
         if self.filter_type == 'dir':
             file_browser.setFileMode(QtWidgets.QFileDialog.Directory)
-            if file_browser.exec_():
-                self.setText(file_browser.selectedFiles()[0])
+            file_browser.setOption(QtWidgets.QFileDialog.ShowDirsOnly, True)
         else:
-            file_browser.setFileMode(QtWidgets.QFileDialog.ExistingFile) # Change to ExistingFiles to capture many files
+            if self.multiple:
+                file_browser.setFileMode(QtWidgets.QFileDialog.ExistingFiles)
+            else:
+                file_browser.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            file_browser.setOption(QtWidgets.QFileDialog.ShowDirsOnly, False)
             file_browser.setNameFilter(self.filter_type)
-            if file_browser.exec_():
-                self.setText(file_browser.selectedFiles()[0])
+
+        if file_browser.isVisible():
+            file_browser.raise_()
+            file_browser.activateWindow()
+        else:
+            file_browser.open()
+
+    def _browse_accepted(self, files):
+        if not files:
+            return
+        self.selected_files = list(files)
+        self.setText(', '.join(self.selected_files))
+        self.files_selected.emit(self.selected_files)
+
+    def _split_path(self, text):
+        if not text:
+            return "", ""
+        directory, name = os.path.split(os.path.expanduser(text))
+        return os.path.normpath(directory or "."), name
+
+    def _check_path(self, text):
+        # Never touches the file system, listings are read by the scanner
+        directory, name = self._split_path(text)
+        listing = scanner().request(directory) if directory else None
+        if listing is None:
+            self._set_path_state("")
+        else:
+            self._apply_listing(listing)
+
+    def _listing_ready(self, path, listing):
+        if path == self._split_path(self.text())[0]:
+            self._apply_listing(listing)
+
+    def _apply_listing(self, listing):
+        text = self.text()
+        directory, name = self._split_path(text)
+
+        # Completions keep the directory as typed, e.g. ~/shots/, set once per listing
+        typed_directory = text[:text.rfind('/') + 1]
+        if self._completion_source != (typed_directory, listing):
+            self._completion_source = (typed_directory, listing)
+            self._completion_model.setStringList([typed_directory + completion for completion in listing.completions])
+            if self.hasFocus() and name:
+                self.completer().setCompletionPrefix(self.text())
+                self.completer().complete()
+
+        if not listing.exists:
+            state = "missing"
+        elif not name:
+            state = "exists"
+        elif self.filter_type == 'dir':
+            state = "exists" if name in listing.directories else "missing"
+        elif listing.is_sequence(name):
+            state = "sequence"
+        else:
+            state = "exists" if listing.contains(name) else "missing"
+        self._set_path_state(state)
+
+    def _set_path_state(self, state):
+        if state == self.path_state:
+            return
+        self.path_state = state
+        set_state(self, "path_state", state)
+        self.path_validated.emit(state)
+
+    def _editing_finished(self):
+        if self.path_state in ("exists", "sequence"):
+            self.file_path = self.text()
@@ -0,0 +1,205 @@
+from typing import Union, List, Dict, Optional, Callable, Iterable, Iterator
+from itertools import islice
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+from .theme import ensure_theme
+
+
+class FlameListModel(QtCore.QAbstractListModel):
+    """
+    List model over a plain Python list of strings.
+
+    FlameListModel([entries=None])
+
+    entries: (optional) initial entries [list]
+
+    Entries are stored once in a list, no item object is created per row.
+    """
+
+    def __init__(self, entries: Optional[List[str]] = None, parent: Optional[QtCore.QObject] = None):
+        super(FlameListModel, self).__init__(parent)
+
+        self._entries: List[str] = list(entries) if entries else []
+
+    @property
+    def entries(self) -> List[str]:
+        """
+        The entries of the model. Do not modify the returned list directly.
+        """
+
+        return self._entries
+
+    def set_entries(self, entries: Iterable[str]) -> None:
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def append_entries(self, entries: Iterable[str]) -> None:
+        entries = list(entries)
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.set_entries([])
+
+    def entry(self, row: int) -> str:
+        return self._entries[row]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            return self._entries[index.row()]
+        return None
+
+
+class FlameListView(QtWidgets.QListView):
+    """
+    Custom Qt Flame List View for very large lists
+
+    FlameListView([min_width=200, max_width=2000, min_height=250, max_height=2000, batch_size=1000])
+
+    min_width: (optional) default is 200 [int]
+    max_width: (optional) default is 2000 [int]
+    min_height: (optional) default is 250 [int]
+    max_height: (optional) default is 2000 [int]
+    batch_size: (optional) rows laid out per batch. default is 1000 [int]
+
+    Styled like FlameListWidget, but backed by a FlameListModel holding plain strings.
+    Layout is done in batches so the view stays responsive while rows are added.
+
+    Entries can be set at once, or streamed from an iterator or generator in chunks,
+    one chunk per event loop pass, so a long listing never blocks the event loop:
+
+        list_view = FlameListView()
+        list_view.set_entries(['file.0001.exr', 'file.0002.exr'])
+
+        list_view.stream_entries(os.listdir(path), chunk_size=5000)
+        list_view.loading_finished.connect(do_something)
+    """
+
+    loading_finished = QtCore.Signal()
+
+    def __init__(
+        self,
+        min_width: Optional[int] = 200,
+        max_width: Optional[int] = 2000,
+        min_height: Optional[int] = 250,
+        max_height: Optional[int] = 2000,
+        batch_size: Optional[int] = 1000,
+    ):
+        super(FlameListView, self).__init__()
+        ensure_theme(self)
+
+        # Check argument types
+
+        if not isinstance(min_width, int):
+            raise TypeError("FlameListView: min_width must be integer.")
+        if not isinstance(max_width, int):
+            raise TypeError("FlameListView: max_width must be integer.")
+        if not isinstance(min_height, int):
+            raise TypeError("FlameListView: min_height must be integer.")
+        if not isinstance(max_height, int):
+            raise TypeError("FlameListView: max_height must be integer.")
+        if not isinstance(batch_size, int):
+            raise TypeError("FlameListView: batch_size must be integer.")
+
+        # Build list view
+
+        self.setMinimumWidth(min_width)
+        self.setMaximumWidth(max_width)
+        self.setMinimumHeight(min_height)
+        self.setMaximumHeight(max_height)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtWidgets.QListView.Batched)
+        self.setBatchSize(batch_size)
+        self.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.setAlternatingRowColors(True)
+
+        self.list_model = FlameListModel(parent=self)
+        self.setModel(self.list_model)
+
+        # Streaming state
+        self._stream: Optional[Iterator[str]] = None
+        self._stream_chunk_size = 5000
+        self._stream_timer = QtCore.QTimer(self)
+        self._stream_timer.setInterval(0)
+        self._stream_timer.timeout.connect(self._stream_next_chunk)
+
+    def set_entries(self, entries: Iterable[str]) -> None:
+        """
+        Replace all entries at once. Cancels a running stream.
+        """
+
+        self.cancel_stream()
+        self.list_model.set_entries(entries)
+
+    def clear(self) -> None:
+        """
+        Remove all entries. Cancels a running stream.
+        """
+
+        self.cancel_stream()
+        self.list_model.clear()
+
+    def append_entries(self, entries: Iterable[str]) -> None:
+        """
+        Append entries in a single insert.
+        """
+
+        self.list_model.append_entries(entries)
+
+    def stream_entries(self, entries: Iterable[str], chunk_size: Optional[int] = 5000, replace: Optional[bool] = True) -> None:
+        """
+        Add entries from an iterable in chunks, one chunk per event loop pass.
+        loading_finished is emitted once the iterable is exhausted.
+
+        entries: iterable, iterator or generator of strings
+        chunk_size: (optional) entries added per pass. default is 5000 [int]
+        replace: (optional) clear the current entries first. default is True [bool]
+        """
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise TypeError("FlameListView: chunk_size must be a positive integer.")
+
+        self.cancel_stream()
+        if replace:
+            self.list_model.clear()
+
+        self._stream = iter(entries)
+        self._stream_chunk_size = chunk_size
+        self._stream_timer.start()
+
+    def cancel_stream(self) -> None:
+        """
+        Stop a running stream. Entries added so far are kept.
+        """
+
+        self._stream_timer.stop()
+        self._stream = None
+
+    def is_streaming(self) -> bool:
+        return self._stream is not None
+
+    def entries(self) -> List[str]:
+        return self.list_model.entries
+
+    def selected_entries(self) -> List[str]:
+        return [self.list_model.entry(index.row()) for index in self.selectionModel().selectedRows()]
+
+    def _stream_next_chunk(self):
+        if self._stream is None:
+            return
+
+        chunk = list(islice(self._stream, self._stream_chunk_size))
+        if chunk:
+            self.list_model.append_entries(chunk)
+        if len(chunk) < self._stream_chunk_size:
+            self.cancel_stream()
+            self.loading_finished.emit()
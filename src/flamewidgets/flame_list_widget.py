@@ -1,6 +1,7 @@
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme
 
 
 class FlameListWidget(QtWidgets.QListWidget):
@@ -9,6 +10,8 @@ class FlameListWidget(QtWidgets.QListWidget):
 
     FlameListWidget([min_width=200, max_width=2000, min_height=250, max_height=2000])
 
+    For lists with many thousands of entries use FlameListView.
+
     Example:
         list_widget = FlameListWidget()
     """
@@ -21,6 +24,7 @@ class FlameListWidget(QtWidgets.QListWidget):
         max_height: Optional[int] = 2000,
     ):
         super(FlameListWidget, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
 
@@ -44,16 +48,3 @@ class FlameListWidget(QtWidgets.QListWidget):
         self.setFocusPolicy(QtCore.Qt.NoFocus)
         self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.setAlternatingRowColors(True)
-        self.setStyleSheet(
-            'QListWidget {color: rgb(154, 154, 154); background-color: rgb(30, 30, 30); alternate-background-color: rgb(36, 36, 36); outline: 3px rgb(0, 0, 0); font: 14px "Artifakt Element"}'
-            "QListWidget::item:selected {color: rgb(217, 217, 217); background-color: rgb(102, 102, 102); border: 1px solid rgb(102, 102, 102)}"
-            "QScrollBar {background: rgb(61, 61, 61)}"
-            "QScrollBar::handle {background: rgb(31, 31, 31)}"
-            "QScrollBar::add-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-            "QScrollBar::sub-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-            "QScrollBar {background: rgb(61, 61, 61)}"
-            "QScrollBar::handle {background: rgb(31, 31, 31)}"
-            "QScrollBar::add-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-            "QScrollBar::sub-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-            "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}"
-        )
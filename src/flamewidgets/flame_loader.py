@@ -0,0 +1,276 @@
+import threading
+import time
+from collections import deque
+from typing import Union, List, Dict, Optional, Callable, Any, Iterable
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+
+
+class _ProducerSignals(QtCore.QObject):
+    # Lives in the GUI thread, emitted from the worker so delivery is queued
+
+    chunk = QtCore.Signal(int, list)
+    finished = QtCore.Signal(int)
+    failed = QtCore.Signal(int, str)
+
+
+class _ProducerTask(QtCore.QRunnable):
+    # Iterates the producer in a pool thread and sends its rows in chunks
+
+    def __init__(self, generation, rows, chunk_size, cancelled, signals):
+        super(_ProducerTask, self).__init__()
+
+        self.generation = generation
+        self.rows = rows
+        self.chunk_size = chunk_size
+        self.cancelled = cancelled
+        self.signals = signals
+
+    def run(self):
+        try:
+            rows = self.rows() if callable(self.rows) else self.rows
+            chunk = []
+            for row in rows:
+                if self.cancelled.is_set():
+                    return
+                chunk.append(row)
+                if len(chunk) >= self.chunk_size:
+                    self.signals.chunk.emit(self.generation, chunk)
+                    chunk = []
+            if self.cancelled.is_set():
+                return
+            if chunk:
+                self.signals.chunk.emit(self.generation, chunk)
+            self.signals.finished.emit(self.generation)
+        except Exception as exception:
+            if not self.cancelled.is_set():
+                self.signals.failed.emit(self.generation, "{}: {}".format(type(exception).__name__, exception))
+
+
+class FlameLoader(QtCore.QObject):
+    """
+    Fill a list or tree widget from a slow source without blocking the GUI thread
+
+    FlameLoader(target[, chunk_size=500, frame_budget_ms=8, thread_pool=None])
+
+    target: widget the rows are added to, or a function called with each list of rows [widget or function]
+        FlameListWidget: rows are strings, added with addItems
+        FlameListView: rows are strings, added with append_entries
+        FlameTreeWidget: rows are column values or dicts, added with bulk_populate
+    chunk_size: (optional) rows sent from the worker thread at a time. default is 500 [int]
+    frame_budget_ms: (optional) time spent adding rows per event loop pass. default is 8 [int]
+    thread_pool: (optional) pool the producer runs on. default is QThreadPool.globalInstance() [QThreadPool]
+
+    The producer is iterated on a pool thread. Its rows are queued back to the GUI thread and
+    added in chunks until the frame budget is used up, then the event loop gets control again.
+
+    Starting a new load cancels the running one, rows of the old load that are still queued are dropped.
+
+    Signals:
+
+        progress(int): number of rows added so far
+        finished(): all rows of the current load were added
+        failed(str): the producer or the target raised, the message of the exception
+
+    Example:
+
+        def list_shots():
+            for entry in os.scandir(path):
+                yield entry.name
+
+        loader = FlameLoader(list_widget)
+        loader.finished.connect(do_something)
+        loader.load(list_shots)
+    """
+
+    progress = QtCore.Signal(int)
+    finished = QtCore.Signal()
+    failed = QtCore.Signal(str)
+
+    def __init__(
+        self,
+        target: Union[QtWidgets.QWidget, Callable[[List[Any]], None]],
+        chunk_size: Optional[int] = 500,
+        frame_budget_ms: Optional[int] = 8,
+        thread_pool: Optional[QtCore.QThreadPool] = None,
+    ):
+        super(FlameLoader, self).__init__(target if isinstance(target, QtCore.QObject) else None)
+
+        # Check argument types
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise TypeError("FlameLoader: chunk_size must be a positive integer.")
+        if not isinstance(frame_budget_ms, int) or frame_budget_ms < 1:
+            raise TypeError("FlameLoader: frame_budget_ms must be a positive integer.")
+        if thread_pool is not None and not isinstance(thread_pool, QtCore.QThreadPool):
+            raise TypeError("FlameLoader: thread_pool must be a QThreadPool.")
+
+        self._target = target
+        self._consume = self._consumer_for(target)
+        self.chunk_size = chunk_size
+        self.frame_budget_ms = frame_budget_ms
+        self._thread_pool = thread_pool or QtCore.QThreadPool.globalInstance()
+
+        self._generation = 0
+        self._cancelled = threading.Event()
+        self._pending = deque()
+        self._producer_done = True
+        self._loading = False
+        self._delivered = 0
+        self._sort_state = None
+
+        # Not parented, the running task keeps it alive if the loader is deleted first
+        self._signals = _ProducerSignals()
+        self._signals.chunk.connect(self._chunk_received)
+        self._signals.finished.connect(self._producer_finished)
+        self._signals.failed.connect(self._producer_failed)
+
+        self._drain_timer = QtCore.QTimer(self)
+        self._drain_timer.setInterval(0)
+        self._drain_timer.timeout.connect(self._drain)
+
+    @staticmethod
+    def _consumer_for(target):
+        # Import here, the tree and list modules do not depend on the loader
+        from .flame_list_view import FlameListView
+        from .flame_tree_widget import FlameTreeWidget
+
+        if isinstance(target, FlameTreeWidget):
+            return target.bulk_populate
+        if isinstance(target, FlameListView):
+            return target.append_entries
+        if isinstance(target, QtWidgets.QListWidget):
+            return lambda rows: target.addItems([str(row) for row in rows])
+        if callable(target):
+            return target
+        raise TypeError("FlameLoader: target must be a FlameListWidget, FlameListView, FlameTreeWidget or function.")
+
+    def load(self, producer: Union[Iterable[Any], Callable[[], Iterable[Any]]], clear: Optional[bool] = True) -> None:
+        """
+        Start loading rows from producer, cancelling a running load.
+
+        producer: iterable of rows, or a function returning one. It is iterated on a pool thread [iterable or function]
+        clear: (optional) clear the target widget first. default is True [bool]
+        """
+
+        # Sorting stays suspended, the rows of the old load would be sorted just to be cleared
+        self._stop()
+
+        if clear and isinstance(self._target, QtWidgets.QWidget):
+            self._target.clear()
+
+        self._generation += 1
+        self._cancelled = threading.Event()
+        self._producer_done = False
+        self._loading = True
+        self._delivered = 0
+
+        task = _ProducerTask(self._generation, producer, self.chunk_size, self._cancelled, self._signals)
+        self._suspend_sorting()
+        self._thread_pool.start(task)
+
+    def cancel(self) -> None:
+        """
+        Stop the running load. Rows added so far are kept.
+        """
+
+        self._stop()
+        self._resume_sorting()
+
+    def _stop(self):
+        self._cancelled.set()
+        self._pending.clear()
+        self._drain_timer.stop()
+        self._loading = False
+
+    def is_loading(self) -> bool:
+        return self._loading
+
+    def delivered(self) -> int:
+        """
+        Number of rows added by the current or last load.
+        """
+
+        return self._delivered
+
+    def wait(self, timeout_ms: Optional[int] = 30000) -> bool:
+        """
+        Process events until the current load is done. Returns False on timeout.
+        Meant for scripts and headless use, in a UI connect to finished instead.
+        """
+
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        while self._loading:
+            if time.monotonic() > deadline:
+                return False
+            QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+        return True
+
+    def _chunk_received(self, generation, rows):
+        if generation != self._generation or not self._loading:
+            return
+        self._pending.append(rows)
+        if not self._drain_timer.isActive():
+            self._drain_timer.start()
+
+    def _producer_finished(self, generation):
+        if generation != self._generation or not self._loading:
+            return
+        self._producer_done = True
+        if not self._pending:
+            self._finish()
+
+    def _producer_failed(self, generation, message):
+        if generation != self._generation or not self._loading:
+            return
+        self.cancel()
+        self.failed.emit(message)
+
+    def _drain(self):
+        # Add queued rows until the frame budget is used up
+        deadline = time.perf_counter() + self.frame_budget_ms / 1000.0
+        generation = self._generation
+        delivered = self._delivered
+        while self._pending and time.perf_counter() < deadline:
+            rows = self._pending.popleft()
+            try:
+                self._consume(rows)
+            except Exception as exception:
+                self.cancel()
+                self.failed.emit("{}: {}".format(type(exception).__name__, exception))
+                return
+            delivered += len(rows)
+            if generation != self._generation:
+                # The consumer started a new load
+                return
+
+        self._delivered = delivered
+        self.progress.emit(delivered)
+
+        if not self._pending:
+            self._drain_timer.stop()
+            if self._producer_done:
+                self._finish()
+
+    def _finish(self):
+        self._loading = False
+        self._resume_sorting()
+        self.finished.emit()
+
+    def _suspend_sorting(self):
+        # A sorted tree would be sorted again after every chunk, sort once when the load is done
+        from .flame_tree_widget import FlameTreeWidget
+
+        target = self._target
+        if self._sort_state is None and isinstance(target, FlameTreeWidget) and target.isSortingEnabled():
+            header = target.header()
+            self._sort_state = (header.sortIndicatorSection(), header.sortIndicatorOrder())
+            target.setSortingEnabled(False)
+
+    def _resume_sorting(self):
+        if self._sort_state is None:
+            return
+        column, order = self._sort_state
+        self._sort_state = None
+        self._target.header().setSortIndicator(column, order)
+        self._target.setSortingEnabled(True)
@@ -0,0 +1,165 @@
+import threading
+from collections import deque
+from typing import Union, List, Dict, Optional, Callable, Iterable
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+from PySide6 import QtGui
+from .theme import ensure_theme
+
+
+class FlameLogView(QtWidgets.QPlainTextEdit):
+    """
+    Custom Qt Flame Log View for long running, fast growing logs
+
+    FlameLogView([max_lines=10000, flush_interval_ms=50, line_wrap=False])
+
+    max_lines: (optional) lines kept, older lines are dropped. default is 10000 [int]
+    flush_interval_ms: (optional) appended lines are added to the document at most this often. default is 50 [int]
+    line_wrap: (optional) wrap long lines, slower for large logs. default is False [bool]
+
+    Styled like a read only FlameTextEdit. Lines can be appended from any thread, they are
+    queued and added to the document in one batch per flush interval. The document keeps
+    at most max_lines lines, so memory stays bounded however long the log runs. The view
+    follows new lines while it is scrolled to the bottom.
+
+    Example:
+
+        log_view = FlameLogView(max_lines=50000)
+        log_view.append_line('Rendering frame 1001')   # from any thread
+
+        process.readyReadStandardOutput.connect(lambda: log_view.write(bytes(process.readAllStandardOutput()).decode()))
+    """
+
+    _wake = QtCore.Signal()
+
+    def __init__(
+        self,
+        max_lines: Optional[int] = 10000,
+        flush_interval_ms: Optional[int] = 50,
+        line_wrap: Optional[bool] = False,
+    ):
+        super(FlameLogView, self).__init__()
+        ensure_theme(self)
+
+        # Check argument types
+
+        if not isinstance(max_lines, int) or max_lines < 1:
+            raise TypeError("FlameLogView: max_lines must be a positive integer.")
+        if not isinstance(flush_interval_ms, int) or flush_interval_ms < 0:
+            raise TypeError("FlameLogView: flush_interval_ms must be a positive integer.")
+        if not isinstance(line_wrap, bool):
+            raise TypeError("FlameLogView: line_wrap must be a bool.")
+
+        # Build log view
+
+        self.setMinimumHeight(50)
+        self.setMinimumWidth(150)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+        self.setLineWrapMode(QtWidgets.QPlainTextEdit.WidgetWidth if line_wrap else QtWidgets.QPlainTextEdit.NoWrap)
+        self.setFocusPolicy(QtCore.Qt.ClickFocus)
+
+        # Lines waiting for the next flush. deque appends are atomic, so writers never take a lock.
+        # The queue is bounded too, lines beyond max_lines would be dropped by the document anyway.
+        self._pending = deque(maxlen=max_lines)
+        self._scheduled = False
+
+        # Unterminated text of write(), per writing thread
+        self._partial: Dict[int, str] = {}
+        self._partial_lock = threading.Lock()
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_interval_ms)
+        self._flush_timer.timeout.connect(self.flush)
+
+        # Queued when emitted from another thread
+        self._wake.connect(self._schedule_flush)
+
+    def append_line(self, line: str) -> None:
+        """
+        Queue one line. Safe to call from any thread.
+        """
+
+        self._pending.append(line)
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake.emit()
+
+    def append_lines(self, lines: Iterable[str]) -> None:
+        """
+        Queue several lines. Safe to call from any thread.
+        """
+
+        self._pending.extend(lines)
+        if not self._scheduled:
+            self._scheduled = True
+            self._wake.emit()
+
+    def write(self, text: str) -> None:
+        """
+        Queue text that may contain several or partial lines, e.g. process output.
+        A partial line is held until its line break is written. Safe to call from any thread.
+        """
+
+        thread = threading.get_ident()
+        with self._partial_lock:
+            text = self._partial.pop(thread, "") + text
+            lines = text.split("\n")
+            if lines[-1]:
+                self._partial[thread] = lines[-1]
+        if len(lines) > 1:
+            self.append_lines(lines[:-1])
+
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Add all queued lines to the document now.
+        """
+
+        self._flush_timer.stop()
+        self._scheduled = False
+
+        pending = self._pending
+        lines = []
+        try:
+            while True:
+                lines.append(pending.popleft())
+        except IndexError:
+            pass
+        if not lines:
+            return
+
+        # Dropping the oldest lines in one edit is much cheaper than letting the
+        # maximum block count trim them after the insert
+        maximum = self.maximumBlockCount()
+        if len(lines) >= maximum:
+            lines = lines[-maximum:]
+            super(FlameLogView, self).clear()
+        else:
+            overflow = self.blockCount() + len(lines) - maximum
+            if overflow > 0:
+                cursor = QtGui.QTextCursor(self.document())
+                cursor.movePosition(QtGui.QTextCursor.Start)
+                cursor.movePosition(QtGui.QTextCursor.NextBlock, QtGui.QTextCursor.KeepAnchor, overflow)
+                cursor.removeSelectedText()
+
+        # One insert per flush. appendPlainText keeps the view at the bottom if it was there.
+        scroll_bar = self.verticalScrollBar()
+        follow = scroll_bar.value() == scroll_bar.maximum()
+        self.appendPlainText("\n".join(lines))
+        if follow:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def clear(self) -> None:
+        self._pending.clear()
+        with self._partial_lock:
+            self._partial.clear()
+        super(FlameLogView, self).clear()
+
+    def line_count(self) -> int:
+        return self.blockCount()
@@ -1,25 +1,37 @@
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme
+from . import instrumentation
+from .callback_pool import CallbackRunner, RUN_IN
 
 class FlamePushButton(QtWidgets.QPushButton):
     '''
     Custom Qt Flame Push Button Widget
 
-    FlamePushButton(button_name, button_checked[, connect=None, button_width=150])
+    FlamePushButton(button_name, button_checked[, connect=None, button_width=150, run_in=None])
 
     button_name: text displayed on button [str]
     button_checked: True or False [bool]
     connect: (optional) execute when button is pressed [function]
     button_width: (optional) default is 150. [int]
+    run_in: (optional) run connect(checked) in the shared 'thread' or 'process' pool instead of the GUI thread. default is None [str]
+
+    With run_in the button is disabled while connect runs and clicks meanwhile are ignored.
+    The return value is emitted through connect_result, an exception through connect_failed.
+    See flamewidgets.callback_pool.
 
     Example:
 
         pushbutton = FlamePushButton('Button Name', False)
     '''
 
-    def __init__(self, button_name: str, button_checked: bool, connect: Optional[Callable[..., None]]=None, button_width: Optional[int]=150):
+    connect_result = QtCore.Signal(object)
+    connect_failed = QtCore.Signal(object)
+
+    def __init__(self, button_name: str, button_checked: bool, connect: Optional[Callable[..., None]]=None, button_width: Optional[int]=150, run_in: Optional[str]=None):
         super(FlamePushButton, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
 
@@ -29,6 +41,10 @@ class FlamePushButton(QtWidgets.QPushButton):
             raise TypeError('FlamePushButton: button_checked must be bool.')
         if not isinstance(button_width, int):
             raise TypeError('FlamePushButton: button_width must be integer.')
+        if run_in is not None and run_in not in RUN_IN:
+            raise ValueError("FlamePushButton: run_in must be 'thread' or 'process'.")
+        if run_in is not None and connect is None:
+            raise ValueError('FlamePushButton: run_in needs a connect function.')
 
         # Build push button
 
@@ -38,21 +54,13 @@ class FlamePushButton(QtWidgets.QPushButton):
         self.setMinimumSize(button_width, 28)
         self.setMaximumSize(button_width, 28)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.clicked.connect(connect)
-        self.setStyleSheet('QPushButton {color: rgb(154, 154, 154); background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(44, 54, 68)); text-align: left; '
-                           'border-top: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(44, 54, 68)); '
-                           'border-bottom: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(44, 54, 68)); '
-                           'border-left: 1px solid rgb(58, 58, 58); '
-                           'border-right: 1px solid rgb(44, 54, 68); '
-                           'padding-left: 5px; font: 14px "Artifakt Element"}'
-                           'QPushButton:checked {color: rgb(217, 217, 217); background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(71, 71, 71), stop: .94 rgb(58, 108, 173)); text-align: left; '
-                           'border-top: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(71, 71, 71), stop: .94 rgb(50, 101, 173)); '
-                           'border-bottom: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(71, 71, 71), stop: .94 rgb(50, 101, 173)); '
-                           'border-left: 1px solid rgb(71, 71, 71); '
-                           'border-right: 1px solid rgb(50, 101, 173); '
-                           'padding-left: 5px; font: italic}'
-                           'QPushButton:hover {border: 1px solid rgb(90, 90, 90)}'
-                           'QPushButton:disabled {color: #6a6a6a; background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(50, 50, 50)); font: light; border: none}'
-                           'QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}')
+        if run_in:
+            self._runner = CallbackRunner(self, connect, run_in, "FlamePushButton.connect")
+            self.clicked.connect(self._run_connect)
+        elif connect:
+            instrumentation.connect(self.clicked, connect, "FlamePushButton.connect")
+
+    def _run_connect(self, checked):
+        self._runner.run(checked)
 
 
@@ -1,8 +1,203 @@
+from bisect import bisect_left
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
 from PySide6 import QtGui
-from importlib.resources import files
+from .theme import ensure_theme, set_state
+from . import resource_cache
+from . import fonts
+from . import instrumentation
+from .flame_item_filter import TrigramIndex
+
+
+_TEXT_ALIGNMENT = {
+    "left": QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+    "center": QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter,
+    "right": QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+}
+
+_TEXT_COLOR = QtGui.QColor(154, 154, 154)
+
+# Changes that invalidate the cached render model used by paintEvent
+_RENDER_MODEL_EVENTS = (
+    QtCore.QEvent.PaletteChange,
+    QtCore.QEvent.FontChange,
+    QtCore.QEvent.StyleChange,
+    QtCore.QEvent.EnabledChange,
+    QtCore.QEvent.LayoutDirectionChange,
+)
+
+
+def _longest_increasing_subsequence(actions, old_index):
+    # Set of actions forming the longest run whose old menu positions are increasing
+
+    tails = []  # tails[k]: index into actions of the smallest tail of a run of length k + 1
+    previous = [None] * len(actions)
+    for index, action in enumerate(actions):
+        position = old_index[action]
+        low, high = 0, len(tails)
+        while low < high:
+            middle = (low + high) // 2
+            if old_index[actions[tails[middle]]] < position:
+                low = middle + 1
+            else:
+                high = middle
+        if low > 0:
+            previous[index] = tails[low - 1]
+        if low == len(tails):
+            tails.append(index)
+        else:
+            tails[low] = index
+
+    stable = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        stable.add(actions[index])
+        index = previous[index]
+    return stable
+
+
+class _OptionListModel(QtCore.QAbstractListModel):
+    # Options for the virtualized popup. A trigram index of the options is built on the first
+    # query, and a query that extends the previous one only narrows the current matches.
+
+    def __init__(self, current_icon, empty_icon, parent=None):
+        super(_OptionListModel, self).__init__(parent)
+
+        self._current_icon = current_icon
+        self._empty_icon = empty_icon
+        self._options: List[str] = []
+        self._option_index: Dict[str, int] = {}
+        self._search_index: Optional[TrigramIndex] = None
+        self._rows = range(0)
+        self._query = ""
+        self._current = None
+
+    def set_options(self, options: List[str]):
+        self.beginResetModel()
+        self._options = list(options)
+        self._option_index = {}
+        for index, option in enumerate(self._options):
+            self._option_index.setdefault(option, index)
+        self._search_index = None
+        self._rows = range(len(self._options))
+        self._query = ""
+        self.endResetModel()
+
+    def set_query(self, query: str):
+        query = query.lower()
+        if query == self._query:
+            return
+
+        if self._search_index is None:
+            self._search_index = TrigramIndex()
+            for index, option in enumerate(self._options):
+                self._search_index.add(index, option)
+
+        self.beginResetModel()
+        if not query:
+            self._rows = range(len(self._options))
+        elif self._query and self._query in query:
+            self._rows = sorted(self._search_index.search(query, self._rows))
+        else:
+            self._rows = sorted(self._search_index.search(query))
+        self._query = query
+        self.endResetModel()
+
+    def set_current(self, option: str):
+        self._current = option
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [QtCore.Qt.DecorationRole])
+
+    def option(self, row: int) -> str:
+        return self._options[self._rows[row]]
+
+    def row_of(self, option: str) -> int:
+        index = self._option_index.get(option)
+        if index is None:
+            return -1
+        if isinstance(self._rows, range):
+            return index
+        # Filtered rows are in option order
+        row = bisect_left(self._rows, index)
+        return row if row < len(self._rows) and self._rows[row] == index else -1
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        option = self._options[self._rows[index.row()]]
+        if role == QtCore.Qt.DisplayRole:
+            return option
+        if role == QtCore.Qt.DecorationRole:
+            return self._current_icon if option == self._current else self._empty_icon
+        return None
+
+
+class _OptionListPopup(QtWidgets.QWidget):
+    # Filter field plus a list view, shown inside the menu for very large option lists
+
+    option_selected = QtCore.Signal(str)
+
+    def __init__(self, parent, current_icon, empty_icon):
+        super(_OptionListPopup, self).__init__(parent)
+
+        self.filter_edit = QtWidgets.QLineEdit(self)
+        self.filter_edit.setPlaceholderText("Filter")
+        self.filter_edit.setMinimumHeight(28)
+
+        self.model = _OptionListModel(current_icon, empty_icon, self)
+
+        self.view = QtWidgets.QListView(self)
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setFixedHeight(300)
+        self.view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.view)
+
+        self.filter_edit.textChanged.connect(self._filter)
+        self.filter_edit.returnPressed.connect(self._select_first)
+        self.view.clicked.connect(self._select_index)
+        self.view.activated.connect(self._select_index)
+
+    def set_options(self, options: List[str]):
+        self.filter_edit.blockSignals(True)
+        self.filter_edit.clear()
+        self.filter_edit.blockSignals(False)
+        self.model.set_options(options)
+
+    def set_current(self, option: str):
+        self.model.set_current(option)
+
+    def prepare(self, current: str):
+        # Reset the filter and scroll to the current option before the menu opens
+        self.filter_edit.clear()
+        self.model.set_current(current)
+        row = self.model.row_of(current)
+        if row != -1:
+            index = self.model.index(row)
+            self.view.setCurrentIndex(index)
+            self.view.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtCenter)
+        self.filter_edit.setFocus()
+
+    def _filter(self, text: str):
+        self.model.set_query(text)
+        self.view.scrollToTop()
+
+    def _select_first(self):
+        if self.model.rowCount():
+            self.option_selected.emit(self.model.option(0))
+
+    def _select_index(self, index):
+        if index.isValid():
+            self.option_selected.emit(self.model.option(index.row()))
 
 
 class FlamePushButtonMenu(QtWidgets.QPushButton):
@@ -17,11 +212,25 @@ class FlamePushButtonMenu(QtWidgets.QPushButton):
     max_menu_width: [int] (optional) set maximum width of widget. default is 2000.
     menu_action: [function] (optional) execute when button is changed.
     text_align: [str] (optional) align text left, center or right. default is center.
+    lazy_threshold: [int] (optional) above this many options, menu actions are built when the menu is first opened. default is 200.
+    virtual_threshold: [int] (optional) above this many options, the menu shows a filterable list view instead of actions. default is 2000.
+
+    Option names too long for the button are elided.
 
     To update an existing button menu:
 
     FlamePushButtonMenu.update_menu(button_name, menu_options[, menu_action=None])
 
+    Only the changed options are added, removed or moved. Returns the number of actions created, reused and removed.
+
+    To select an option without calling menu_action:
+
+    FlamePushButtonMenu.set_current(option)
+
+    To change the text alignment:
+
+    FlamePushButtonMenu.set_text_align('left')
+
     Examples:
 
         push_button_menu_options = ['Item 1', 'Item 2', 'Item 3', 'Item 4']
@@ -41,9 +250,11 @@ class FlamePushButtonMenu(QtWidgets.QPushButton):
             max_menu_width: Optional[int] = 2000,
             menu_action: Optional[Callable[..., None]] = None,
             text_align="center",
+            lazy_threshold: Optional[int] = 200,
+            virtual_threshold: Optional[int] = 2000,
     ):
         super(FlamePushButtonMenu, self).__init__()
-        from functools import partial
+        ensure_theme(self)
 
         # Check argument types
 
@@ -55,13 +266,23 @@ class FlamePushButtonMenu(QtWidgets.QPushButton):
             raise TypeError("FlamePushButtonMenu: menu_width must be integer.")
         if not isinstance(max_menu_width, int):
             raise TypeError("FlamePushButtonMenu: max_menu_width must be integer.")
-        if not text_align in ["left", "center", "right"]:
+        if not text_align in _TEXT_ALIGNMENT:
             raise ValueError(
                 "FlamePushButtonMenu: align must be one of: left, center, right."
             )
+        if not isinstance(lazy_threshold, int):
+            raise TypeError("FlamePushButtonMenu: lazy_threshold must be integer.")
+        if not isinstance(virtual_threshold, int):
+            raise TypeError("FlamePushButtonMenu: virtual_threshold must be integer.")
 
         self.setProperty("text_align", text_align)
 
+        # Render model used by paintEvent, rebuilt only when invalidated
+        self._render_model_valid = False
+        self._style_option = QtWidgets.QStyleOptionButton()
+        self._font = fonts.font(14)
+        self._font_metrics = QtGui.QFontMetrics(self._font)
+
         # Store current selection
         self.current_selection = button_name
 
@@ -71,122 +292,302 @@ class FlamePushButtonMenu(QtWidgets.QPushButton):
         self.setMinimumWidth(menu_width)
         self.setMaximumWidth(max_menu_width)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.setStyleSheet(
-            "QPushButton {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; text-align:"
-            + text_align
-            + '; padding-left: 10px; font: 14px "Artifakt Element"}'
-              "QPushButton:disabled {color: rgb(116, 116, 116); background-color: rgb(45, 55, 68); border: none}"
-              "QPushButton:hover {border: 1px solid rgb(90, 90, 90)}"
-              "QPushButton::menu-indicator {image: none}"
-              "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}"
-        )
-
-        # Load icons
-        arrow_path = str(files("flamewidgets.resources").joinpath("dropdown_arrow.png"))
-        self.arrow_icon = QtGui.QPixmap(arrow_path)
 
-        # Load the current icon
-        current_icon_path = str(files("flamewidgets.resources").joinpath("dropdown_current.png"))
-        self.current_icon_pixmap = QtGui.QPixmap(current_icon_path)
+        # Load icons, decoded once per process and shared by every instance
+        self.arrow_icon = resource_cache.pixmap("dropdown_arrow.png")
+        self.current_icon_pixmap = resource_cache.pixmap("dropdown_current.png")
 
-        # Create a transparent icon of the same size to reserve icon space
+        # A transparent icon of the same size reserves icon space for unselected items
         if not self.current_icon_pixmap.isNull():
-            size = self.current_icon_pixmap.size()
-            self.empty_pixmap = QtGui.QPixmap(size)
-            self.empty_pixmap.fill(QtCore.Qt.transparent)
+            icon_size = self.current_icon_pixmap.deviceIndependentSize().toSize()
         else:
-            print("WARNING: Could not load current selection icon")
-            # Create a default empty pixmap if icon loading failed
-            self.empty_pixmap = QtGui.QPixmap(16, 16)
-            self.empty_pixmap.fill(QtCore.Qt.transparent)
+            icon_size = QtCore.QSize(16, 16)
+        self.empty_pixmap = resource_cache.empty_pixmap(icon_size)
+        self.current_icon = resource_cache.icon("dropdown_current.png")
+        self.empty_icon = resource_cache.empty_icon(icon_size)
 
-        # Create a QMenu with proper style
+        # Create a QMenu, styled by the theme through its FlamePushButtonMenu parent
         self.pushbutton_menu = QtWidgets.QMenu(self)
         self.pushbutton_menu.setFocusPolicy(QtCore.Qt.NoFocus)
         self.pushbutton_menu.setMinimumWidth(menu_width)
 
-        # Make icons visible explicitly with proper spacing
-        self.pushbutton_menu.setStyleSheet(
-            'QMenu {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; font: 14px "Artifakt Element"}'
-            "QMenu::item {padding: 5px 20px 5px 20px}"
-            "QMenu::item:selected {color: rgb(217, 217, 217); background-color: rgb(58, 69, 81)}"
-            "QMenu::icon {padding-left: 10px; margin-right: 10px}"
-        )
+        # Option -> QAction index, so selection changes only touch two actions
+        self._menu_action = menu_action
+        self._menu_options = list(menu_options)
+        self._actions: Dict[str, QtGui.QAction] = {}
+        self._action_list: List[QtGui.QAction] = []
+        self._actions_built = False
+        self._current_action: Optional[QtGui.QAction] = None
+
+        # Large-list mode: actions are built on first show, or past virtual_threshold
+        # replaced by a filterable list view inside the menu
+        self.lazy_threshold = lazy_threshold
+        self.virtual_threshold = virtual_threshold
+        self._popup: Optional[_OptionListPopup] = None
+        self._popup_action: Optional[QtWidgets.QWidgetAction] = None
+        self._mode = self._mode_for(len(menu_options))
+        self.pushbutton_menu.aboutToShow.connect(self._prepare_menu)
 
         # Add menu items
-        is_button_in_options = button_name in menu_options
+        if self._mode == "eager":
+            self._build_actions()
 
-        for menu in menu_options:
-            action = QtGui.QAction(menu, self)
-            action.triggered.connect(partial(self.create_menu, menu, menu_action))
+        self.setMenu(self.pushbutton_menu)
 
-            # Always show icons in menu
-            action.setIconVisibleInMenu(True)
+    def _mode_for(self, option_count: int) -> str:
+        if option_count > self.virtual_threshold:
+            return "virtual"
+        if option_count > self.lazy_threshold:
+            return "lazy"
+        return "eager"
+
+    def _prepare_menu(self):
+        # Connected to aboutToShow, materializes whatever the current mode needs
+
+        if self._mode == "virtual":
+            if self._popup_action is None:
+                self._attach_popup()
+            self._popup.prepare(self.current_selection)
+        elif not self._actions_built:
+            self._build_actions()
+
+    def _build_actions(self):
+        for menu in self._menu_options:
+            action = self._create_action(menu)
+            self.pushbutton_menu.addAction(action)
+            self._action_list.append(action)
+            self._actions.setdefault(menu, action)
+        self._actions_built = True
+        self._mark_current(self.current_selection)
+
+    def _clear_actions(self) -> int:
+        removed = len(self._action_list)
+        for action in self._action_list:
+            self.pushbutton_menu.removeAction(action)
+            action.deleteLater()
+        self._actions = {}
+        self._action_list = []
+        self._actions_built = False
+        self._current_action = None
+        return removed
+
+    def _attach_popup(self):
+        if self._popup is None:
+            self._popup = _OptionListPopup(self, self.current_icon, self.empty_icon)
+            self._popup.option_selected.connect(self._popup_option_selected)
+        self._popup.set_options(self._menu_options)
+        self._popup.set_current(self.current_selection)
+        self._popup_action = QtWidgets.QWidgetAction(self.pushbutton_menu)
+        self._popup_action.setDefaultWidget(self._popup)
+        self.pushbutton_menu.addAction(self._popup_action)
+
+    def _detach_popup(self):
+        # The popup widget is owned by the widget action, both go away together
+        self.pushbutton_menu.removeAction(self._popup_action)
+        self._popup_action.deleteLater()
+        self._popup_action = None
+        self._popup = None
+
+    def _popup_option_selected(self, menu: str):
+        self.pushbutton_menu.close()
+        self.create_menu(menu, self._menu_action)
+
+    def _create_action(self, menu: str) -> QtGui.QAction:
+        from functools import partial
 
-            # Set the current icon if this is the selected item
-            if is_button_in_options and menu == button_name:
-                action.setIcon(QtGui.QIcon(self.current_icon_pixmap))
-            else:
-                # Set empty icon to reserve space
-                action.setIcon(QtGui.QIcon(self.empty_pixmap))
+        action = QtGui.QAction(menu, self.pushbutton_menu)
+        action.triggered.connect(partial(self._action_triggered, menu))
 
-            self.pushbutton_menu.addAction(action)
+        # Always show icons in menu, empty icon reserves space
+        action.setIconVisibleInMenu(True)
+        action.setIcon(self.empty_icon)
+        return action
 
-        self.setMenu(self.pushbutton_menu)
+    def _action_triggered(self, menu: str):
+        # menu_action is looked up at trigger time so update_menu can swap it without reconnecting
+        self.create_menu(menu, self._menu_action)
+
+    def _mark_current(self, menu: str):
+        # Move the current icon from the previous action to the new one
+
+        if self._popup_action is not None:
+            self._popup.set_current(menu)
+            return
+
+        action = self._actions.get(menu)
+        if action is self._current_action:
+            return
+        if self._current_action is not None:
+            self._current_action.setIcon(self.empty_icon)
+        if action is not None:
+            action.setIcon(self.current_icon)
+        self._current_action = action
+
+    def set_current(self, menu: str) -> None:
+        """
+        Select an option without calling menu_action.
+        """
+
+        if not isinstance(menu, str):
+            raise TypeError("FlamePushButtonMenu: menu must be string.")
 
-    def create_menu(self, menu, menu_action):
         self.setText(menu)
         self.current_selection = menu
+        self._mark_current(menu)
 
-        # Update the icons for all actions
-        for action in self.pushbutton_menu.actions():
-            # Always ensure icon visibility
-            action.setIconVisibleInMenu(True)
-
-            if action.text() == menu:
-                action.setIcon(QtGui.QIcon(self.current_icon_pixmap))
-            else:
-                # Set empty icon to reserve space
-                action.setIcon(QtGui.QIcon(self.empty_pixmap))
+    def create_menu(self, menu, menu_action):
+        self.set_current(menu)
 
         if menu_action:
-            menu_action()
+            instrumentation.wrap(menu_action, "FlamePushButtonMenu.menu_action")()
 
-    def update_menu(self, button_name: str, menu_options: List[str], menu_action=None):
-        from functools import partial
+    def update_menu(self, button_name: str, menu_options: List[str], menu_action=None) -> Dict[str, int]:
+        """
+        Replace the menu options. Only the difference to the current options is applied:
+        actions for options that are still present are kept, moved only when out of order,
+        and new actions are created for new options.
+
+        Returns a dict with the number of actions created, reused and removed. Actions
+        that are not built yet (lazy mode) or not used (virtual mode) are not counted.
+        """
+
+        if not isinstance(menu_options, list):
+            raise TypeError("FlamePushButtonMenu: menu_options must be list.")
 
         self.setText(button_name)
         self.current_selection = button_name
-        self.pushbutton_menu.clear()
+        self._menu_action = menu_action
+        self._menu_options = list(menu_options)
+        self._mode = self._mode_for(len(menu_options))
+
+        stats = {"created": 0, "reused": 0, "removed": 0}
+
+        if self._mode == "virtual":
+            stats["removed"] = self._clear_actions()
+            if self._popup_action is not None:
+                self._popup.set_options(self._menu_options)
+                self._popup.set_current(button_name)
+            return stats
+
+        if self._popup_action is not None:
+            self._detach_popup()
+
+        if self._actions_built:
+            stats = self._apply_option_diff(self._menu_options)
+        elif self._mode == "eager":
+            self._build_actions()
+            stats["created"] = len(self._action_list)
+
+        return stats
+
+    def _apply_option_diff(self, menu_options: List[str]) -> Dict[str, int]:
+        # Pool existing actions by option, in menu order, so duplicates are reused in order
+        pool: Dict[str, List[QtGui.QAction]] = {}
+        for action in self._action_list:
+            pool.setdefault(action.text(), []).append(action)
+
+        old_index = {action: index for index, action in enumerate(self._action_list)}
+        new_list: List[QtGui.QAction] = []
+        created = 0
+        for menu in menu_options:
+            reusable = pool.get(menu)
+            if reusable:
+                new_list.append(reusable.pop(0))
+            else:
+                new_list.append(self._create_action(menu))
+                created += 1
+
+        # Remove actions whose option is gone
+        removed = 0
+        for actions in pool.values():
+            for action in actions:
+                if action is self._current_action:
+                    self._current_action = None
+                self.pushbutton_menu.removeAction(action)
+                action.deleteLater()
+                removed += 1
+
+        # Reused actions on the longest increasing run of old positions stay where they are,
+        # everything else is inserted before its successor, walking from the end
+        stable = _longest_increasing_subsequence([action for action in new_list if action in old_index], old_index)
+        following = None
+        for action in reversed(new_list):
+            if action not in stable:
+                if following is None:
+                    self.pushbutton_menu.addAction(action)
+                else:
+                    self.pushbutton_menu.insertAction(following, action)
+            following = action
+
+        self._action_list = new_list
+        self._actions = {}
+        for action, menu in zip(new_list, menu_options):
+            self._actions.setdefault(menu, action)
+
+        self._mark_current(self.current_selection)
+
+        return {"created": created, "reused": len(new_list) - created, "removed": removed}
+
+    def setText(self, text: str) -> None:
+        super(FlamePushButtonMenu, self).setText(text)
+        self._render_model_valid = False
+
+    def set_text_align(self, text_align: str) -> None:
+        """
+        Align the button text left, center or right.
+        """
+
+        if not text_align in _TEXT_ALIGNMENT:
+            raise ValueError(
+                "FlamePushButtonMenu: align must be one of: left, center, right."
+            )
 
-        # Check if button_name is in menu_options
-        is_button_in_options = button_name in menu_options
+        set_state(self, "text_align", text_align)
+        self._render_model_valid = False
+        self.update()
 
-        for menu in menu_options:
-            action = QtGui.QAction(menu, self)
-            action.triggered.connect(partial(self.create_menu, menu, menu_action))
+    def resizeEvent(self, event):
+        self._render_model_valid = False
+        super(FlamePushButtonMenu, self).resizeEvent(event)
 
-            # Always show icons in menu
-            action.setIconVisibleInMenu(True)
+    def changeEvent(self, event):
+        if event.type() in _RENDER_MODEL_EVENTS:
+            self._render_model_valid = False
+        super(FlamePushButtonMenu, self).changeEvent(event)
 
-            # Set the current icon if this is the selected item
-            if is_button_in_options and menu == button_name:
-                action.setIcon(QtGui.QIcon(self.current_icon_pixmap))
-            else:
-                # Set empty icon to reserve space
-                action.setIcon(QtGui.QIcon(self.empty_pixmap))
+    def _update_render_model(self):
+        # Everything paintEvent needs that only changes on resize, text, alignment or palette change
 
-            self.pushbutton_menu.addAction(action)
+        self._style_option.initFrom(self)
+
+        padding = 10  # Base padding
+        arrow_size = self.arrow_icon.deviceIndependentSize().toSize() if not self.arrow_icon.isNull() else QtCore.QSize(16, 16)
+
+        # 10 pixels padding from the right edge
+        self._arrow_pos = QtCore.QPoint(
+            self.width() - arrow_size.width() - padding,
+            (self.height() - arrow_size.height()) // 2,
+        )
+        self._text_rect = self.rect().adjusted(padding, 0, -(arrow_size.width() + padding * 2), 0)
+        self._text_alignment = _TEXT_ALIGNMENT.get(self.property("text_align"), _TEXT_ALIGNMENT["center"])
+
+        # Elide long option names instead of drawing them under the arrow
+        self._elided_text = self._font_metrics.elidedText(
+            self.text(), QtCore.Qt.ElideRight, max(self._text_rect.width(), 0)
+        )
+        self._render_model_valid = True
 
     def paintEvent(self, event):
         # Don't call super().paintEvent() to avoid double text drawing
-        # Instead, draw everything ourselves
+        # Instead, draw everything ourselves from the cached render model
+
+        if not self._render_model_valid:
+            self._update_render_model()
 
         painter = QtGui.QPainter(self)
 
         # Draw the button background
-        option = QtWidgets.QStyleOptionButton()
-        option.initFrom(self)
+        option = self._style_option
         option.state = QtWidgets.QStyle.State_Enabled
         if self.underMouse():
             option.state |= QtWidgets.QStyle.State_MouseOver
@@ -197,35 +598,13 @@ class FlamePushButtonMenu(QtWidgets.QPushButton):
         self.style().drawControl(QtWidgets.QStyle.CE_PushButtonBevel, option, painter, self)
 
         # Draw the arrow icon
-        if hasattr(self, 'arrow_icon') and not self.arrow_icon.isNull():
-            icon_width = self.arrow_icon.width()
-            icon_height = self.arrow_icon.height()
-            # 10 pixels padding from the right edge
-            x = self.width() - icon_width - 10
-            y = (self.height() - icon_height) // 2
-            painter.drawPixmap(x, y, self.arrow_icon)
-
-        # Calculate text rect with proper padding
-        padding = 10  # Base padding
-        arrow_width = self.arrow_icon.width() if hasattr(self, 'arrow_icon') else 16
-        text_rect = self.rect().adjusted(padding, 0, -(arrow_width + padding * 2), 0)
-
-        # Get alignment
-        text_align = self.property("text_align")
-        if text_align == "left":
-            alignment = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
-        elif text_align == "right":
-            alignment = QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
-        else:  # center
-            alignment = QtCore.Qt.AlignCenter | QtCore.Qt.AlignVCenter
+        if not self.arrow_icon.isNull():
+            painter.drawPixmap(self._arrow_pos, self.arrow_icon)
 
         # Draw the text with proper alignment and padding
-        font = painter.font()
-        font.setFamily("Artifakt Element")
-        font.setPointSize(14)
-        painter.setFont(font)
-        painter.setPen(QtGui.QColor(154, 154, 154))
-        painter.drawText(text_rect, alignment, self.text())
+        painter.setFont(self._font)
+        painter.setPen(_TEXT_COLOR)
+        painter.drawText(self._text_rect, self._text_alignment, self._elided_text)
 
     # def paintEvent(self, event):
     #     super().paintEvent(event)
@@ -1,6 +1,7 @@
 from typing import Union, List, Dict, Optional, Callable
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme, set_state
 
 
 class FlameTextEdit(QtWidgets.QTextEdit):
@@ -12,13 +13,17 @@ class FlameTextEdit(QtWidgets.QTextEdit):
     text: text to be displayed [str]
     read_only: (optional) make text in window read only [bool] - default is False
 
+    For logs that keep growing use FlameLogView.
+
     Example:
 
         text_edit = FlameTextEdit('Some important text here', read_only=True)
+        text_edit.set_read_only(False)
     """
 
     def __init__(self, text: str, read_only: Optional[bool] = False):
         super(FlameTextEdit, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
 
@@ -32,31 +37,18 @@ class FlameTextEdit(QtWidgets.QTextEdit):
         self.setMinimumHeight(50)
         self.setMinimumWidth(150)
         self.setText(text)
-        self.setReadOnly(read_only)
+        self.set_read_only(read_only)
         self.setFocusPolicy(QtCore.Qt.ClickFocus)
 
-        if read_only:
-            self.setStyleSheet(
-                'QTextEdit {color: rgb(154, 154, 154); background-color: #37414b; selection-color: #262626; selection-background-color: #b8b1a7; border: none; padding-left: 5px; font: 14px "Artifakt Element"}'
-                "QScrollBar {color: 111111; background: rgb(49, 49, 49)}"
-                "QScrollBar::handle {color: 111111; background : 111111;}"
-                "QScrollBar::add-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-                "QScrollBar::sub-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-                "QScrollBar {color: 111111; background: rgb(49, 49, 49)}"
-                "QScrollBar::handle {color: 111111; background : 111111;}"
-                "QScrollBar::add-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-                "QScrollBar::sub-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-            )
-        else:
-            self.setStyleSheet(
-                'QTextEdit {color: rgb(154, 154, 154); background-color: #37414b; selection-color: #262626; selection-background-color: #b8b1a7; border: none; padding-left: 5px; font: 14px "Artifakt Element"}'
-                "QTextEdit:focus {background-color: #495663}"
-                "QScrollBar {color: 111111; background: rgb(49, 49, 49)}"
-                "QScrollBar::handle {color: 111111; background : 111111;}"
-                "QScrollBar::add-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-                "QScrollBar::sub-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-                "QScrollBar {color: 111111; background: rgb(49, 49, 49)}"
-                "QScrollBar::handle {color: 111111; background : 111111;}"
-                "QScrollBar::add-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-                "QScrollBar::sub-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-            )
+    def set_read_only(self, read_only: bool) -> None:
+        """
+        Make the text read only or editable.
+        """
+
+        if not isinstance(read_only, bool):
+            raise TypeError("FlameTextEdit: read_only must be a boolean.")
+        self.setReadOnly(read_only)
+
+    def setReadOnly(self, read_only: bool) -> None:
+        super(FlameTextEdit, self).setReadOnly(read_only)
+        set_state(self, "read_only", read_only)
@@ -1,24 +1,39 @@
-from typing import Union, List, Dict, Optional, Callable
+from functools import partial
+from typing import Union, List, Dict, Optional, Callable, Tuple
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from PySide6 import QtGui
+from .theme import ensure_theme
+from .token_template import TokenTemplate, compile_template
 
 
 class FlameTokenPushButton(QtWidgets.QPushButton):
     """
     Custom Qt Flame Token Push Button Widget
 
-    FlameTokenPushButton(button_name, token_dict, token_dest[, button_width=150, button_max_width=300])
+    FlameTokenPushButton(button_name, token_dict, token_dest[, button_width=150, button_max_width=300, search_threshold=20])
 
     button_name: Text displayed on button [str]
     token_dict: Dictionary defining tokens. {'Token Name': '<Token>'} [dict]
+        A dictionary as value is a group and shown as a submenu: {'Shot': {'Name': '<shot>', 'Frame': '<frame>'}}
     token_dest: QLineEdit that token will be applied to [QtWidgets.QLineEdit]
     button_width: (optional) default is 150 [int]
     button_max_width: (optional) default is 300 [int]
+    search_threshold: (optional) a search field is shown at the top of the menu from this many tokens on. default is 20 [int]
+
+    Menus are filled when they are first opened, so large token sets do not slow down construction.
 
     Example:
 
         token_dict = {'Token 1': '<Token1>', 'Token2': '<Token2>'}
         token_push_button = FlameTokenPushButton('Add Token', token_dict, token_dest)
+        token_push_button.update_tokens({'Shot': {'Name': '<shot>'}, 'Date': '<date>'})
+
+    The text of token_dest is a naming template, see token_template. To show it resolved
+    with sample values while it is edited:
+
+        token_push_button.set_preview(preview_label, {'Token1': 'sh010', 'Token2': 'v003'})
+        names = token_push_button.template().resolve_many(clip_contexts)
     """
 
     def __init__(
@@ -28,9 +43,10 @@ class FlameTokenPushButton(QtWidgets.QPushButton):
         token_dest,
         button_width: Optional[int] = 150,
         button_max_width: Optional[int] = 300,
+        search_threshold: Optional[int] = 20,
     ):
         super(FlameTokenPushButton, self).__init__()
-        from functools import partial
+        ensure_theme(self)
 
         # Check argument types
 
@@ -46,6 +62,9 @@ class FlameTokenPushButton(QtWidgets.QPushButton):
             raise TypeError(
                 "FlameTokenPushButton: button_max_width must be an integer."
             )
+        if not isinstance(search_threshold, int):
+            raise TypeError("FlameTokenPushButton: search_threshold must be an integer.")
+        self._check_tokens(token_dict)
 
         # Build token push button
 
@@ -54,31 +73,169 @@ class FlameTokenPushButton(QtWidgets.QPushButton):
         self.setMinimumWidth(button_width)
         self.setMaximumWidth(button_max_width)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.setStyleSheet(
-            'QPushButton {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; font: 14px "Artifakt Element"}'
-            "QPushButton:hover {border: 1px solid rgb(90, 90, 90)}"
-            "QPushButton:disabled {color: rgb(106, 106, 106); background-color: rgb(45, 55, 68); border: none}"
-            "QPushButton::menu-indicator {image: none}"
-            "QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}"
-        )
-
-        def token_action_menu():
-            def insert_token(token):
-                for key, value in token_dict.items():
-                    if key == token:
-                        token_name = value
-                        token_dest.insert(token_name)
-
-            for key, value in token_dict.items():
-                token_menu.addAction(key, partial(insert_token, key))
-
-        token_menu = QtWidgets.QMenu(self)
-        token_menu.setFocusPolicy(QtCore.Qt.NoFocus)
-        token_menu.setStyleSheet(
-            'QMenu {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; font: 14px "Artifakt Element"}'
-            "QMenu::item:selected {color: rgb(217, 217, 217); background-color: rgb(58, 69, 81)}"
-        )
-
-        self.setMenu(token_menu)
-
-        token_action_menu()
+
+        self.token_dict = token_dict
+        self.token_dest = token_dest
+        self.search_threshold = search_threshold
+        self._preview = None
+        self._preview_context = {}
+
+        # (menu path, lowercase menu path, token) of every token, built on the first search
+        self._flat_tokens: Optional[List[Tuple[str, str, str]]] = None
+        self._search_edit = None
+        self._search_separator = None
+        self._search_actions: List[QtGui.QAction] = []
+        self._search_query = ""
+        self._search_matches: List[Tuple[str, str, str]] = []
+
+        self.token_menu = QtWidgets.QMenu(self)
+        self.token_menu.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.token_menu.aboutToShow.connect(self._prepare_menu)
+        self.setMenu(self.token_menu)
+
+    @staticmethod
+    def _check_tokens(token_dict):
+        for key, value in token_dict.items():
+            if isinstance(value, dict):
+                FlameTokenPushButton._check_tokens(value)
+            elif not isinstance(value, str):
+                raise TypeError("FlameTokenPushButton: token_dict values must be strings or dictionaries.")
+
+    def update_tokens(self, token_dict: Dict[str, Union[str, Dict]]) -> None:
+        """
+        Replace the tokens of the menu. The menu is filled again when it is next opened.
+        """
+
+        if not isinstance(token_dict, dict):
+            raise TypeError("FlameTokenPushButton: token_dict must be a dictionary.")
+        self._check_tokens(token_dict)
+
+        self.token_dict = token_dict
+        self._flat_tokens = None
+        self._clear_menu(self.token_menu)
+
+    def _clear_menu(self, menu):
+        for action in menu.actions():
+            if action.menu() is not None:
+                action.menu().deleteLater()
+        menu.clear()
+        menu.setProperty("populated", False)
+        if menu is self.token_menu:
+            self._search_edit = None
+            self._search_separator = None
+            self._search_actions = []
+            self._search_query = ""
+            self._search_matches = []
+
+    def _prepare_menu(self):
+        if not self.token_menu.property("populated"):
+            if self._token_count(self.token_dict) >= self.search_threshold:
+                self._add_search_field()
+            self._populate_menu(self.token_menu, self.token_dict)
+
+        if self._search_edit is not None:
+            self._search_edit.clear()
+            self._search_edit.setFocus()
+
+    def _populate_menu(self, menu, token_dict):
+        if menu.property("populated"):
+            return
+        menu.setProperty("populated", True)
+
+        for key, value in token_dict.items():
+            if isinstance(value, dict):
+                submenu = QtWidgets.QMenu(key, menu)
+                menu.addMenu(submenu)
+                submenu.setFocusPolicy(QtCore.Qt.NoFocus)
+                submenu.aboutToShow.connect(partial(self._populate_menu, submenu, value))
+            else:
+                menu.addAction(key, partial(self.token_dest.insert, value))
+
+    def _token_count(self, token_dict):
+        return sum(self._token_count(value) if isinstance(value, dict) else 1 for value in token_dict.values())
+
+    def _flatten(self, token_dict, path=""):
+        for key, value in token_dict.items():
+            label = path + key
+            if isinstance(value, dict):
+                yield from self._flatten(value, label + " / ")
+            else:
+                yield label, label.lower(), value
+
+    def _add_search_field(self):
+        self._search_edit = QtWidgets.QLineEdit()
+        self._search_edit.setPlaceholderText("Search")
+        self._search_edit.setMinimumHeight(28)
+        self._search_edit.textChanged.connect(self._search)
+        self._search_edit.returnPressed.connect(self._insert_first_match)
+
+        search_action = QtWidgets.QWidgetAction(self.token_menu)
+        search_action.setDefaultWidget(self._search_edit)
+        self.token_menu.addAction(search_action)
+        self._search_separator = self.token_menu.addSeparator()
+
+    def _search(self, text):
+        # Matching tokens replace the menu entries while there is a query
+        query = text.lower()
+        if not query:
+            matches = []
+        elif self._search_query and self._search_query in query:
+            matches = [entry for entry in self._search_matches if query in entry[1]]
+        else:
+            if self._flat_tokens is None:
+                self._flat_tokens = list(self._flatten(self.token_dict))
+            matches = [entry for entry in self._flat_tokens if query in entry[1]]
+        self._search_query = query
+        self._search_matches = matches
+
+        menu = self.token_menu
+        for action in self._search_actions:
+            menu.removeAction(action)
+            action.deleteLater()
+        self._search_actions = []
+
+        entries = [action for action in menu.actions() if not isinstance(action, QtWidgets.QWidgetAction) and action is not self._search_separator]
+        for action in entries:
+            action.setVisible(not query)
+
+        for label, lowercase_label, token in matches[:100]:
+            action = menu.addAction(label, partial(self.token_dest.insert, token))
+            self._search_actions.append(action)
+
+    def _insert_first_match(self):
+        if self._search_matches:
+            self.token_dest.insert(self._search_matches[0][2])
+            self.token_menu.close()
+
+    def template(self) -> TokenTemplate:
+        """
+        Return the compiled template of the current token_dest text.
+        """
+
+        return compile_template(self.token_dest.text())
+
+    def set_preview(self, preview, context: Dict[str, object]) -> None:
+        """
+        Show the template resolved with context in preview, updated whenever token_dest changes.
+
+        preview: widget with setText, e.g. a FlameLabel, or None to stop the preview [QWidget]
+        context: token name (without angle brackets) to sample value [dict]
+        """
+
+        if preview is not None and not hasattr(preview, "setText"):
+            raise TypeError("FlameTokenPushButton: preview must have a setText method.")
+        if not isinstance(context, dict):
+            raise TypeError("FlameTokenPushButton: context must be a dictionary.")
+
+        if self._preview is None and preview is not None:
+            self.token_dest.textChanged.connect(self._update_preview)
+        elif self._preview is not None and preview is None:
+            self.token_dest.textChanged.disconnect(self._update_preview)
+
+        self._preview = preview
+        self._preview_context = context
+        self._update_preview()
+
+    def _update_preview(self, *args):
+        if self._preview is not None:
+            self._preview.setText(self.template().resolve(self._preview_context))
@@ -0,0 +1,262 @@
+from typing import Union, List, Dict, Optional, Callable, Any, Iterable, Sequence, Tuple
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+from .theme import ensure_theme
+from . import instrumentation
+
+
+class _Node(object):
+    # One row of the tree. Children are fetched from the provider on demand.
+
+    __slots__ = ("key", "values", "parent", "row", "children", "has_children", "source")
+
+    def __init__(self, key, values, parent, row, has_children):
+        self.key = key
+        self.values = values
+        self.parent = parent
+        self.row = row
+        self.children = []
+        self.has_children = has_children
+        self.source = None  # provider iterator, None until the first fetch, False once exhausted
+
+
+class FlameTreeModel(QtCore.QAbstractItemModel):
+    """
+    Item model that loads rows from a provider callable on demand.
+
+    FlameTreeModel(tree_headers, provider[, fetch_batch_size=1000])
+
+    tree_headers: list of names to be used for column names [list]
+    provider: called with the key of the parent row, or None for the top level [function]
+        It returns an iterable of (key, values, has_children) tuples:
+            key: any object identifying the row, passed back to provider when the row is expanded
+            values: sequence of column values
+            has_children: True if the row can be expanded
+    fetch_batch_size: (optional) rows pulled from the provider per fetch. default is 1000 [int]
+
+    Example:
+
+        def provider(parent_key):
+            if parent_key is None:
+                return ((library, [library], True) for library in list_libraries())
+            return ((clip, [clip.name, clip.duration], False) for clip in list_clips(parent_key))
+
+        model = FlameTreeModel(['Name', 'Duration'], provider)
+    """
+
+    def __init__(
+        self,
+        tree_headers: List[str],
+        provider: Callable[[Any], Iterable[Tuple[Any, Sequence[Any], bool]]],
+        fetch_batch_size: Optional[int] = 1000,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super(FlameTreeModel, self).__init__(parent)
+
+        # Check argument types
+
+        if not isinstance(tree_headers, list):
+            raise TypeError("FlameTreeModel: tree_headers must be a list")
+        if not callable(provider):
+            raise TypeError("FlameTreeModel: provider must be callable")
+        if not isinstance(fetch_batch_size, int) or fetch_batch_size < 1:
+            raise TypeError("FlameTreeModel: fetch_batch_size must be a positive integer")
+
+        self._headers = list(tree_headers)
+        self._provider = provider
+        self.fetch_batch_size = fetch_batch_size
+        self._root = _Node(None, (), None, 0, True)
+
+    def reload(self) -> None:
+        """
+        Drop all loaded rows. They are fetched from the provider again when needed.
+        """
+
+        self.beginResetModel()
+        self._root = _Node(None, (), None, 0, True)
+        self.endResetModel()
+
+    def key(self, index: QtCore.QModelIndex) -> Any:
+        """
+        Return the provider key of the row at index.
+        """
+
+        return self._node(index).key
+
+    def _node(self, index: QtCore.QModelIndex) -> _Node:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        node = self._node(parent)
+        if row < 0 or row >= len(node.children) or column < 0 or column >= len(self._headers):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=QtCore.QModelIndex()):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is self._root or parent is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self._headers)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        node = self._node(parent)
+        return bool(node.children) or (node.has_children and node.source is not False)
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.has_children and node.source is not False
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if not node.has_children or node.source is False:
+            return
+
+        if node.source is None:
+            node.source = iter(self._provider(node.key))
+
+        batch = []
+        for entry in node.source:
+            batch.append(entry)
+            if len(batch) >= self.fetch_batch_size:
+                break
+        else:
+            node.source = False
+
+        if not batch:
+            return
+
+        first = len(node.children)
+        self.beginInsertRows(parent, first, first + len(batch) - 1)
+        node.children.extend(
+            _Node(key, values, node, first + offset, bool(has_children))
+            for offset, (key, values, has_children) in enumerate(batch)
+        )
+        self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole:
+            column = index.column()
+            return str(node.values[column]) if column < len(node.values) else None
+        if role == QtCore.Qt.UserRole:
+            return node.key
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole and section < len(self._headers):
+            return self._headers[section]
+        return None
+
+
+class FlameTreeView(QtWidgets.QTreeView):
+    """
+    Custom Qt Flame Tree View for very large hierarchies
+
+    FlameTreeView(tree_headers, provider[, connect=None, tree_min_width=100, tree_min_height=100, fetch_batch_size=1000])
+
+    tree_headers: list of names to be used for column names in tree [list]
+    provider: returns the rows below a parent key, see FlameTreeModel [function]
+    connect: execute when item in tree is clicked on [function]
+    tree_min_width = set tree width [int]
+    tree_min_height = set tree height [int]
+    fetch_batch_size = rows pulled from the provider at a time [int]
+
+    Rows are only loaded when they are scrolled into view or their parent is expanded.
+    Unlike FlameTreeWidget the view is not sortable, sorting would load every row.
+
+    Example:
+
+        tree_headers = ['Name', 'Duration']
+        tree = FlameTreeView(tree_headers, provider)
+        key = tree.key(tree.currentIndex())
+    """
+
+    def __init__(
+        self,
+        tree_headers: List[str],
+        provider: Callable[[Any], Iterable[Tuple[Any, Sequence[Any], bool]]],
+        connect: Optional[Callable[..., None]] = None,
+        tree_min_width: Optional[int] = 100,
+        tree_min_height: Optional[int] = 100,
+        fetch_batch_size: Optional[int] = 1000,
+    ):
+        super(FlameTreeView, self).__init__()
+        ensure_theme(self)
+
+        # Check argument types
+
+        if not isinstance(tree_headers, list):
+            raise TypeError("FlameTreeView: tree_headers must be a list")
+        if not isinstance(tree_min_width, int):
+            raise TypeError("FlameTreeView: tree_min_width must be an integer")
+        if not isinstance(tree_min_height, int):
+            raise TypeError("FlameTreeView: tree_min_height must be an integer")
+
+        # Build tree view
+
+        self.setMinimumWidth(tree_min_width)
+        self.setMinimumHeight(tree_min_height)
+        self.setUniformRowHeights(True)
+        self.setAlternatingRowColors(True)
+        self.setFocusPolicy(QtCore.Qt.NoFocus)
+        if connect:
+            instrumentation.connect(self.clicked, connect, "FlameTreeView.connect")
+
+        self.tree_model = FlameTreeModel(tree_headers, provider, fetch_batch_size, self)
+        self.setModel(self.tree_model)
+
+        # QTreeView only fetches more top level rows when scrolled to the end,
+        # expanded children with more rows are fetched here
+        self._fetch_pending = False
+        self.verticalScrollBar().valueChanged.connect(self._fetch_visible_children)
+        self.expanded.connect(self._schedule_fetch)
+        self.tree_model.rowsInserted.connect(self._schedule_fetch)
+
+    def key(self, index: QtCore.QModelIndex) -> Any:
+        """
+        Return the provider key of the row at index.
+        """
+
+        return self.tree_model.key(index)
+
+    def reload(self) -> None:
+        """
+        Drop all loaded rows and fetch them from the provider again.
+        """
+
+        self.tree_model.reload()
+
+    def _schedule_fetch(self, *args):
+        # After the view has laid out the new rows
+        if not self._fetch_pending:
+            self._fetch_pending = True
+            QtCore.QTimer.singleShot(0, self._fetch_visible_children)
+
+    def _fetch_visible_children(self, *args):
+        # Fetch more rows for every parent whose last loaded child is in the viewport
+
+        self._fetch_pending = False
+        model = self.tree_model
+        height = self.viewport().height()
+        parents = []
+        index = self.indexAt(QtCore.QPoint(0, 0))
+        while index.isValid() and self.visualRect(index).top() < height:
+            parent = index.parent()
+            if index.row() == model.rowCount(parent) - 1 and model.canFetchMore(parent):
+                parents.append(parent)
+            index = self.indexBelow(index)
+
+        for parent in parents:
+            model.fetchMore(parent)
@@ -1,6 +1,41 @@
-from typing import Union, List, Dict, Optional, Callable
+from typing import Union, List, Dict, Optional, Callable, Iterable, Sequence
+from contextlib import contextmanager
 from PySide6 import QtWidgets
 from PySide6 import QtCore
+from .theme import ensure_theme
+from . import instrumentation
+from .sort_keys import SORT_KEY_FUNCTIONS
+
+
+# Data role the sort key of a column with a sort type is kept in
+SORT_KEY_ROLE = QtCore.Qt.UserRole + 1
+
+# Most items added or changed between two event loop passes that are moved to their
+# sorted place one by one, more than that and the tree is sorted again
+_INCREMENTAL_SORT_LIMIT = 256
+
+
+class FlameTreeWidgetItem(QtWidgets.QTreeWidgetItem):
+    """
+    Tree item that computes its sort keys for FlameTreeWidget sort types as soon as its text is set.
+
+    FlameTreeWidgetItem(values)
+
+    values: column text [list]
+
+    The key of a column is computed when the text of that column is set while the item is
+    in a FlameTreeWidget, and when the item is added to one. It is kept in SORT_KEY_ROLE,
+    so sorting does no string parsing. Keys of plain QTreeWidgetItems are kept up to date
+    by the tree from its model signals instead, which costs a little more per change.
+    Items created by FlameTreeWidget.bulk_populate are FlameTreeWidgetItems.
+    """
+
+    def setData(self, column, role, value):
+        super(FlameTreeWidgetItem, self).setData(column, role, value)
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            tree = self.treeWidget()
+            if isinstance(tree, FlameTreeWidget):
+                tree._update_sort_key(self, column)
 
 
 class FlameTreeWidget(QtWidgets.QTreeWidget):
@@ -13,11 +48,26 @@ class FlameTreeWidget(QtWidgets.QTreeWidget):
     connect: execute when item in tree is clicked on [function]
     tree_min_width = set tree width [int]
     tree_min_height = set tree height [int]
+    sort_types = (optional) sort type per column name: natural, integer, float, timecode or date [dict]
+                 columns without a sort type sort by plain text.
 
     Exmaple:
 
         tree_headers = ['Header1', 'Header2', 'Header3', 'Header4']
-        tree = FlameTreeWidget(tree_headers)
+        tree = FlameTreeWidget(tree_headers, sort_types={'Header1': 'natural', 'Header2': 'timecode'})
+
+    Sort keys are computed once when items are added or their text changes and kept in
+    SORT_KEY_ROLE. FlameTreeWidgetItems, for example those created by bulk_populate, do
+    this in setData and are the cheaper choice for large trees.
+
+    To add many rows at once, sorting once at the end:
+
+        tree.bulk_populate([('a', 'b', 'c', 'd'), {'Header1': 'e', 'Header3': 'f'}])
+
+        or
+
+        with tree.bulk_update():
+            tree.addTopLevelItem(item)
     """
 
     def __init__(
@@ -26,8 +76,10 @@ class FlameTreeWidget(QtWidgets.QTreeWidget):
         connect: Optional[Callable[..., None]] = None,
         tree_min_width: Optional[int] = 100,
         tree_min_height: Optional[int] = 100,
+        sort_types: Optional[Dict[str, str]] = None,
     ):
         super(FlameTreeWidget, self).__init__()
+        ensure_theme(self)
 
         # Check argument types
 
@@ -37,6 +89,28 @@ class FlameTreeWidget(QtWidgets.QTreeWidget):
             raise TypeError("FlameTreeWidget: tree_min_width must be an integer")
         if not isinstance(tree_min_height, int):
             raise TypeError("FlameTreeWidget: tree_min_height must be an integer")
+        if sort_types is not None and not isinstance(sort_types, dict):
+            raise TypeError("FlameTreeWidget: sort_types must be a dictionary")
+
+        # Plain text sort columns use Qt's own sorting, which keeps the tree sorted on
+        # insert and edit. Columns with a sort type are sorted in Python by the keys kept
+        # in SORT_KEY_ROLE, Qt's sorting is switched off while such a column is the sort
+        # column. Items added or changed meanwhile are moved to their place on the next
+        # event loop pass.
+
+        self.tree_headers = tree_headers
+        self._bulk_depth = 0
+        self._sort_key_functions = {}
+        self._sorting_enabled = False
+        self._sorting_now = False
+        self._sort_pending = False
+        self._pending_items = []
+        self._pending_full = False
+        self.header().sortIndicatorChanged.connect(self._sort_indicator_changed)
+        self.model().rowsInserted.connect(self._rows_inserted)
+        self.model().dataChanged.connect(self._data_changed)
+        self.model().rowsAboutToBeRemoved.connect(self._rows_about_to_be_removed)
+        self.model().modelAboutToBeReset.connect(self._rows_about_to_be_removed)
 
         # Build tree widget
 
@@ -46,23 +120,360 @@ class FlameTreeWidget(QtWidgets.QTreeWidget):
         self.sortByColumn(0, QtCore.Qt.AscendingOrder)
         self.setAlternatingRowColors(True)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.clicked.connect(connect)
-        self.setStyleSheet(
-            'QTreeWidget {color: rgb(154, 154, 154); background-color: rgb(30, 30, 30); alternate-background-color: rgb(36, 36, 36); border: none; font: 14px "Artifakt Element"}'
-            'QHeaderView::section {color: rgb(154, 154, 154); background-color: rgb(57, 57, 57); border: none; padding-left: 10px; font: 14px "Artifakt Element"}'
-            'QTreeWidget:item:selected {color: rgb(217, 217, 217); background-color: rgb(71, 71, 71); selection-background-color: rgb(153, 153, 153); border: 1px solid rgb(17, 17, 17); font: 14px "Artifakt Element"}'
-            'QTreeWidget:item:selected:active {color: rgb(153, 153, 153); border: none; font: 14px "Artifakt Element"}'
-            'QTreeWidget:disabled {color: rgb(101, 101, 101); background-color: rgb(34, 34, 34); font: 14px "Artifakt Element"}'
-            'QMenu {color: rgb(154, 154, 154); background-color: rgb(36, 48, 61); font: 14px "Artifakt Element"}'
-            'QMenu::item:selected {color: rgb(217, 217, 217); background-color: rgb(58, 69, 81); font: 14px "Artifakt Element"}'
-            "QScrollBar {color: rgb(17, 17, 17); background: rgb(49, 49, 49)}"
-            "QScrollBar::handle {color: rgb(17, 17, 17)}"
-            "QScrollBar::add-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-            "QScrollBar::sub-line:vertical {border: none; background: none; width: 0px; height: 0px}"
-            "QScrollBar {color: rgb(17, 17, 17); background: rgb(49, 49, 49)}"
-            "QScrollBar::handle {color: rgb(17, 17, 17)}"
-            "QScrollBar::add-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-            "QScrollBar::sub-line:horizontal {border: none; background: none; width: 0px; height: 0px}"
-        )
+        if connect:
+            instrumentation.connect(self.clicked, connect, "FlameTreeWidget.connect")
 
         self.setHeaderLabels(tree_headers)
+
+        for header, sort_type in (sort_types or {}).items():
+            self.set_sort_type(header, sort_type)
+
+    def set_sort_type(self, column: Union[str, int], sort_type: Optional[str]) -> None:
+        """
+        Set how a column sorts: natural, integer, float, timecode, date, or None for plain text.
+
+        column: header name or column index [str or int]
+        """
+
+        if isinstance(column, str):
+            if column not in self.tree_headers:
+                raise ValueError("FlameTreeWidget: column must be one of the tree headers")
+            column = self.tree_headers.index(column)
+        if sort_type is not None and sort_type not in SORT_KEY_FUNCTIONS:
+            raise ValueError(
+                "FlameTreeWidget: sort_type must be one of: natural, integer, float, timecode, date"
+            )
+
+        if sort_type is None:
+            self._sort_key_functions.pop(column, None)
+        else:
+            self._sort_key_functions[column] = SORT_KEY_FUNCTIONS[sort_type]
+
+        # Replace the keys of the previous sort type
+        items = [self.topLevelItem(index) for index in range(self.topLevelItemCount())]
+        self._update_sort_keys(items, [column])
+
+        if self._sorting_enabled and self.header().sortIndicatorSection() == column:
+            self._apply_sorting()
+
+    def setSortingEnabled(self, enable: bool) -> None:
+        self._sorting_enabled = enable
+        self._apply_sorting()
+
+    def isSortingEnabled(self) -> bool:
+        return self._sorting_enabled
+
+    def sortByColumn(self, column: int, order: QtCore.Qt.SortOrder) -> None:
+        header = self.header()
+        blocked = header.blockSignals(True)
+        header.setSortIndicator(column, order)
+        header.blockSignals(blocked)
+        if self._sorting_enabled:
+            self._apply_sorting()
+        else:
+            self._sort(column, order)
+
+    def _apply_sorting(self):
+        # Switch between Qt's sorting and sorting by keys for the current sort column, and sort once
+
+        header = self.header()
+        column = header.sortIndicatorSection()
+        order = header.sortIndicatorOrder()
+        native = super(FlameTreeWidget, self).isSortingEnabled()
+
+        if self._sorting_enabled and column not in self._sort_key_functions:
+            if native:
+                super(FlameTreeWidget, self).sortByColumn(column, order)
+            else:
+                # Sorts by the sort indicator
+                super(FlameTreeWidget, self).setSortingEnabled(True)
+            return
+
+        if native:
+            super(FlameTreeWidget, self).setSortingEnabled(False)
+        header.setSortIndicatorShown(self._sorting_enabled)
+        header.setSectionsClickable(self._sorting_enabled)
+        if self._sorting_enabled:
+            self._sort(column, order)
+
+    def _sort_indicator_changed(self, column, order):
+        # Connected before Qt's own handler, which sorts plain text columns while Qt's sorting is on
+        if not self._sorting_enabled:
+            return
+        if column in self._sort_key_functions or not super(FlameTreeWidget, self).isSortingEnabled():
+            self._apply_sorting()
+
+    def _key_sort_column(self):
+        # Sort column that is sorted by keys and kept sorted from here, or None
+        if not self._sorting_enabled or self._sorting_now or self._bulk_depth:
+            return None
+        column = self.header().sortIndicatorSection()
+        return column if column in self._sort_key_functions else None
+
+    def _update_sort_key(self, item, column):
+        key_function = self._sort_key_functions.get(column)
+        if key_function is not None:
+            # Not a change the user made, itemChanged is not emitted for it
+            signals_blocked = self.blockSignals(True)
+            try:
+                item.setData(column, SORT_KEY_ROLE, key_function(item.text(column)))
+            finally:
+                self.blockSignals(signals_blocked)
+
+    def _update_sort_keys(self, items, columns=None):
+        # Set the keys of items and their children, for all columns with a sort type or the given ones
+        key_functions = [(column, self._sort_key_functions.get(column)) for column in (columns or self._sort_key_functions)]
+        signals_blocked = self.blockSignals(True)
+        try:
+            stack = list(items)
+            while stack:
+                item = stack.pop()
+                for column, key_function in key_functions:
+                    item.setData(column, SORT_KEY_ROLE, None if key_function is None else key_function(item.text(column)))
+                stack.extend(item.child(index) for index in range(item.childCount()))
+        finally:
+            self.blockSignals(signals_blocked)
+
+    def _rows_inserted(self, parent, first, last):
+        if self._sorting_now:
+            return
+        parent_item = self.itemFromIndex(parent) if parent.isValid() else self.invisibleRootItem()
+        items = [parent_item.child(row) for row in range(first, last + 1)]
+        if self._sort_key_functions:
+            self._update_sort_keys(items)
+        if self._key_sort_column() is not None:
+            # Children of an added item may come unsorted
+            self._pending_items.extend((item, True) for item in items)
+            self._schedule_sort()
+
+    def _data_changed(self, top_left, bottom_right, roles=()):
+        if self._sorting_now:
+            return
+        if roles and QtCore.Qt.DisplayRole not in roles and QtCore.Qt.EditRole not in roles:
+            return
+        columns = [column for column in self._sort_key_functions if top_left.column() <= column <= bottom_right.column()]
+        if not columns:
+            return
+
+        items = [self.itemFromIndex(top_left.siblingAtRow(row)) for row in range(top_left.row(), bottom_right.row() + 1)]
+        # FlameTreeWidgetItems update their keys in setData
+        plain_items = [item for item in items if not isinstance(item, FlameTreeWidgetItem)]
+        if plain_items:
+            self._update_sort_keys(plain_items, columns)
+
+        if self._key_sort_column() in columns:
+            self._pending_items.extend((item, False) for item in items)
+            self._schedule_sort()
+
+    def _rows_about_to_be_removed(self, *args):
+        # Pending items may be deleted with the rows, sort the whole tree instead
+        if self._pending_items and not self._sorting_now:
+            self._pending_items = []
+            self._pending_full = True
+
+    def _schedule_sort(self):
+        # Keep a key sorted tree sorted after items are added or changed, once per event loop pass
+        if self._sort_pending:
+            return
+        self._sort_pending = True
+        QtCore.QTimer.singleShot(0, self._run_pending_sort)
+
+    def _run_pending_sort(self):
+        self._sort_pending = False
+        items, self._pending_items = self._pending_items, []
+        full, self._pending_full = self._pending_full, False
+        column = self._key_sort_column()
+        if column is None:
+            return
+
+        order = self.header().sortIndicatorOrder()
+        if full or len(items) > _INCREMENTAL_SORT_LIMIT:
+            self._sort(column, order)
+            return
+
+        self._sorting_now = True
+        try:
+            self._move_to_sorted_place(items, column, order == QtCore.Qt.DescendingOrder)
+        finally:
+            self._sorting_now = False
+
+    def _sort(self, column, order):
+        if column < 0 or column >= self.columnCount():
+            return
+
+        self._pending_items = []
+        self._pending_full = False
+        self._sorting_now = True
+        try:
+            key_function = self._sort_key_functions.get(column)
+            if key_function is None:
+                super(FlameTreeWidget, self).sortItems(column, order)
+            else:
+                self._sort_by_keys(column, order == QtCore.Qt.DescendingOrder)
+        finally:
+            self._sorting_now = False
+
+    def _sort_key(self, item, column):
+        key = item.data(column, SORT_KEY_ROLE)
+        if key is None:
+            self._update_sort_key(item, column)
+            key = item.data(column, SORT_KEY_ROLE)
+        return key
+
+    def _sort_children(self, parent, column, reverse):
+        children = parent.takeChildren()
+        children.sort(key=lambda item: self._sort_key(item, column), reverse=reverse)
+        for child in children:
+            if child.childCount():
+                self._sort_children(child, column, reverse)
+        parent.addChildren(children)
+
+    def _sort_by_keys(self, column, reverse):
+        # Taking and re-adding the items drops view state, so it is restored afterwards
+
+        # Only items with children can be expanded, isExpanded is a view lookup per call
+        expanded = []
+        iterator = QtWidgets.QTreeWidgetItemIterator(self, QtWidgets.QTreeWidgetItemIterator.HasChildren)
+        while iterator.value():
+            item = iterator.value()
+            if item.isExpanded():
+                expanded.append(item)
+            iterator += 1
+        hidden = []
+        iterator = QtWidgets.QTreeWidgetItemIterator(self, QtWidgets.QTreeWidgetItemIterator.Hidden)
+        while iterator.value():
+            hidden.append(iterator.value())
+            iterator += 1
+
+        with self._view_state_kept(expanded, hidden):
+            self._sort_children(self.invisibleRootItem(), column, reverse)
+
+    def _move_to_sorted_place(self, items, column, reverse):
+        # Take the added and changed items out, their siblings stay sorted, and insert
+        # each one where a binary search over the siblings' keys puts it
+
+        moved = {}
+        for item, sort_children in items:
+            if item.treeWidget() is self:
+                moved[item] = moved.get(item, False) or sort_children
+
+        expanded = []
+        hidden = []
+        stack = list(moved)
+        while stack:
+            item = stack.pop()
+            if item.isHidden():
+                hidden.append(item)
+            if item.childCount():
+                if item.isExpanded():
+                    expanded.append(item)
+                stack.extend(item.child(index) for index in range(item.childCount()))
+
+        with self._view_state_kept(expanded, hidden):
+            taken = []
+            for item in moved:
+                parent = item.parent() or self.invisibleRootItem()
+                taken.append((parent, parent.takeChild(parent.indexOfChild(item))))
+
+            for parent, item in taken:
+                if moved[item] and item.childCount():
+                    self._sort_children(item, column, reverse)
+                key = self._sort_key(item, column)
+                low, high = 0, parent.childCount()
+                while low < high:
+                    middle = (low + high) // 2
+                    other = self._sort_key(parent.child(middle), column)
+                    if (other < key) if reverse else (key < other):
+                        high = middle
+                    else:
+                        low = middle + 1
+                parent.insertChild(low, item)
+
+    @contextmanager
+    def _view_state_kept(self, expanded, hidden):
+        # Restores expanded, hidden and selected items and the current item after items were taken and re-added
+        selected = self.selectedItems()
+        current = self.currentItem()
+
+        updates = self.updatesEnabled()
+        signals_blocked = self.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+            for item in expanded:
+                item.setExpanded(True)
+            for item in hidden:
+                item.setHidden(True)
+            for item in selected:
+                item.setSelected(True)
+            if current is not None:
+                self.setCurrentItem(current, 0, QtCore.QItemSelectionModel.NoUpdate)
+        finally:
+            self.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(updates)
+
+    @contextmanager
+    def bulk_update(self):
+        """
+        Suspend sorting, repaints and widget signals while adding or changing many items.
+        The sort state is restored, and the tree sorted once, when the block exits.
+        """
+
+        self._bulk_depth += 1
+        if self._bulk_depth > 1:
+            try:
+                yield self
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        header = self.header()
+        sorting = self.isSortingEnabled()
+        sort_column = header.sortIndicatorSection()
+        sort_order = header.sortIndicatorOrder()
+        updates = self.updatesEnabled()
+        signals_blocked = self.blockSignals(True)
+
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            self.blockSignals(signals_blocked)
+            if sorting:
+                header.setSortIndicator(sort_column, sort_order)
+                self.setSortingEnabled(True)
+            self.setUpdatesEnabled(updates)
+
+    def bulk_populate(
+        self,
+        rows: Iterable[Union[Sequence, Dict[str, object]]],
+        parent: Optional[QtWidgets.QTreeWidgetItem] = None,
+    ) -> List[QtWidgets.QTreeWidgetItem]:
+        """
+        Add many rows in one batch and return the created items.
+
+        rows: column values per row, as a sequence in column order or a dict of header name to value [iterable]
+        parent: (optional) item the rows are added to. default is top level [QTreeWidgetItem]
+        """
+
+        if parent is not None and not isinstance(parent, QtWidgets.QTreeWidgetItem):
+            raise TypeError("FlameTreeWidget: parent must be a QTreeWidgetItem")
+
+        headers = self.tree_headers
+        items = []
+        for row in rows:
+            if isinstance(row, dict):
+                values = [str(row.get(header, "")) for header in headers]
+            else:
+                values = [str(value) for value in row]
+            items.append(FlameTreeWidgetItem(values))
+
+        with self.bulk_update():
+            if parent is None:
+                self.addTopLevelItems(items)
+            else:
+                parent.addChildren(items)
+
+        return items
@@ -0,0 +1,76 @@
+"""
+Flame Fonts
+
+Registers the bundled Artifakt Element faces with QFontDatabase the first time a
+Flame widget is created. Fonts are registered from memory, so no file paths are
+needed; QFontDatabase keeps its own copy, the bytes read are not cached. QFont
+objects are cached so paint code does not resolve the font through the database
+on every call.
+
+    painter.setFont(font(14))
+"""
+
+from typing import Union, List, Dict, Optional, Callable, Tuple
+from PySide6 import QtCore
+from PySide6 import QtGui
+from . import resource_cache
+
+
+FONT_FAMILY = "Artifakt Element"
+
+_FONT_FILES = (
+    "Artifakt Element Regular.ttf",
+    "Artifakt Element Bold.ttf",
+    "Artifakt Element Italic.ttf",
+    "Artifakt Element Bold Italic.ttf",
+)
+
+_registered = False
+_font_ids: List[int] = []
+_font_cache: Dict[Tuple[int, bool, bool], QtGui.QFont] = {}
+
+
+def ensure_fonts() -> None:
+    """
+    Register the bundled Artifakt Element faces with QFontDatabase. Safe to call
+    repeatedly, fonts are only registered once per process.
+
+    Does nothing until a QGuiApplication exists.
+    """
+
+    global _registered
+
+    if _registered or QtGui.QGuiApplication.instance() is None:
+        return
+    _registered = True
+
+    for font_file in _FONT_FILES:
+        font_id = QtGui.QFontDatabase.addApplicationFontFromData(
+            QtCore.QByteArray(resource_cache.read_resource(font_file))
+        )
+        if font_id == -1:
+            print("WARNING: Could not register font: " + font_file)
+        else:
+            _font_ids.append(font_id)
+
+
+def font(point_size: int = 14, bold: bool = False, italic: bool = False) -> QtGui.QFont:
+    """
+    Return a shared Artifakt Element QFont.
+
+    point_size: (optional) default is 14 [int]
+    bold: (optional) default is False [bool]
+    italic: (optional) default is False [bool]
+
+    The returned QFont is shared, copy it before modifying.
+    """
+
+    key = (point_size, bold, italic)
+    cached = _font_cache.get(key)
+    if cached is None:
+        ensure_fonts()
+        cached = QtGui.QFont(FONT_FAMILY, point_size)
+        cached.setBold(bold)
+        cached.setItalic(italic)
+        _font_cache[key] = cached
+    return cached
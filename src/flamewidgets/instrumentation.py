@@ -0,0 +1,350 @@
+"""
+Flame Instrumentation
+
+Opt-in counters and timings for the widget hot paths, to find out where the time of
+a slow dialog goes: widget construction, stylesheet application and repolish, paint
+events, FlamePushButtonMenu menu rebuilds and the user callbacks (connect,
+menu_action, text_changed).
+
+    from flamewidgets import instrumentation
+
+    instrumentation.enable()
+    ... build and use the dialog ...
+    print(instrumentation.snapshot())
+    instrumentation.dump_trace('flame_trace.json')   # open in chrome://tracing or Perfetto
+
+Nothing is patched until enable() is called for the first time, so the widgets run
+without any overhead unless instrumentation is used. Enable it before building the
+dialog, callbacks are only timed for widgets built while it is enabled.
+
+Paint events, polishes and style changes of Flame widgets are seen by an application
+event filter that disable() removes again, Qt calls no Python code for them afterwards.
+Only the Python methods of the Flame classes (construction, menu rebuilds) stay wrapped
+and check a flag.
+"""
+
+import os
+import time
+import threading
+import functools
+from collections import deque
+from typing import Union, List, Dict, Optional, Callable
+
+
+_enabled = False
+_installed = False
+_event_timer = None   # application event filter, installed while enabled
+_class_names: Dict[type, str] = {}  # Flame widget class -> name used for its events
+
+_lock = threading.Lock()
+_stats: Dict[str, list] = {}   # name -> [category, count, total seconds, max seconds]
+_events = deque(maxlen=100000)  # (name, category, start, duration, thread id)
+_origin = time.perf_counter()
+
+# Widget classes whose construction and paint events are timed
+_WIDGET_CLASSES = (
+    ("flame_button", "FlameButton"),
+    ("flame_label", "FlameLabel"),
+    ("flame_line_edit", "FlameLineEdit"),
+    ("flame_line_edit_file_browse", "FlameLineEditFileBrowse"),
+    ("flame_list_widget", "FlameListWidget"),
+    ("flame_list_view", "FlameListView"),
+    ("flame_log_view", "FlameLogView"),
+    ("flame_push_button", "FlamePushButton"),
+    ("flame_push_button_menu", "FlamePushButtonMenu"),
+    ("flame_text_edit", "FlameTextEdit"),
+    ("flame_token_push_button", "FlameTokenPushButton"),
+    ("flame_tree_widget", "FlameTreeWidget"),
+    ("flame_tree_view", "FlameTreeView"),
+)
+
+
+def enable(max_events: Optional[int] = 100000) -> None:
+    """
+    Start counting and timing. Installs the hooks on first use.
+
+    max_events: (optional) most recent events kept for dump_trace, 0 keeps none. default is 100000 [int]
+    """
+
+    global _enabled, _events
+
+    if not isinstance(max_events, int) or max_events < 0:
+        raise TypeError("flamewidgets.instrumentation: max_events must be a positive integer.")
+
+    with _lock:
+        if _events.maxlen != max_events:
+            _events = deque(_events, maxlen=max_events)
+    if not _installed:
+        _install()
+    _enabled = True
+    _install_event_timer()
+
+
+def disable() -> None:
+    """
+    Stop counting and timing. Collected stats are kept until reset().
+    """
+
+    global _enabled, _event_timer
+
+    _enabled = False
+    if _event_timer is not None:
+        from PySide6 import QtWidgets
+
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(_event_timer)
+        _event_timer.deleteLater()
+        _event_timer = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """
+    Drop all collected stats and trace events.
+    """
+
+    global _origin
+
+    with _lock:
+        _stats.clear()
+        _events.clear()
+        _origin = time.perf_counter()
+
+
+def record(name: str, category: str, start: float, end: float) -> None:
+    """
+    Add one timed event. start and end are time.perf_counter() values.
+    """
+
+    duration = end - start
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            _stats[name] = [category, 1, duration, duration]
+        else:
+            stat[1] += 1
+            stat[2] += duration
+            if duration > stat[3]:
+                stat[3] = duration
+        if _events.maxlen:
+            _events.append((name, category, start, duration, threading.get_ident()))
+
+
+def snapshot() -> Dict[str, Dict[str, Union[str, int, float]]]:
+    """
+    Return the stats collected so far:
+
+        {'FlamePushButtonMenu.paintEvent': {'category': 'paint', 'count': 120, 'total_ms': 9.8, 'mean_ms': 0.08, 'max_ms': 0.4}, ...}
+    """
+
+    with _lock:
+        return {
+            name: {
+                "category": category,
+                "count": count,
+                "total_ms": total * 1000.0,
+                "mean_ms": total * 1000.0 / count,
+                "max_ms": maximum * 1000.0,
+            }
+            for name, (category, count, total, maximum) in _stats.items()
+        }
+
+
+def trace() -> Dict[str, list]:
+    """
+    Return the recorded events in Chrome trace event format.
+    """
+
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+        origin = _origin
+    return {
+        "traceEvents": [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": thread,
+            }
+            for name, category, start, duration, thread in events
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def dump_trace(path: str) -> None:
+    """
+    Write the recorded events as a Chrome trace JSON file.
+    """
+
+    import json
+
+    with open(path, "w") as trace_file:
+        json.dump(trace(), trace_file)
+
+
+def wrap(function: Optional[Callable], name: str, category: Optional[str] = "callback") -> Optional[Callable]:
+    """
+    Return function timed under name while instrumentation is enabled, or function
+    itself when it is disabled.
+    """
+
+    if not _enabled or function is None:
+        return function
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record(name, category, start, time.perf_counter())
+    return timed
+
+
+def connect(signal, slot: Optional[Callable], name: str) -> None:
+    """
+    Connect slot to signal, timed under name while instrumentation is enabled.
+
+    The slot is connected as is, so Qt passes the same arguments it would without
+    instrumentation. The time is taken by two slots connected before and after it.
+    """
+
+    if not _enabled or slot is None:
+        signal.connect(slot)
+        return
+
+    starts = []
+
+    def start(*args):
+        if _enabled:
+            starts.append(time.perf_counter())
+    signal.connect(start)
+    signal.connect(slot)
+
+    def end(*args):
+        if starts:
+            record(name, "callback", starts.pop(), time.perf_counter())
+    signal.connect(end)
+
+
+def _timed(original, name, category):
+    @functools.wraps(original)
+    def timed(*args, **kwargs):
+        if not _enabled:
+            return original(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            record(name, category, start, time.perf_counter())
+    return timed
+
+
+def _timed_init(original, name):
+    # Widgets need a QApplication, the first one built while enabled installs the event filter
+    @functools.wraps(original)
+    def timed(*args, **kwargs):
+        if not _enabled:
+            return original(*args, **kwargs)
+        _install_event_timer()
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            record(name, "construct", start, time.perf_counter())
+    return timed
+
+
+def _class_name(watched):
+    for cls in type(watched).__mro__:
+        name = _class_names.get(cls)
+        if name is not None:
+            return name
+    return None
+
+
+def _install_event_timer():
+    global _event_timer
+
+    if _event_timer is not None:
+        return
+
+    from PySide6 import QtWidgets
+    from PySide6 import QtCore
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        return
+
+    polish_names = {QtCore.QEvent.Polish: ".polish", QtCore.QEvent.StyleChange: ".styleChange"}
+
+    class EventTimer(QtCore.QObject):
+        # Sees every event of the application while enabled, only Flame widgets are timed
+
+        def eventFilter(self, watched, event):
+            kind = event.type()
+            if kind == QtCore.QEvent.Paint:
+                name = _class_name(watched)
+                if name is not None:
+                    handle = watched.event
+                else:
+                    # Scroll areas paint in their viewport, which forwards to viewportEvent through
+                    # its own event filter. Handling the event here skips that filter, call it directly
+                    parent = watched.parent()
+                    if not isinstance(parent, QtWidgets.QAbstractScrollArea) or parent.viewport() is not watched:
+                        return False
+                    name = _class_name(parent)
+                    if name is None:
+                        return False
+                    handle = parent.viewportEvent
+
+                start = time.perf_counter()
+                handle(event)
+                record(name + ".paintEvent", "paint", start, time.perf_counter())
+                return True
+
+            suffix = polish_names.get(kind)
+            if suffix is not None:
+                name = _class_name(watched)
+                if name is not None:
+                    # Counted only, the stylesheet is applied by the style before the event is sent
+                    now = time.perf_counter()
+                    record(name + suffix, "polish", now, now)
+            return False
+
+    _event_timer = EventTimer(app)
+    app.installEventFilter(_event_timer)
+
+
+def _install():
+    # Only Python methods of the Flame classes are wrapped, and they stay wrapped. Qt
+    # methods such as paintEvent and setStyleSheet are left alone, overriding them from
+    # Python would route every call through the interpreter for the rest of the process
+
+    global _installed
+
+    from importlib import import_module
+    from . import theme
+
+    for module_name, class_name in _WIDGET_CLASSES:
+        cls = getattr(import_module("." + module_name, __package__), class_name)
+        _class_names[cls] = class_name
+        cls.__init__ = _timed_init(cls.__init__, class_name)
+
+        if class_name == "FlamePushButtonMenu":
+            cls.create_menu = _timed(cls.create_menu, class_name + ".create_menu", "menu")
+            cls.update_menu = _timed(cls.update_menu, class_name + ".update_menu", "menu")
+
+    theme.apply_theme = _timed(theme.apply_theme, "theme.apply_theme", "polish")
+    theme.repolish = _timed(theme.repolish, "theme.repolish", "polish")
+
+    _installed = True
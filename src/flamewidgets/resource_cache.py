@@ -0,0 +1,163 @@
+"""
+Flame Resource Cache
+
+Process-wide registry for the assets packaged under flamewidgets/resources.
+Every asset is read and decoded once per process and handed out as a shared
+QPixmap or QIcon. Assets are read as bytes through importlib.resources, so the
+cache works when the package is installed as a zip or wheel.
+
+    arrow = pixmap("dropdown_arrow.png")
+    current = icon("dropdown_current.png")
+    spacer = empty_icon(arrow.size())
+"""
+
+from typing import Union, List, Dict, Optional, Callable, Tuple
+from importlib.resources import files
+from PySide6 import QtCore
+from PySide6 import QtGui
+
+
+_bytes_cache: Dict[str, bytes] = {}
+_pixmap_cache: Dict[Tuple[str, float], QtGui.QPixmap] = {}
+_icon_cache: Dict[Tuple[str, float], QtGui.QIcon] = {}
+_empty_cache: Dict[Tuple[int, int, float], QtGui.QPixmap] = {}
+
+
+def _resource(name: str):
+    # Resolved from the flamewidgets package itself: resources/ has no __init__.py and
+    # zipimport cannot import it as a namespace package.
+    return files("flamewidgets").joinpath("resources").joinpath(name)
+
+
+def _default_device_pixel_ratio() -> float:
+    app = QtGui.QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def read_resource(name: str) -> bytes:
+    """
+    Return the raw bytes of a packaged resource without caching them, for data that is
+    only needed once, e.g. fonts registered with QFontDatabase.
+
+    name: file name inside flamewidgets/resources [str]
+    """
+
+    return _resource(name).read_bytes()
+
+
+def resource_bytes(name: str) -> bytes:
+    """
+    Return the raw bytes of a packaged resource. Read once per process.
+
+    name: file name inside flamewidgets/resources [str]
+    """
+
+    data = _bytes_cache.get(name)
+    if data is None:
+        data = read_resource(name)
+        _bytes_cache[name] = data
+    return data
+
+
+def _resource_exists(name: str) -> bool:
+    return name in _bytes_cache or _resource(name).is_file()
+
+
+def pixmap(name: str, device_pixel_ratio: Optional[float] = None) -> QtGui.QPixmap:
+    """
+    Return the shared QPixmap for a packaged image.
+
+    name: file name inside flamewidgets/resources [str]
+    device_pixel_ratio: (optional) defaults to the application's device pixel ratio [float]
+
+    For ratios above 1 a high resolution variant (name@2x.png) is used when packaged.
+    Returns a null QPixmap if the image cannot be decoded.
+    """
+
+    ratio = device_pixel_ratio or _default_device_pixel_ratio()
+    key = (name, ratio)
+    cached = _pixmap_cache.get(key)
+    if cached is not None:
+        return cached
+
+    source = name
+    if ratio > 1:
+        stem, dot, suffix = name.rpartition(".")
+        high_res = stem + "@2x" + dot + suffix
+        if _resource_exists(high_res):
+            source = high_res
+
+    result = QtGui.QPixmap()
+    try:
+        result.loadFromData(resource_bytes(source))
+    except FileNotFoundError:
+        print("WARNING: Could not load resource: " + name)
+    if source != name:
+        result.setDevicePixelRatio(2.0)
+
+    _pixmap_cache[key] = result
+    return result
+
+
+def icon(name: str, device_pixel_ratio: Optional[float] = None) -> QtGui.QIcon:
+    """
+    Return the shared QIcon for a packaged image.
+
+    name: file name inside flamewidgets/resources [str]
+    device_pixel_ratio: (optional) defaults to the application's device pixel ratio [float]
+    """
+
+    ratio = device_pixel_ratio or _default_device_pixel_ratio()
+    key = (name, ratio)
+    cached = _icon_cache.get(key)
+    if cached is None:
+        cached = QtGui.QIcon(pixmap(name, ratio))
+        _icon_cache[key] = cached
+    return cached
+
+
+def empty_pixmap(size: QtCore.QSize, device_pixel_ratio: Optional[float] = None) -> QtGui.QPixmap:
+    """
+    Return a shared transparent QPixmap, used to reserve icon space in menus.
+
+    size: size of the pixmap in device independent pixels [QSize]
+    device_pixel_ratio: (optional) defaults to the application's device pixel ratio [float]
+    """
+
+    ratio = device_pixel_ratio or _default_device_pixel_ratio()
+    key = (size.width(), size.height(), ratio)
+    cached = _empty_cache.get(key)
+    if cached is None:
+        cached = QtGui.QPixmap(size * ratio)
+        cached.setDevicePixelRatio(ratio)
+        cached.fill(QtCore.Qt.transparent)
+        _empty_cache[key] = cached
+    return cached
+
+
+def empty_icon(size: QtCore.QSize, device_pixel_ratio: Optional[float] = None) -> QtGui.QIcon:
+    """
+    Return a shared transparent QIcon of the given size.
+
+    size: size of the icon in device independent pixels [QSize]
+    device_pixel_ratio: (optional) defaults to the application's device pixel ratio [float]
+    """
+
+    ratio = device_pixel_ratio or _default_device_pixel_ratio()
+    key = ("<empty %dx%d>" % (size.width(), size.height()), ratio)
+    cached = _icon_cache.get(key)
+    if cached is None:
+        cached = QtGui.QIcon(empty_pixmap(size, ratio))
+        _icon_cache[key] = cached
+    return cached
+
+
+def clear() -> None:
+    """
+    Drop every cached resource, e.g. after the screen's device pixel ratio changed.
+    """
+
+    _bytes_cache.clear()
+    _pixmap_cache.clear()
+    _icon_cache.clear()
+    _empty_cache.clear()
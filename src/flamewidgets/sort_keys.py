@@ -0,0 +1,73 @@
+"""
+Flame Sort Keys
+
+Sort key functions for column text. Each key is computed once per value and
+compares with plain < afterwards, so sorting does no string parsing.
+
+Values that cannot be parsed for numeric, timecode and date columns, and non-finite
+floats like nan or inf, sort after all valid values, ordered by their text.
+
+    natural: sh010_v9 < sh010_v12
+    integer: 9 < 12
+    float: 2.5 < 10
+    timecode: 00:59:59:23 < 01:00:00:00 (':' or ';' separated)
+    date: ISO 8601, e.g. 2024-03-01 or 2024-03-01 12:30:00
+"""
+
+import re
+import math
+from datetime import datetime
+from typing import Union, List, Dict, Optional, Callable, Tuple, Any
+
+
+_DIGITS = re.compile(r"(\d+)")
+
+
+def natural_key(text: str) -> Tuple:
+    # Pairs of (text, number) so text and numbers are never compared with each other
+    parts = _DIGITS.split(text.lower())
+    return tuple(
+        (parts[index], int(parts[index + 1]) if index + 1 < len(parts) else -1)
+        for index in range(0, len(parts), 2)
+    )
+
+
+def integer_key(text: str) -> Tuple:
+    try:
+        return (0, int(text.strip()))
+    except ValueError:
+        return (1, text)
+
+
+def float_key(text: str) -> Tuple:
+    try:
+        value = float(text.strip())
+    except ValueError:
+        return (1, text)
+    # nan parses but compares false with everything, which breaks any ordering
+    if not math.isfinite(value):
+        return (1, text)
+    return (0, value)
+
+
+def timecode_key(text: str) -> Tuple:
+    try:
+        return (0, tuple(int(part) for part in text.strip().replace(";", ":").split(":")))
+    except ValueError:
+        return (1, text)
+
+
+def date_key(text: str) -> Tuple:
+    try:
+        return (0, datetime.fromisoformat(text.strip()).timestamp())
+    except ValueError:
+        return (1, text)
+
+
+SORT_KEY_FUNCTIONS: Dict[str, Callable[[str], Any]] = {
+    "natural": natural_key,
+    "integer": integer_key,
+    "float": float_key,
+    "timecode": timecode_key,
+    "date": date_key,
+}
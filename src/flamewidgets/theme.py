@@ -0,0 +1,333 @@
+"""
+Flame Theme
+
+The whole Flame stylesheet is built once and applied at window or application scope,
+so Qt parses it a single time instead of once per widget. Widgets select their variant
+through class and dynamic-property selectors, e.g. FlameButton[button_color="blue"].
+
+By default a Flame widget applies the theme to its top-level window when it is first
+polished, i.e. shown, so host widgets outside that window are never restyled. Windows
+that already have the theme, or whose parent has it, are left alone. To theme the whole
+application instead, apply it explicitly before building the widgets:
+
+    apply_theme(app)
+
+To stop widgets from touching any stylesheet at all:
+
+    set_auto_apply(False)
+
+Runtime state changes (pressed, variant, read only) only set a dynamic property and
+repolish the one widget, the stylesheet itself is never rebuilt or parsed again:
+
+    set_state(button, "button_color", "red")
+"""
+
+import weakref
+from typing import Union, List, Dict, Optional, Callable
+from functools import lru_cache
+from PySide6 import QtWidgets
+from PySide6 import QtCore
+from . import fonts
+
+
+_SCROLLBAR_RULES = (
+    "{scope} QScrollBar {{color: {color}; background: {background}}}"
+    "{scope} QScrollBar::handle {{color: {color}; background: {handle}}}"
+    "{scope} QScrollBar::add-line:vertical {{border: none; background: none; width: 0px; height: 0px}}"
+    "{scope} QScrollBar::sub-line:vertical {{border: none; background: none; width: 0px; height: 0px}}"
+    "{scope} QScrollBar::add-line:horizontal {{border: none; background: none; width: 0px; height: 0px}}"
+    "{scope} QScrollBar::sub-line:horizontal {{border: none; background: none; width: 0px; height: 0px}}"
+)
+
+_TOOLTIP_RULE = "{scope} QToolTip {{color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: 10px solid rgb(71, 71, 71)}}"
+
+# QApplication and widgets the theme was applied to, entries go away with the target
+_themed = weakref.WeakSet()
+_auto_apply = True
+
+
+def _button_stylesheet() -> str:
+    return (
+        'FlameButton {color: rgb(154, 154, 154); background-color: rgb(58, 58, 58); border: none; font: 14px "Artifakt Element"}'
+        "FlameButton:hover {border: 1px solid rgb(90, 90, 90)}"
+        "FlameButton:pressed {color: rgb(159, 159, 159); background-color: rgb(66, 66, 66); border: 1px solid rgb(90, 90, 90)}"
+        "FlameButton:disabled {color: rgb(116, 116, 116); background-color: rgb(58, 58, 58); border: none}"
+        "FlameButton::menu-indicator {subcontrol-origin: padding; subcontrol-position: center right}"
+        'FlameButton[button_color="blue"] {color: rgb(190, 190, 190); background-color: rgb(58, 108, 173)}'
+        'FlameButton[button_color="blue"]:hover {border: 2px solid rgb(90, 90, 90)}'
+        'FlameButton[button_color="red"] {color: rgb(190, 190, 190); background-color: rgb(200, 29, 29)}'
+        'FlameButton[button_color="blue"]:pressed, FlameButton[button_color="red"]:pressed {color: rgb(159, 159, 159); border: 1px solid rgb(90, 90, 90)}'
+        'FlameButton[button_color="blue"]:disabled, FlameButton[button_color="red"]:disabled {color: rgb(116, 116, 116); background-color: rgb(58, 58, 58); border: none}'
+        + _TOOLTIP_RULE.format(scope="FlameButton")
+    )
+
+
+def _label_stylesheet() -> str:
+    return (
+        'FlameLabel {color: rgb(154, 154, 154); font: 14px "Artifakt Element"}'
+        "FlameLabel:disabled {color: rgb(106, 106, 106)}"
+        'FlameLabel[label_type="underline"] {border-bottom: 1px inset rgb(40, 40, 40)}'
+        'FlameLabel[label_type="background"] {background-color: rgb(30, 30, 30); padding-left: 5px}'
+        'FlameLabel[label_type="border"] {border: 1px solid #404040}'
+    )
+
+
+def _line_edit_stylesheet() -> str:
+    return (
+        'FlameLineEdit {color: rgb(154, 154, 154); background-color: rgb(55, 65, 75); selection-color: rgb(38, 38, 38); selection-background-color: rgb(184, 177, 167); border: 1px solid rgb(55, 65, 75); padding-left: 5px; font: 14px "Artifakt Element"}'
+        "FlameLineEdit:focus {background-color: rgb(73, 86, 99)}"
+        "FlameLineEdit:hover {border: 1px solid rgb(90, 90, 90)}"
+        "FlameLineEdit:disabled {color: rgb(106, 106, 106); background-color: rgb(55, 55, 55); border: 1px solid rgb(55, 55, 55)}"
+        "FlameLineEdit QToolTip {color: rgb(170, 170, 170); background-color: rgb(71, 71, 71); border: none}"
+        'FlameLineEditFileBrowse {color: #898989; background-color: #373e47; font: 14px "Artifakt Element"}'
+        "FlameLineEditFileBrowse:disabled {color: #6a6a6a; background-color: #373737}"
+        'FlameLineEditFileBrowse[pressed="true"] {color: #bbbbbb; background-color: #474e58}'
+        'FlameLineEditFileBrowse[path_state="missing"] {color: #c65b5b}'
+        'FlameLineEditFileBrowse[path_state="sequence"] {color: #8fb37a}'
+    )
+
+
+def _list_stylesheet(scope: str) -> str:
+    return (
+        '{scope} {{color: rgb(154, 154, 154); background-color: rgb(30, 30, 30); alternate-background-color: rgb(36, 36, 36); outline: 3px rgb(0, 0, 0); font: 14px "Artifakt Element"}}'
+        "{scope}::item:selected {{color: rgb(217, 217, 217); background-color: rgb(102, 102, 102); border: 1px solid rgb(102, 102, 102)}}"
+    ).format(scope=scope) + (
+        _SCROLLBAR_RULES.format(scope=scope, color="rgb(17, 17, 17)", background="rgb(61, 61, 61)", handle="rgb(31, 31, 31)")
+        + _TOOLTIP_RULE.format(scope=scope)
+    )
+
+
+def _list_widget_stylesheet() -> str:
+    return _list_stylesheet("FlameListWidget")
+
+
+def _list_view_stylesheet() -> str:
+    return _list_stylesheet("FlameListView")
+
+
+def _push_button_stylesheet() -> str:
+    return (
+        "FlamePushButton {color: rgb(154, 154, 154); background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(44, 54, 68)); text-align: left; "
+        "border-top: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(44, 54, 68)); "
+        "border-bottom: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(44, 54, 68)); "
+        "border-left: 1px solid rgb(58, 58, 58); "
+        "border-right: 1px solid rgb(44, 54, 68); "
+        'padding-left: 5px; font: 14px "Artifakt Element"}'
+        "FlamePushButton:checked {color: rgb(217, 217, 217); background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(71, 71, 71), stop: .94 rgb(58, 108, 173)); text-align: left; "
+        "border-top: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(71, 71, 71), stop: .94 rgb(50, 101, 173)); "
+        "border-bottom: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(71, 71, 71), stop: .94 rgb(50, 101, 173)); "
+        "border-left: 1px solid rgb(71, 71, 71); "
+        "border-right: 1px solid rgb(50, 101, 173); "
+        "padding-left: 5px; font: italic}"
+        "FlamePushButton:hover {border: 1px solid rgb(90, 90, 90)}"
+        "FlamePushButton:disabled {color: #6a6a6a; background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0, stop: .93 rgb(58, 58, 58), stop: .94 rgb(50, 50, 50)); font: light; border: none}"
+        + _TOOLTIP_RULE.format(scope="FlamePushButton")
+    )
+
+
+def _push_button_menu_stylesheet() -> str:
+    return (
+        'FlamePushButtonMenu {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; text-align: center; padding-left: 10px; font: 14px "Artifakt Element"}'
+        'FlamePushButtonMenu[text_align="left"] {text-align: left}'
+        'FlamePushButtonMenu[text_align="right"] {text-align: right}'
+        "FlamePushButtonMenu:disabled {color: rgb(116, 116, 116); background-color: rgb(45, 55, 68); border: none}"
+        "FlamePushButtonMenu:hover {border: 1px solid rgb(90, 90, 90)}"
+        "FlamePushButtonMenu::menu-indicator {image: none}"
+        + _TOOLTIP_RULE.format(scope="FlamePushButtonMenu")
+        + 'FlamePushButtonMenu QMenu {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; font: 14px "Artifakt Element"}'
+        "FlamePushButtonMenu QMenu::item {padding: 5px 20px 5px 20px}"
+        "FlamePushButtonMenu QMenu::item:selected {color: rgb(217, 217, 217); background-color: rgb(58, 69, 81)}"
+        "FlamePushButtonMenu QMenu::icon {padding-left: 10px; margin-right: 10px}"
+        'FlamePushButtonMenu QLineEdit {color: rgb(154, 154, 154); background-color: rgb(55, 65, 75); selection-color: rgb(38, 38, 38); selection-background-color: rgb(184, 177, 167); border: 1px solid rgb(55, 65, 75); padding-left: 5px; font: 14px "Artifakt Element"}'
+        'FlamePushButtonMenu QListView {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; outline: none; font: 14px "Artifakt Element"}'
+        "FlamePushButtonMenu QListView::item {padding: 5px 20px 5px 10px}"
+        "FlamePushButtonMenu QListView::item:hover, FlamePushButtonMenu QListView::item:selected {color: rgb(217, 217, 217); background-color: rgb(58, 69, 81)}"
+        + _SCROLLBAR_RULES.format(scope="FlamePushButtonMenu QListView", color="rgb(17, 17, 17)", background="rgb(49, 49, 49)", handle="rgb(17, 17, 17)")
+    )
+
+
+def _text_stylesheet(scope: str) -> str:
+    return (
+        '{scope} {{color: rgb(154, 154, 154); background-color: #37414b; selection-color: #262626; selection-background-color: #b8b1a7; border: none; padding-left: 5px; font: 14px "Artifakt Element"}}'
+    ).format(scope=scope) + _SCROLLBAR_RULES.format(scope=scope, color="rgb(17, 17, 17)", background="rgb(49, 49, 49)", handle="rgb(17, 17, 17)")
+
+
+def _text_edit_stylesheet() -> str:
+    return _text_stylesheet("FlameTextEdit") + 'FlameTextEdit[read_only="false"]:focus {background-color: #495663}'
+
+
+def _log_view_stylesheet() -> str:
+    return _text_stylesheet("FlameLogView")
+
+
+def _token_push_button_stylesheet() -> str:
+    return (
+        'FlameTokenPushButton {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; font: 14px "Artifakt Element"}'
+        "FlameTokenPushButton:hover {border: 1px solid rgb(90, 90, 90)}"
+        "FlameTokenPushButton:disabled {color: rgb(106, 106, 106); background-color: rgb(45, 55, 68); border: none}"
+        "FlameTokenPushButton::menu-indicator {image: none}"
+        + _TOOLTIP_RULE.format(scope="FlameTokenPushButton")
+        + 'FlameTokenPushButton QMenu {color: rgb(154, 154, 154); background-color: rgb(45, 55, 68); border: none; font: 14px "Artifakt Element"}'
+        "FlameTokenPushButton QMenu::item:selected {color: rgb(217, 217, 217); background-color: rgb(58, 69, 81)}"
+        'FlameTokenPushButton QLineEdit {color: rgb(154, 154, 154); background-color: rgb(55, 65, 75); selection-color: rgb(38, 38, 38); selection-background-color: rgb(184, 177, 167); border: 1px solid rgb(55, 65, 75); padding-left: 5px; font: 14px "Artifakt Element"}'
+    )
+
+
+def _tree_stylesheet(scope: str) -> str:
+    return (
+        '{scope} {{color: rgb(154, 154, 154); background-color: rgb(30, 30, 30); alternate-background-color: rgb(36, 36, 36); border: none; font: 14px "Artifakt Element"}}'
+        '{scope} QHeaderView::section {{color: rgb(154, 154, 154); background-color: rgb(57, 57, 57); border: none; padding-left: 10px; font: 14px "Artifakt Element"}}'
+        "{scope}::item:selected {{color: rgb(217, 217, 217); background-color: rgb(71, 71, 71); selection-background-color: rgb(153, 153, 153); border: 1px solid rgb(17, 17, 17)}}"
+        "{scope}::item:selected:active {{color: rgb(153, 153, 153); border: none}}"
+        "{scope}:disabled {{color: rgb(101, 101, 101); background-color: rgb(34, 34, 34)}}"
+        '{scope} QMenu {{color: rgb(154, 154, 154); background-color: rgb(36, 48, 61); font: 14px "Artifakt Element"}}'
+        "{scope} QMenu::item:selected {{color: rgb(217, 217, 217); background-color: rgb(58, 69, 81)}}"
+    ).format(scope=scope) + _SCROLLBAR_RULES.format(scope=scope, color="rgb(17, 17, 17)", background="rgb(49, 49, 49)", handle="rgb(17, 17, 17)")
+
+
+def _tree_widget_stylesheet() -> str:
+    return _tree_stylesheet("FlameTreeWidget")
+
+
+def _tree_view_stylesheet() -> str:
+    return _tree_stylesheet("FlameTreeView")
+
+
+# Stylesheet fragment for each widget class, joined once by stylesheet()
+
+_WIDGET_STYLESHEETS = {
+    "FlameButton": _button_stylesheet,
+    "FlameLabel": _label_stylesheet,
+    "FlameLineEdit": _line_edit_stylesheet,
+    "FlameListWidget": _list_widget_stylesheet,
+    "FlameListView": _list_view_stylesheet,
+    "FlamePushButton": _push_button_stylesheet,
+    "FlamePushButtonMenu": _push_button_menu_stylesheet,
+    "FlameTextEdit": _text_edit_stylesheet,
+    "FlameLogView": _log_view_stylesheet,
+    "FlameTokenPushButton": _token_push_button_stylesheet,
+    "FlameTreeWidget": _tree_widget_stylesheet,
+    "FlameTreeView": _tree_view_stylesheet,
+}
+
+
+@lru_cache(maxsize=None)
+def stylesheet() -> str:
+    """
+    Return the complete Flame stylesheet. Built once per process.
+    """
+
+    return "".join(build() for build in _WIDGET_STYLESHEETS.values())
+
+
+def _with_selector(sheet: str) -> str:
+    # Qt reads a sheet made of bare declarations, e.g. "background-color: #222222", as
+    # "* {...}". Once rules are appended it no longer can, so wrap it the same way first
+
+    if sheet.strip() and "{" not in sheet:
+        return "* {%s}" % sheet
+    return sheet
+
+
+def apply_theme(target: Optional[Union[QtWidgets.QApplication, QtWidgets.QWidget]] = None) -> None:
+    """
+    Apply the Flame stylesheet to a QApplication or a top-level QWidget.
+
+    target: (optional) QApplication or QWidget. default is the running QApplication.
+
+    Any stylesheet already set on the target is kept. Applying twice is a no-op.
+    """
+
+    if target is None:
+        target = QtWidgets.QApplication.instance()
+        if target is None:
+            raise RuntimeError("flamewidgets.theme: a QApplication must exist before applying the theme.")
+    if not isinstance(target, (QtWidgets.QApplication, QtWidgets.QWidget)):
+        raise TypeError("flamewidgets.theme: target must be a QApplication or QWidget.")
+
+    sheet = stylesheet()
+    current = target.styleSheet()
+    if sheet not in current:
+        target.setStyleSheet(_with_selector(current) + sheet)
+    _themed.add(target)
+
+
+def is_themed(widget: QtWidgets.QWidget) -> bool:
+    """
+    True if the theme was applied to the QApplication, the widget or one of its parents.
+    """
+
+    if QtWidgets.QApplication.instance() in _themed:
+        return True
+    while widget is not None:
+        if widget in _themed:
+            return True
+        widget = widget.parentWidget()
+    return False
+
+
+def set_auto_apply(enabled: bool) -> None:
+    """
+    Enable or disable applying the theme to the top-level window of Flame widgets when they are shown.
+    """
+
+    global _auto_apply
+
+    if not isinstance(enabled, bool):
+        raise TypeError("flamewidgets.theme: enabled must be a boolean.")
+    _auto_apply = enabled
+
+
+class _WindowThemer(QtCore.QObject):
+    # Widgets are usually parented by a layout after construction, their top-level
+    # window is only known once they are polished before being shown for the first time
+
+    def eventFilter(self, widget, event):
+        if event.type() == QtCore.QEvent.Polish:
+            widget.removeEventFilter(self)
+            if _auto_apply and not is_themed(widget):
+                apply_theme(widget.window())
+        return False
+
+
+_window_themer: Optional[_WindowThemer] = None
+
+
+def ensure_theme(widget: Optional[QtWidgets.QWidget] = None) -> None:
+    """
+    Called by every Flame widget on construction. Registers the bundled fonts and
+    applies the theme to the widget's top-level window when the widget is first
+    polished, unless the window already has it or auto apply is disabled.
+    """
+
+    global _window_themer
+
+    fonts.ensure_fonts()
+
+    if widget is None or not _auto_apply or is_themed(widget):
+        return
+    if _window_themer is None:
+        _window_themer = _WindowThemer()
+    widget.installEventFilter(_window_themer)
+
+
+def repolish(widget: QtWidgets.QWidget) -> None:
+    """
+    Re-evaluate the stylesheet rules of a single widget after one of its dynamic properties changed.
+    """
+
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+
+
+def set_state(widget: QtWidgets.QWidget, name: str, value) -> None:
+    """
+    Set a dynamic property used by the stylesheet and repolish the widget, only if the value changed.
+    """
+
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    repolish(widget)
@@ -0,0 +1,112 @@
+"""
+Flame Token Templates
+
+Naming templates built with FlameTokenPushButton, e.g. <shot>_<version>_<date>, compiled
+once into a reusable formatter. A template is parsed a single time per process, resolving
+it only joins strings.
+
+    template = compile_template('<shot>_<version>_<date>')
+    template.resolve({'shot': 'sh010', 'version': 'v003', 'date': '2024-03-01'})
+    # 'sh010_v003_2024-03-01'
+
+    names = template.resolve_many(clip_contexts)
+
+Context keys are the token names without the angle brackets. Tokens missing from a context
+are kept as written, unless a default is given.
+"""
+
+import re
+from functools import lru_cache
+from operator import itemgetter
+from typing import Union, List, Dict, Optional, Callable, Iterable, Mapping, Tuple
+
+
+_TOKEN = re.compile(r"<([^<>]+)>")
+
+
+class TokenTemplate(object):
+    """
+    Compiled naming template. Use compile_template() to get a cached instance.
+
+    TokenTemplate(template)
+
+    template: text with tokens in angle brackets [str]
+    """
+
+    __slots__ = ("template", "tokens", "_format", "_names")
+
+    def __init__(self, template: str):
+        if not isinstance(template, str):
+            raise TypeError("TokenTemplate: template must be a string.")
+
+        self.template = template
+
+        # Literal text goes into a str.format pattern, tokens become positional fields
+        parts = _TOKEN.split(template)
+        literals = parts[0::2]
+        self._names: Tuple[str, ...] = tuple(parts[1::2])
+        self._format = "{}".join(literal.replace("{", "{{").replace("}", "}}") for literal in literals)
+        self.tokens: Tuple[str, ...] = tuple(dict.fromkeys(self._names))
+
+    def __repr__(self) -> str:
+        return "TokenTemplate({!r})".format(self.template)
+
+    def unknown_tokens(self, token_dict: Mapping[str, str]) -> List[str]:
+        """
+        Return the tokens of the template that are not values of a FlameTokenPushButton token_dict.
+        """
+
+        known = {token[1:-1] if token.startswith("<") and token.endswith(">") else token for token in token_dict.values()}
+        return [name for name in self.tokens if name not in known]
+
+    def resolve(self, context: Mapping[str, object], default: Optional[str] = None) -> str:
+        """
+        Return the template with every token replaced by its value in context.
+
+        context: token name to value [dict]
+        default: (optional) used for tokens missing from context. default keeps the token as written [str]
+        """
+
+        values = []
+        for name in self._names:
+            value = context.get(name)
+            if value is None:
+                value = "<{}>".format(name) if default is None else default
+            values.append(value)
+        return self._format.format(*values)
+
+    def resolve_many(self, contexts: Iterable[Mapping[str, object]], default: Optional[str] = None) -> List[str]:
+        """
+        Resolve the template for every context, e.g. one per clip.
+        """
+
+        names = self._names
+        pattern = self._format.format
+        if not names:
+            return [self.template for context in contexts]
+
+        getter = itemgetter(*names)
+        single = len(names) == 1
+        results = []
+        for context in contexts:
+            try:
+                values = getter(context)
+            except KeyError:
+                results.append(self.resolve(context, default))
+                continue
+            if single:
+                values = (values,)
+            if None in values:
+                results.append(self.resolve(context, default))
+            else:
+                results.append(pattern(*values))
+        return results
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> TokenTemplate:
+    """
+    Return the compiled TokenTemplate for template, parsed once per process.
+    """
+
+    return TokenTemplate(template)